@@ -0,0 +1,88 @@
+"""Micro-benchmark for slash command option conversion.
+
+Compares the compiled :class:`~discord.ext.app_commands.OptionPlan` against
+walking the raw options and branching on their type for every invocation.
+
+Run from the repository root::
+
+    python benchmarks/app_commands_options.py
+"""
+
+import timeit
+from types import SimpleNamespace
+
+from discord.application_commands import Option
+from discord.enums import ApplicationCommandOptionType
+from discord.ext.app_commands.converter import OptionPlan
+from discord.member import Member
+from discord.role import Role
+from discord.user import User
+
+OPTIONS = [
+    Option('text', 'text', ApplicationCommandOptionType.string),
+    Option('count', 'count', ApplicationCommandOptionType.integer),
+    Option('flag', 'flag', ApplicationCommandOptionType.boolean),
+    Option('ratio', 'ratio', ApplicationCommandOptionType.number),
+    Option('user', 'user', ApplicationCommandOptionType.user),
+    Option('role', 'role', ApplicationCommandOptionType.role),
+]
+
+DATA = {
+    'options': [
+        {'name': 'text', 'type': 3, 'value': 'hello'},
+        {'name': 'count', 'type': 4, 'value': 10},
+        {'name': 'flag', 'type': 5, 'value': True},
+        {'name': 'ratio', 'type': 10, 'value': 0.5},
+        {'name': 'user', 'type': 6, 'value': '80088516616269824'},
+        {'name': 'role', 'type': 8, 'value': '80088516616269825'},
+    ],
+    'resolved': {
+        'users': {
+            '80088516616269824': {'id': '80088516616269824', 'username': 'Danny', 'discriminator': '0007', 'avatar': None},
+        },
+        'roles': {
+            '80088516616269825': {'id': '80088516616269825', 'name': 'Helper', 'permissions': '0', 'position': 1},
+        },
+    },
+}
+
+
+def unplanned(ctx, options):
+    # the previous approach: filter, then branch on each raw type per call
+    state = ctx.bot._connection
+    options = [o for o in options if o.get('type') not in (1, 2)]
+    resolved = ctx._data.get('resolved', {})
+    args = {}
+    for option in options:
+        v = option['value']
+        if option['type'] == 6:
+            v = int(option['value'])
+            if str(option['value']) in resolved.get('members', []):
+                v = dict(resolved['members'][str(option['value'])])
+                if str(option['value']) in resolved.get('users', []):
+                    v['user'] = resolved['users'][str(option['value'])]
+                v = Member(data=v, guild=ctx.guild, state=state)
+            elif str(option['value']) in resolved.get('users', []):
+                v = User(data=resolved['users'][str(option['value'])], state=state)
+        elif option['type'] == 8:
+            v = int(option['value'])
+            if str(option['value']) in resolved.get('roles', []):
+                v = Role(data=resolved['roles'][str(option['value'])], state=state, guild=ctx.guild)
+        args[option['name']] = v
+    return args
+
+
+def main():
+    guild = SimpleNamespace(id=1)
+    ctx = SimpleNamespace(_data=DATA, guild=guild, guild_id=1, bot=SimpleNamespace(_connection=SimpleNamespace()))
+    ctx.bot._connection.store_user = lambda data: None
+    plan = OptionPlan(OPTIONS)
+    number = 100_000
+
+    for label, func in (('unplanned', lambda: unplanned(ctx, DATA['options'])), ('planned', lambda: plan.convert(ctx, DATA['options']))):
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{label:>10}: {elapsed / number * 1e6:.2f} us per invocation')
+
+
+if __name__ == '__main__':
+    main()
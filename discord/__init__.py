@@ -21,6 +21,9 @@ import logging
 from typing import NamedTuple, Literal
 
 from .client import *
+from .event_source import *
+from .stats import *
+from .bulk import *
 from .appinfo import *
 from .user import *
 from .emoji import *
@@ -57,6 +60,7 @@ from .team import *
 from .sticker import *
 from .stage_instance import *
 from .interactions import *
+from .interaction_server import *
 from .components import *
 from .threads import *
 from .application_commands import *
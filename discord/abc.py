@@ -42,7 +42,7 @@ from typing import (
     runtime_checkable,
 )
 
-from .iterators import HistoryIterator
+from .iterators import HistoryIterator, HistoryScanIterator
 from .context_managers import Typing
 from .enums import ChannelType
 from .errors import InvalidArgument, ClientException
@@ -1536,6 +1536,7 @@ class Messageable:
         after: Optional[SnowflakeTime] = None,
         around: Optional[SnowflakeTime] = None,
         oldest_first: Optional[bool] = None,
+        prefetch: int = 0,
     ) -> HistoryIterator:
         """Returns an :class:`~discord.AsyncIterator` that enables receiving the destination's message history.
 
@@ -1581,9 +1582,83 @@ class Messageable:
         oldest_first: Optional[:class:`bool`]
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        prefetch: :class:`int`
+            The number of pages of 100 messages to fetch in the background while
+            the current page is being consumed. This speeds up iterating over large
+            histories at the cost of keeping up to ``prefetch`` extra pages in memory.
+            Defaults to ``0``.
+
+            .. versionadded:: 2.0
+
+        Raises
+        ------
+        ~discord.Forbidden
+            You do not have permissions to get channel message history.
+        ~discord.HTTPException
+            The request to get message history failed.
+
+        Yields
+        -------
+        :class:`~discord.Message`
+            The message with the message data parsed.
+        """
+        return HistoryIterator(
+            self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first, prefetch=prefetch
+        )
+
+    def history_scan(
+        self,
+        *,
+        before: Optional[SnowflakeTime] = None,
+        after: Optional[SnowflakeTime] = None,
+        partitions: int = 4,
+        ordered: bool = True,
+    ) -> HistoryScanIterator:
+        """Returns an :class:`~discord.AsyncIterator` that scans the destination's message history
+        by splitting it into time ranges that are paginated independently.
+
+        The ranges share the channel's rate limit bucket, so their requests are still sent one
+        at a time and the scan does not fetch faster than :meth:`history`. What it gains is that
+        pages are fetched in the background while the messages already received are being
+        processed, instead of only after the consumer asks for more.
+
+        With ``ordered`` set, a range that is ahead of the consumer stops fetching once it has
+        buffered 200 messages, so a slow consumer mostly overlaps with the next range only.
+
+        You must have :attr:`~discord.Permissions.read_message_history` permissions to use this.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for message in channel.history_scan(after=datetime.datetime(2020, 1, 1), partitions=8):
+                archive.write(message.content)
+
+        Parameters
+        -----------
+        before: Optional[Union[:class:`~discord.abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages before this date or message. Defaults to the current time.
+            If a datetime is provided, it is recommended to use a UTC aware datetime.
+            If the datetime is naive, it is assumed to be local time.
+        after: Optional[Union[:class:`~discord.abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages after this date or message. Defaults to the creation of the channel.
+            If a datetime is provided, it is recommended to use a UTC aware datetime.
+            If the datetime is naive, it is assumed to be local time.
+        partitions: :class:`int`
+            The number of time ranges to split the history into. Ranges are split evenly
+            by time, not by the number of messages in them.
+        ordered: :class:`bool`
+            Whether to return messages in oldest->newest order. If ``False``, messages are
+            returned as soon as they are received, which lets every range keep fetching
+            while the consumer is busy. Defaults to ``True``.
 
         Raises
         ------
+        ValueError
+            ``partitions`` is not greater than 0.
         ~discord.Forbidden
             You do not have permissions to get channel message history.
         ~discord.HTTPException
@@ -1594,7 +1669,7 @@ class Messageable:
         :class:`~discord.Message`
             The message with the message data parsed.
         """
-        return HistoryIterator(self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first)
+        return HistoryScanIterator(self, before=before, after=after, partitions=partitions, ordered=ordered)
 
 
 class Connectable(Protocol):
@@ -42,7 +42,7 @@ class Choice:
 
 
 class Option:
-    __slots__ = ('type', 'name', 'description', 'required', 'choices', 'options')
+    __slots__ = ('type', 'name', 'description', 'required', 'choices', 'options', 'autocomplete')
 
     if TYPE_CHECKING:
         type: int
@@ -51,8 +51,9 @@ class Option:
         required: bool
         choices: Optional[List[str]]
         options: list
+        autocomplete: bool
 
-    def __init__(self, name: str, description: str, type: ApplicationCommandOptionType, *, required: bool = False, choices: Optional[List[Choice]] = None, options: list = None):
+    def __init__(self, name: str, description: str, type: ApplicationCommandOptionType, *, required: bool = False, choices: Optional[List[Choice]] = None, options: list = None, autocomplete: bool = False):
         if options and type not in (ApplicationCommandOptionType.subcommand, ApplicationCommandOptionType.subcommand_group):
             raise ValueError('Options can only be used in options of type subcommand or subcommand group')
         self.name = name
@@ -61,6 +62,7 @@ class Option:
         self.required = required
         self.choices = choices
         self.options = options
+        self.autocomplete = autocomplete
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,8 +70,9 @@ class Option:
             'description': self.description,
             'type': self.type.value,
             'required': self.required,
-            'choices': self.choices,
-            'options': [o.to_dict() for o in (self.options or [])]
+            'choices': [{'name': c.name, 'value': c.value} for c in self.choices] if self.choices is not None else None,
+            'options': [o.to_dict() for o in (self.options or [])],
+            'autocomplete': self.autocomplete,
         }
 
     @classmethod
@@ -79,8 +82,9 @@ class Option:
         self.name = data.get('name')
         self.description = data.get('description')
         self.required = data.get('required', False)
-        self.choices = [Choice(d['name'], d['value']) for d in data.get('choices', [])]
-        self.options = [Option(d) for d in data.get('options', [])]
+        self.choices = [Choice(d['name'], d['value']) for d in data.get('choices') or []]
+        self.options = [Option.from_data(d) for d in data.get('options') or []]
+        self.autocomplete = data.get('autocomplete', False)
         return self
 
 class Subcommand(Option):
@@ -118,7 +122,7 @@ class ApplicationCommand:
         self.guild_id = int(data.get('guild_id')) if data.get('guild_id') else None
         self.name = data['name']
         self.description = data.get('description')
-        self.options = [Option.from_data(d) for d in data.get('options', [])]
+        self.options = [Option.from_data(d) for d in data.get('options') or []]
         self.default_permission = data.get('default_permission')
         self.guild = None
         if self.guild_id:
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import io
 import os
-from typing import Any, Literal, Optional, TYPE_CHECKING, Tuple, Union
+from typing import Any, AsyncIterator, Literal, Optional, TYPE_CHECKING, Tuple, Union
 from .errors import DiscordException
 from .errors import InvalidArgument
 from . import utils
@@ -75,6 +75,46 @@ class AssetMixin:
 
         return await self._state.http.get_from_cdn(self.url)
 
+    async def stream(self, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Retrieves the content of this asset in chunks without holding all
+        of it in memory.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            with open('avatar.png', 'wb') as f:
+                async for chunk in asset.stream():
+                    f.write(chunk)
+
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum number of bytes in each chunk.
+
+        Raises
+        ------
+        DiscordException
+            There was no internal connection state.
+        HTTPException
+            Downloading the asset failed.
+        NotFound
+            The asset was deleted.
+
+        Yields
+        -------
+        :class:`bytes`
+            A chunk of the asset's content.
+        """
+        if self._state is None:
+            raise DiscordException('Invalid state (no ConnectionState provided)')
+
+        async for chunk in self._state.http.stream_from_cdn(self.url, chunk_size):
+            yield chunk
+
     async def save(self, fp: Union[str, bytes, os.PathLike, io.BufferedIOBase], *, seek_begin: bool = True) -> int:
         """|coro|
 
@@ -105,15 +145,17 @@ class AssetMixin:
             The number of bytes written.
         """
 
-        data = await self.read()
+        written = 0
         if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
+            async for chunk in self.stream():
+                written += fp.write(chunk)
             if seek_begin:
                 fp.seek(0)
-            return written
         else:
             with open(fp, 'wb') as f:
-                return f.write(data)
+                async for chunk in self.stream():
+                    written += f.write(chunk)
+        return written
 
 
 class Asset(AssetMixin):
@@ -0,0 +1,153 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from . import utils
+from .enums import RequestPriority
+from .object import Object
+
+if TYPE_CHECKING:
+    from .abc import Snowflake
+    from .state import ConnectionState
+
+    BulkProgress = Callable[['BulkMemberResult'], Any]
+
+__all__ = (
+    'BulkMemberResult',
+)
+
+_log = logging.getLogger(__name__)
+
+
+class BulkMemberResult:
+    """Represents the outcome of a bulk member operation such as
+    :meth:`Guild.bulk_add_roles`.
+
+    Members that failed or were not processed can be retried by passing
+    :attr:`remaining` to the same operation again.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    total: :class:`int`
+        The number of members the operation was started with.
+    succeeded: List[:class:`int`]
+        The IDs of the members that were updated.
+    skipped: List[:class:`int`]
+        The IDs of the cached members that were already in the requested
+        state, no request was made for these.
+    failed: Dict[:class:`int`, :class:`Exception`]
+        A mapping of member ID to the error that updating them raised.
+    """
+
+    __slots__ = ('total', 'succeeded', 'skipped', 'failed', '_member_ids')
+
+    def __init__(self, member_ids: List[int]) -> None:
+        self._member_ids: List[int] = member_ids
+        self.total: int = len(member_ids)
+        self.succeeded: List[int] = []
+        self.skipped: List[int] = []
+        self.failed: Dict[int, Exception] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'<BulkMemberResult total={self.total} succeeded={len(self.succeeded)} '
+            f'skipped={len(self.skipped)} failed={len(self.failed)}>'
+        )
+
+    @property
+    def done(self) -> int:
+        """:class:`int`: The number of members that have been processed so far."""
+        return len(self.succeeded) + len(self.skipped) + len(self.failed)
+
+    @property
+    def pending(self) -> List[int]:
+        """List[:class:`int`]: The IDs of the members that have not been processed,
+        because the operation was stopped early."""
+        processed = {*self.succeeded, *self.skipped, *self.failed}
+        return [member_id for member_id in self._member_ids if member_id not in processed]
+
+    @property
+    def remaining(self) -> List[Object]:
+        """List[:class:`Object`]: The members that failed or have not been processed.
+        This can be passed to the operation again to resume it."""
+        return [Object(id=member_id) for member_id in (*self.failed, *self.pending)]
+
+
+async def _run_bulk_member_operation(
+    state: ConnectionState,
+    members: Iterable[Snowflake],
+    operation: Callable[[int], Coroutine[Any, Any, bool]],
+    *,
+    concurrency: int,
+    stop_on_error: bool,
+    progress: Optional[BulkProgress],
+) -> BulkMemberResult:
+    if concurrency <= 0:
+        raise ValueError('concurrency must be greater than 0')
+
+    result = BulkMemberResult(utils._unique(member.id for member in members))
+    queue = iter(result._member_ids)
+    stopped = False
+
+    async def worker() -> None:
+        nonlocal stopped
+        # every worker pulls from the same iterator, requests to the same bucket
+        # (one per route and guild) queue up on its rate limit lock and are sent back to back
+        for member_id in queue:
+            if stopped:
+                return
+
+            try:
+                sent = await operation(member_id)
+            except Exception as exc:
+                result.failed[member_id] = exc
+                stopped = stop_on_error
+            else:
+                (result.succeeded if sent else result.skipped).append(member_id)
+
+            if progress is not None:
+                try:
+                    await utils.maybe_coroutine(progress, result)
+                except Exception:
+                    # the result must survive a broken callback
+                    _log.exception('Bulk member operation progress callback %r raised an exception', progress)
+
+    # the tasks inherit the priority from the current context
+    with state.http.priority(RequestPriority.bulk):
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, result.total))]
+
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    return result
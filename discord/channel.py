@@ -749,6 +749,7 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
         joined: bool = False,
         limit: Optional[int] = 50,
         before: Optional[Union[Snowflake, datetime.datetime]] = None,
+        prefetch: int = 0,
     ) -> ArchivedThreadIterator:
         """Returns an :class:`~discord.AsyncIterator` that iterates over all archived threads in the guild.
 
@@ -770,6 +771,10 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
         joined: :class:`bool`
             Whether to retrieve private archived threads that you've joined.
             You cannot set ``joined`` to ``True`` and ``private`` to ``False``.
+        prefetch: :class:`int`
+            The number of pages of threads to fetch in the background while the
+            current page is being consumed, at the cost of keeping up to ``prefetch``
+            extra pages in memory. Defaults to ``0``.
 
         Raises
         ------
@@ -783,7 +788,9 @@ class TextChannel(discord.abc.Messageable, discord.abc.GuildChannel, Hashable):
         :class:`Thread`
             The archived threads.
         """
-        return ArchivedThreadIterator(self.id, self.guild, limit=limit, joined=joined, private=private, before=before)
+        return ArchivedThreadIterator(
+            self.id, self.guild, limit=limit, joined=joined, private=private, before=before, prefetch=prefetch
+        )
 
 
 class VocalGuildChannel(discord.abc.Connectable, discord.abc.GuildChannel, Hashable):
@@ -28,10 +28,12 @@ import asyncio
 import json
 from discord.application_commands import ApplicationCommand, Option, PartialApplicationCommand
 import logging
+import os
 import signal
 import sys
+import time
 import traceback
-from typing import Any, Callable, Coroutine, Dict, Generator, List, Optional, Sequence, TYPE_CHECKING, Tuple, TypeVar, Union, overload
+from typing import Any, Callable, ContextManager, Coroutine, Dict, Generator, List, Optional, Sequence, Set, TYPE_CHECKING, Tuple, TypeVar, Union, overload
 
 import aiohttp
 
@@ -45,18 +47,20 @@ from .channel import _threaded_channel_factory, PartialMessageable
 from .enums import ChannelType
 from .mentions import AllowedMentions
 from .errors import *
-from .enums import Status, VoiceRegion
+from .enums import RequestPriority, Status, VoiceRegion
 from .flags import ApplicationFlags, Intents
 from .gateway import *
 from .activity import ActivityTypes, BaseActivity, create_activity
 from .voice_client import VoiceClient
-from .http import HTTPClient
+from .http import CDNCache, HTTPClient, ResponseCache
 from .state import ConnectionState
 from . import utils
 from .utils import MISSING
 from .object import Object
 from .backoff import ExponentialBackoff
 from .webhook import Webhook
+from .event_source import EventSink, EventSource
+from .stats import CacheStats, EventStats, RequestTrace
 from .iterators import GuildIterator
 from .appinfo import AppInfo
 from .ui.view import View
@@ -178,6 +182,16 @@ class Client:
         preparing the member cache and firing READY. The default timeout is 2 seconds.
 
         .. versionadded:: 1.4
+    guild_create_slice_size: Optional[:class:`int`]
+        The maximum number of members or presences to process at once when a guild
+        becomes available. Guilds with more members than this are loaded in slices that
+        yield to the event loop in between, so that huge guilds do not block other shards
+        and tasks. While a guild is being loaded, :attr:`Guild.unavailable` is ``True`` and
+        later events from the same shard are held back. Defaults to ``None``, which loads
+        every guild at once. With ``enable_event_stats``, the longest a single slice blocked
+        the event loop is reported by :attr:`GatewayEventStats.max_block_time`.
+
+        .. versionadded:: 2.0
     assume_unsync_clock: :class:`bool`
         Whether to assume the system clock is unsynced. This applies to the ratelimit handling
         code. If this is set to ``True``, the default, then the library uses the time to reset
@@ -193,6 +207,83 @@ class Client:
         this is ``False`` then those events will not be dispatched (due to performance considerations).
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
+        .. versionadded:: 2.0
+    enable_event_stats: :class:`bool`
+        Whether to collect timing statistics for every gateway event type, available
+        through :attr:`event_stats`. This has a small cost for every event received,
+        so it is disabled by default.
+
+        .. versionadded:: 2.0
+    http_trace_hook: Optional[Callable[[:class:`RequestTrace`], Any]]
+        A callable that is called with a :class:`RequestTrace` once every request
+        made to the Discord API finishes. It is called from the event loop and must
+        not block. Defaults to ``None``, which disables request tracing.
+
+        .. versionadded:: 2.0
+    coalesce_requests: Union[:class:`bool`, Iterable[:class:`str`]]
+        Whether concurrent identical ``GET`` requests to the Discord API should share
+        a single in-flight request instead of each being sent. This can either be ``True``
+        to coalesce every ``GET`` request or an iterable of route paths to coalesce, e.g.
+        ``{'/users/{user_id}', '/guilds/{guild_id}/members/{member_id}'}``. Defaults to ``False``.
+
+        .. versionadded:: 2.0
+    fetch_cache_ttl: Optional[:class:`float`]
+        The number of seconds the results of :meth:`fetch_user`, :meth:`fetch_channel`,
+        :meth:`Guild.fetch_member` and :meth:`Guild.fetch_roles` are kept for. Cached
+        results are discarded as soon as a gateway event signals that they changed.
+        Defaults to ``None``, which disables the cache.
+
+        This is ignored when ``stateless`` is enabled, since gateway events are not
+        parsed and nothing would discard outdated results.
+
+        .. versionadded:: 2.0
+    fetch_cache_max_size: :class:`int`
+        The maximum number of results kept when ``fetch_cache_ttl`` is set. The least
+        recently used results are discarded first. Defaults to ``1000``.
+
+        .. versionadded:: 2.0
+    cdn_cache_dir: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The directory used to cache assets downloaded through :meth:`Asset.read`,
+        :meth:`Asset.save` and :meth:`Asset.stream`. Every size and format of an
+        asset is cached separately. Defaults to ``None``, which disables the cache.
+
+        .. versionadded:: 2.0
+    cdn_cache_max_size: :class:`int`
+        The maximum number of bytes kept in ``cdn_cache_dir``. The least recently
+        used assets are removed first. Defaults to 64 MiB.
+
+        .. versionadded:: 2.0
+    cdn_cache_revalidate_after: :class:`float`
+        The number of seconds a cached asset is used for before it is revalidated
+        with a conditional request. Defaults to ``3600``.
+
+        .. versionadded:: 2.0
+    stateless: :class:`bool`
+        Whether to run the client without an internal cache. When enabled, gateway
+        events are not parsed into models and are instead dispatched as
+        ``on_gateway_<event>`` with the decoded payload as its only argument, e.g.
+        ``on_gateway_message_create`` receives the ``MESSAGE_CREATE`` payload as a
+        :class:`dict`. Events such as :func:`on_raw_message_delete` are not
+        dispatched, as their payload models are not built in this mode. Only
+        :func:`on_connect`, :func:`on_ready` and :func:`on_resumed` keep their
+        usual behaviour. Cache based attributes such as :attr:`guilds` remain
+        empty and features that rely on the cache, such as views and voice, do
+        not work. Defaults to ``False``.
+
+        .. versionadded:: 2.0
+    event_source: Optional[:class:`EventSource`]
+        A transport to consume gateway dispatch payloads from instead of connecting
+        to the gateway. When given, :meth:`connect` reads events from the source until it
+        is exhausted and gateway commands such as :meth:`change_presence` or member
+        chunking are unavailable. ``chunk_guilds_at_startup`` defaults to ``False``
+        in this case.
+
+        .. versionadded:: 2.0
+    event_sink: Optional[:class:`EventSink`]
+        A transport every gateway dispatch payload is forwarded to before it is parsed.
+        This is usually combined with ``stateless`` in a process that only maintains the
+        gateway connections for workers using an ``event_source``.
+
         .. versionadded:: 2.0
 
     Attributes
@@ -219,7 +310,18 @@ class Client:
         proxy: Optional[str] = options.pop('proxy', None)
         proxy_auth: Optional[aiohttp.BasicAuth] = options.pop('proxy_auth', None)
         unsync_clock: bool = options.pop('assume_unsync_clock', True)
-        self.http: HTTPClient = HTTPClient(connector, proxy=proxy, proxy_auth=proxy_auth, unsync_clock=unsync_clock, loop=self.loop)
+        http_trace_hook: Optional[Callable[[RequestTrace], Any]] = options.pop('http_trace_hook', None)
+        self.http: HTTPClient = HTTPClient(
+            connector,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+            unsync_clock=unsync_clock,
+            loop=self.loop,
+            trace_hook=http_trace_hook,
+            coalesce=options.pop('coalesce_requests', False),
+            response_cache=self._create_response_cache(options),
+            cdn_cache=self._create_cdn_cache(options),
+        )
 
         self._handlers: Dict[str, Callable] = {
             'ready': self._handle_ready
@@ -230,6 +332,16 @@ class Client:
         }
 
         self._enable_debug_events: bool = options.pop('enable_debug_events', False)
+        self._event_source: Optional[EventSource] = options.pop('event_source', None)
+        self._event_sink: Optional[EventSink] = options.pop('event_sink', None)
+        if self._event_source is not None:
+            options.setdefault('chunk_guilds_at_startup', False)
+
+        self._event_stats: Optional[EventStats] = None
+        if options.pop('enable_event_stats', False):
+            self._event_stats = EventStats()
+            self._schedule_event = self._schedule_timed_event
+
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
         self._closed: bool = False
@@ -246,6 +358,26 @@ class Client:
     def _get_websocket(self, guild_id: Optional[int] = None, *, shard_id: Optional[int] = None) -> DiscordWebSocket:
         return self.ws
 
+    def _create_response_cache(self, options: Dict[str, Any]) -> Optional[ResponseCache]:
+        ttl: Optional[float] = options.pop('fetch_cache_ttl', None)
+        max_size: int = options.pop('fetch_cache_max_size', 1000)
+        if ttl is None:
+            return None
+        if options.get('stateless', False):
+            _log.warning('fetch_cache_ttl is ignored in stateless mode.')
+            return None
+        if ttl <= 0:
+            raise ValueError('fetch_cache_ttl must be greater than 0')
+        return ResponseCache(ttl, max_size)
+
+    def _create_cdn_cache(self, options: Dict[str, Any]) -> Optional[CDNCache]:
+        directory: Optional[Union[str, os.PathLike]] = options.pop('cdn_cache_dir', None)
+        max_size: int = options.pop('cdn_cache_max_size', 64 * 1024 * 1024)
+        revalidate_after: float = options.pop('cdn_cache_revalidate_after', 3600.0)
+        if directory is None:
+            return None
+        return CDNCache(directory, max_size, revalidate_after)
+
     def _get_state(self, **options: Any) -> ConnectionState:
         return ConnectionState(dispatch=self.dispatch, handlers=self._handlers,
                                hooks=self._hooks, http=self.http, loop=self.loop, **options)
@@ -274,6 +406,16 @@ class Client:
             return self.ws.is_ratelimited()
         return False
 
+    @property
+    def event_stats(self) -> Optional[EventStats]:
+        """Optional[:class:`.EventStats`]: The gateway event statistics of the client.
+
+        This is ``None`` unless ``enable_event_stats`` was passed to the client.
+
+        .. versionadded:: 2.0
+        """
+        return self._event_stats
+
     @property
     def user(self) -> Optional[ClientUser]:
         """Optional[:class:`.ClientUser`]: Represents the connected client. ``None`` if not logged in."""
@@ -344,6 +486,49 @@ class Client:
         """
         return self._connection.application_flags  # type: ignore
 
+    def cache_stats(self) -> CacheStats:
+        """Returns the number of objects in each internal cache along with their estimated size.
+
+        This walks every cache and could be slow for clients with a large cache,
+        so it should not be called too often.
+
+        .. versionadded:: 2.0
+
+        Returns
+        --------
+        :class:`.CacheStats`
+            The statistics of the internal cache.
+        """
+        return self._connection.cache_stats()
+
+    def request_priority(self, priority: RequestPriority) -> ContextManager[None]:
+        """Returns a context manager that sets the priority of the API requests
+        made inside of it.
+
+        Requests waiting on a rate limit are sent in priority order, so marking
+        background work as :attr:`RequestPriority.bulk` keeps it from delaying
+        other requests. Interaction responses and the requests made through
+        :attr:`Interaction.followup` always use :attr:`RequestPriority.interaction`.
+        Tasks created inside the context manager inherit its priority.
+
+        .. versionadded:: 2.0
+
+        Example
+        ---------
+
+        .. code-block:: python3
+
+            with client.request_priority(discord.RequestPriority.bulk):
+                for member in members:
+                    await member.add_roles(role)
+
+        Parameters
+        -----------
+        priority: :class:`RequestPriority`
+            The priority of the requests made inside the context manager.
+        """
+        return self.http.priority(priority)
+
     def is_ready(self) -> bool:
         """:class:`bool`: Specifies if the client's internal cache is ready for use."""
         return self._ready.is_set()
@@ -364,6 +549,14 @@ class Client:
         # Schedules the task
         return asyncio.create_task(wrapped, name=f'discord.py: {event_name}')
 
+    def _schedule_timed_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> asyncio.Task:
+        wrapped = self._run_event(coro, event_name, *args, **kwargs)
+        # only events dispatched while a gateway event is being parsed are attributed to it
+        current = self._event_stats._current  # type: ignore
+        if current is not None:
+            wrapped = self._event_stats._time_listener(wrapped, *current)  # type: ignore
+        return asyncio.create_task(wrapped, name=f'discord.py: {event_name}')
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug('Dispatching event %s', event)
         method = 'on_' + event
@@ -500,6 +693,13 @@ class Client:
             The websocket connection has been terminated.
         """
 
+        if self._event_source is not None:
+            await self._poll_event_source()
+            return
+
+        if self._event_sink is not None:
+            await self._event_sink.start()
+
         backoff = ExponentialBackoff()
         ws_params = {
             'initial': True,
@@ -559,6 +759,45 @@ class Client:
                 # This is apparently what the official Discord client does.
                 ws_params.update(sequence=self.ws.sequence, resume=True, session=self.ws.session_id)
 
+    async def _poll_event_source(self) -> None:
+        source: EventSource = self._event_source  # type: ignore
+        state = self._connection
+        parsers = state.parsers
+        ready_shards: Set[Optional[int]] = set()
+        await source.connect()
+        _log.info('Consuming gateway events from %s.', source.__class__.__name__)
+        while not self.is_closed():
+            msg = await source.receive()
+            if msg is None:
+                break
+
+            event = msg.get('t')
+            data = msg.get('d')
+            shard_id = msg.get('shard_id')
+            self.dispatch('socket_event_type', event)
+            try:
+                func = parsers[event]
+            except KeyError:
+                _log.debug('Unknown event %s.', event)
+            else:
+                if event in ('READY', 'RESUMED'):
+                    data.setdefault('__shard_id__', shard_id)
+                if event == 'READY' and not state.stateless:
+                    if ready_shards - {shard_id}:
+                        # the cache holds the guilds of other shards, only add the ones of this shard
+                        _log.info('Shard ID %s is now feeding events alongside shard IDs %s.', shard_id, ready_shards)
+                        func = state._add_shard_ready
+                    ready_shards.add(shard_id)
+
+                stats = self._event_stats
+                if stats is None:
+                    pending = func(data)
+                else:
+                    # the payload size is not known once it has been decoded
+                    pending = stats._record_parse(event, func, data, 0, time.perf_counter())
+                if pending is not None:
+                    await pending
+
     async def close(self) -> None:
         """|coro|
 
@@ -579,6 +818,12 @@ class Client:
         if self.ws is not None and self.ws.open:
             await self.ws.close(code=1000)
 
+        if self._event_source is not None:
+            await self._event_source.close()
+
+        if self._event_sink is not None:
+            await self._event_sink.close()
+
         await self.http.close()
         self._ready.clear()
 
@@ -1336,7 +1581,8 @@ class Client:
         *,
         limit: Optional[int] = 100,
         before: SnowflakeTime = None,
-        after: SnowflakeTime = None
+        after: SnowflakeTime = None,
+        prefetch: int = 0,
     ) -> GuildIterator:
         """Retrieves an :class:`.AsyncIterator` that enables receiving your guilds.
 
@@ -1379,6 +1625,12 @@ class Client:
             Retrieve guilds after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages of 100 guilds to fetch in the background while the
+            current page is being consumed, at the cost of keeping up to ``prefetch``
+            extra pages in memory. Defaults to ``0``.
+
+            .. versionadded:: 2.0
 
         Raises
         ------
@@ -1390,7 +1642,7 @@ class Client:
         :class:`.Guild`
             The guild with the guild data parsed.
         """
-        return GuildIterator(self, limit=limit, before=before, after=after)
+        return GuildIterator(self, limit=limit, before=before, after=after, prefetch=prefetch)
 
     async def fetch_template(self, code: Union[Template, str]) -> Template:
         """|coro|
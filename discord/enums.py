@@ -55,6 +55,7 @@ __all__ = (
     'InteractionType',
     'InteractionResponseType',
     'NSFWLevel',
+    'RequestPriority',
 )
 
 
@@ -548,6 +549,7 @@ class InteractionType(Enum):
     ping = 1
     application_command = 2
     component = 3
+    autocomplete = 4
 
 
 class InteractionResponseType(Enum):
@@ -558,6 +560,7 @@ class InteractionResponseType(Enum):
     deferred_channel_message = 5  # (with source)
     deferred_message_update = 6  # for components
     message_update = 7  # for components
+    autocomplete_result = 8
 
 
 class VideoQualityMode(Enum):
@@ -609,6 +612,12 @@ class NSFWLevel(Enum, comparable=True):
     age_restricted = 3
 
 
+class RequestPriority(Enum, comparable=True):
+    interaction = 0
+    normal = 1
+    bulk = 2
+
+
 T = TypeVar('T')
 
 
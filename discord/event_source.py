@@ -0,0 +1,341 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import queue
+from typing import Any, Awaitable, Deque, Dict, List, Optional
+
+from . import utils
+
+__all__ = (
+    'EventSource',
+    'EventSink',
+    'QueueEventSource',
+    'QueueEventSink',
+    'UnixSocketEventSource',
+    'UnixSocketEventSink',
+)
+
+_log = logging.getLogger(__name__)
+
+
+class EventSource:
+    """The base class for transports that feed gateway dispatch payloads into a :class:`Client`.
+
+    When a :class:`Client` is given an event source, it consumes payloads from it
+    instead of opening its own gateway connection. This allows the gateway connection
+    to live in a separate process that forwards its events through an :class:`EventSink`.
+
+    Payloads are the decoded gateway messages, i.e. dictionaries with the ``t``, ``s`` and ``d``
+    keys, with an additional ``shard_id`` key denoting the shard that received them.
+
+    .. versionadded:: 2.0
+    """
+
+    async def connect(self) -> None:
+        """|coro|
+
+        Called by the client before any payload is received. The default
+        implementation does nothing.
+        """
+        pass
+
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Waits for the next dispatch payload.
+
+        Returns
+        --------
+        Optional[:class:`dict`]
+            The payload, or ``None`` if the source is exhausted and the client should stop.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Called when the client is closed. The default implementation does nothing.
+        """
+        pass
+
+
+class EventSink:
+    """The base class for transports that forward gateway dispatch payloads out of a :class:`Client`.
+
+    Every dispatch payload received by the client's websockets is passed to :meth:`publish`
+    before it is parsed. This is usually paired with the ``stateless`` option so that the
+    gateway process does not maintain a cache of its own.
+
+    .. versionadded:: 2.0
+    """
+
+    async def start(self) -> None:
+        """|coro|
+
+        Called by the client before connecting to the gateway. The default
+        implementation does nothing.
+        """
+        pass
+
+    def publish(self, shard_id: Optional[int], payload: Dict[str, Any]) -> Optional[Awaitable[None]]:
+        """Forwards a dispatch payload.
+
+        This is called from the gateway's receive loop and must not block. The
+        payload is parsed right after this returns, which may modify it, so it must
+        not be kept around as-is.
+
+        To apply backpressure, an awaitable may be returned. The gateway waits for
+        it before reading the next payload.
+
+        Parameters
+        -----------
+        shard_id: Optional[:class:`int`]
+            The shard ID that received the payload.
+        payload: :class:`dict`
+            The decoded gateway payload.
+
+        Returns
+        --------
+        Optional[Awaitable[``None``]]
+            An awaitable to wait for before the next payload, if any.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Called when the client is closed. The default implementation does nothing.
+        """
+        pass
+
+
+class QueueEventSource(EventSource):
+    """An :class:`EventSource` that reads payloads from a queue.
+
+    This is meant to be used with a :class:`multiprocessing.Queue` shared with
+    a process that publishes to it through a :class:`QueueEventSink`, though any
+    object implementing a blocking ``get`` with a ``timeout`` keyword argument works.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    queue
+        The queue to read payloads from. Items are either payloads or their JSON
+        encoding, as put by :class:`QueueEventSink`. A ``None`` item stops the client.
+    poll_interval: :class:`float`
+        The maximum number of seconds a reader thread blocks on the queue before
+        checking whether the source was closed. Defaults to ``0.5``.
+    """
+
+    def __init__(self, queue: Any, *, poll_interval: float = 0.5) -> None:
+        self.queue: Any = queue
+        self.poll_interval: float = poll_interval
+        self._closed: bool = False
+
+    def _get(self) -> Any:
+        try:
+            return self.queue.get(timeout=self.poll_interval)
+        except queue.Empty:
+            return utils.MISSING
+
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            payload = await loop.run_in_executor(None, self._get)
+            if payload is utils.MISSING:
+                continue
+            if isinstance(payload, (str, bytes)):
+                return utils._from_json(payload)
+            return payload
+        return None
+
+    async def close(self) -> None:
+        self._closed = True
+
+
+class QueueEventSink(EventSink):
+    """An :class:`EventSink` that puts payloads on a queue.
+
+    Payloads are put as JSON strings with the shard ID stored under the
+    ``shard_id`` key. They are encoded when published, before the client parses
+    and modifies them.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    queue
+        The queue to put payloads on, usually a :class:`multiprocessing.Queue`.
+    """
+
+    def __init__(self, queue: Any) -> None:
+        self.queue: Any = queue
+
+    def publish(self, shard_id: Optional[int], payload: Dict[str, Any]) -> None:
+        encoded = utils._to_json({**payload, 'shard_id': shard_id})
+        try:
+            self.queue.put_nowait(encoded)
+        except queue.Full:
+            _log.warning('Event queue is full, dropping %s event from shard ID %s.', payload.get('t'), shard_id)
+
+
+class UnixSocketEventSource(EventSource):
+    """An :class:`EventSource` that connects to a :class:`UnixSocketEventSink`.
+
+    Payloads are exchanged as newline delimited JSON.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path of the unix socket the sink is listening on.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_unix_connection(self.path, limit=2 ** 26)
+
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        if self._reader is None:
+            return None
+
+        line = await self._reader.readline()
+        if not line:
+            return None
+        return utils._from_json(line)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._reader = None
+
+
+class UnixSocketEventSink(EventSink):
+    """An :class:`EventSink` that serves payloads to :class:`UnixSocketEventSource` workers.
+
+    Every shard is assigned to a single worker the first time one of its events
+    is published, picking the worker with the fewest shards. The shard keeps that
+    worker for as long as it stays connected, so the events of a single guild are
+    always processed in order by the same worker. Workers connecting later only
+    receive shards that are new or whose worker disconnected.
+
+    Payloads published while no worker is connected are buffered. When a worker
+    falls behind by more than ``high_water`` bytes, the gateway stops reading
+    until the worker catches up.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path of the unix socket to listen on.
+    max_buffer: :class:`int`
+        The maximum number of payloads kept while no worker is connected.
+        Older payloads are discarded first. Defaults to ``10000``.
+    high_water: :class:`int`
+        The number of bytes that may be waiting to be sent to a single worker
+        before the gateway waits for it. Defaults to 4 MiB.
+    """
+
+    def __init__(self, path: str, *, max_buffer: int = 10000, high_water: int = 4 * 1024 * 1024) -> None:
+        self.path: str = path
+        self.high_water: int = high_water
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: List[asyncio.StreamWriter] = []
+        # shard ID -> the worker its events are sent to
+        self._assignments: Dict[Optional[int], asyncio.StreamWriter] = {}
+        self._buffer: Deque[bytes] = deque(maxlen=max_buffer)
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_unix_server(self._accept, path=self.path)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        _log.info('Event worker connected to %s (%d connected).', self.path, len(self._writers))
+        while self._buffer:
+            writer.write(self._buffer.popleft())
+
+        try:
+            # workers never send anything, this only waits for them to disconnect
+            await reader.read()
+        finally:
+            self._writers.remove(writer)
+            # the shards of this worker are handed to the others on their next event
+            self._assignments = {shard: w for shard, w in self._assignments.items() if w is not writer}
+            writer.close()
+            _log.info('Event worker disconnected from %s (%d connected).', self.path, len(self._writers))
+
+    def _assign(self, shard_id: Optional[int]) -> asyncio.StreamWriter:
+        loads: Dict[asyncio.StreamWriter, int] = {writer: 0 for writer in self._writers}
+        for writer in self._assignments.values():
+            loads[writer] += 1
+
+        writer = min(self._writers, key=loads.__getitem__)
+        self._assignments[shard_id] = writer
+        return writer
+
+    async def _drain(self, writer: asyncio.StreamWriter) -> None:
+        try:
+            await writer.drain()
+        except ConnectionError:
+            # the worker is gone, its shards are reassigned once it's removed
+            pass
+
+    def publish(self, shard_id: Optional[int], payload: Dict[str, Any]) -> Optional[Awaitable[None]]:
+        line = utils._to_json({**payload, 'shard_id': shard_id}).encode('utf-8') + b'\n'
+        if not self._writers:
+            self._buffer.append(line)
+            return None
+
+        writer = self._assignments.get(shard_id)
+        if writer is None:
+            writer = self._assign(shard_id)
+
+        writer.write(line)
+        if writer.transport.get_write_buffer_size() > self.high_water:
+            return self._drain(writer)
+        return None
+
+    async def close(self) -> None:
+        for writer in self._writers:
+            writer.close()
+        self._assignments.clear()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -5,3 +5,6 @@ from .commands import *
 from .cog import *
 from .errors import *
 from .cooldown import *
+from .converter import *
+from .autocomplete import *
+from discord.ext.offload import *
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, List, Optional, Tuple, Union
+
+from ...application_commands import Choice
+
+__all__ = (
+    'AutocompleteIndex',
+)
+
+
+class AutocompleteIndex:
+    """An in-memory index for answering autocomplete queries over large choice sets.
+
+    Candidates are kept in a sorted array of case-folded keys, so a query is
+    answered with a binary search followed by a scan of at most ``limit``
+    matches, regardless of how many candidates are indexed. Every word of a
+    candidate's name is indexed as well, so ``york`` matches ``New York``.
+
+    Additions are batched: the array is only re-sorted on the first search
+    after a change.
+
+    Parameters
+    -----------
+    choices: Iterable[Union[:class:`str`, :class:`~discord.Choice`]]
+        The initial candidates.
+    """
+
+    __slots__ = ('_entries', '_keys', '_dirty')
+
+    def __init__(self, choices: Iterable[Union[str, Choice]] = ()):
+        self._entries: List[Tuple[str, int, Choice]] = []
+        self._keys: List[str] = []
+        self._dirty: bool = False
+        self.update(choices)
+
+    def __len__(self) -> int:
+        return sum(1 for _, word, _ in self._entries if word == 0)
+
+    def add(self, name: str, value: Any = None) -> None:
+        """Adds a candidate to the index.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name shown to the user and matched against.
+        value: Any
+            The value sent back when the candidate is picked. Defaults to ``name``.
+        """
+        choice = Choice(name, name if value is None else value)
+        folded = name.casefold()
+        words = folded.split()
+        self._entries.append((folded, 0, choice))
+        for position, word in enumerate(words[1:], 1):
+            self._entries.append((' '.join(words[position:]), position, choice))
+        self._dirty = True
+
+    def update(self, choices: Iterable[Union[str, Choice]]) -> None:
+        """Adds many candidates to the index.
+
+        Parameters
+        -----------
+        choices: Iterable[Union[:class:`str`, :class:`~discord.Choice`]]
+            The candidates to add.
+        """
+        for choice in choices:
+            if isinstance(choice, Choice):
+                self.add(choice.name, choice.value)
+            else:
+                self.add(choice)
+
+    def remove(self, name: str) -> None:
+        """Removes every candidate with the given name.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the candidate to remove.
+        """
+        self._entries = [entry for entry in self._entries if entry[2].name != name]
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Removes every candidate."""
+        self._entries.clear()
+        self._keys.clear()
+        self._dirty = False
+
+    def _build(self) -> None:
+        self._entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self._keys = [entry[0] for entry in self._entries]
+        self._dirty = False
+
+    def search(self, query: str, *, limit: int = 25) -> List[Choice]:
+        """Finds the candidates matching a query.
+
+        Of the first ``limit`` matches in alphabetical order, candidates whose
+        name starts with the query come first, followed by candidates with a
+        later word starting with it.
+
+        Parameters
+        -----------
+        query: :class:`str`
+            What the user has typed so far.
+        limit: :class:`int`
+            The maximum number of candidates to return. Discord accepts up to 25.
+
+        Returns
+        --------
+        List[:class:`~discord.Choice`]
+            The matching candidates.
+        """
+        if self._dirty:
+            self._build()
+
+        query = ' '.join(query.casefold().split())
+        keys = self._keys
+        entries = self._entries
+        leading: List[Choice] = []
+        inner: List[Choice] = []
+        seen = set()
+        index = bisect_left(keys, query)
+        while index < len(keys) and len(seen) < limit and keys[index].startswith(query):
+            _, word, choice = entries[index]
+            if id(choice) not in seen:
+                seen.add(id(choice))
+                (leading if word == 0 else inner).append(choice)
+            index += 1
+
+        return leading + inner
+
+
+class _AutocompleteCache:
+    # a small LRU cache of autocomplete results with a per entry time to live
+    __slots__ = ('max_size', '_data')
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size: int = max_size
+        self._data: OrderedDict[Hashable, Tuple[float, List[Choice]]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[List[Choice]]:
+        try:
+            expires, choices = self._data[key]
+        except KeyError:
+            return None
+
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return choices
+
+    def set(self, key: Hashable, choices: List[Choice], ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, choices)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
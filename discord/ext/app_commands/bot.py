@@ -1,6 +1,6 @@
 import asyncio
 from discord.message import Message
-from discord.application_commands import ApplicationCommand
+from discord.application_commands import ApplicationCommand, Choice
 import json
 import discord
 from .commands import Command
@@ -10,21 +10,83 @@ from ...channel import _threaded_guild_channel_factory
 from ...errors import InvalidData
 from ...user import User
 from ...member import Member
-from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 from ...enums import ApplicationCommandType, ChannelType
 from .context import Context
+from .autocomplete import _AutocompleteCache
+from .converter import _resolve_member
 from ...interactions import MISSING, Interaction, InteractionType
 from ...client import Client
 from .cog import Cog
-import traceback, sys, types, importlib
+import traceback, sys, types, importlib, hashlib, os
 
 def _is_submodule(parent: str, child: str) -> bool:
     return parent == child or child.startswith(parent + ".")
 
+def _hash_payload(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+def _normalize_option(data: Dict[str, Any]) -> Dict[str, Any]:
+    # only the fields we send, with Discord's defaults filled in, so local and remote payloads compare equal
+    return {
+        'type': int(data['type']),
+        'name': data['name'],
+        'description': data.get('description') or '',
+        'required': bool(data.get('required', False)),
+        'autocomplete': bool(data.get('autocomplete', False)),
+        'choices': [{'name': c['name'], 'value': c['value']} for c in data.get('choices') or []],
+        'options': [_normalize_option(o) for o in data.get('options') or []],
+    }
+
+def _normalize_commands(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    commands = [
+        {
+            'type': int(d.get('type', 1)),
+            'name': d['name'],
+            'description': d.get('description') or '',
+            'default_permission': d.get('default_permission', True),
+            'options': [_normalize_option(o) for o in d.get('options') or []],
+        }
+        for d in data
+    ]
+    commands.sort(key=lambda d: (d['type'], d['name']))
+    return commands
+
+def _merge_options(into: List[Dict[str, Any]], options: List[Dict[str, Any]]) -> None:
+    for option in options:
+        for existing in into:
+            if existing['name'] == option['name'] and existing['type'] == option['type'] == 2:
+                _merge_options(existing['options'], option['options'])
+                break
+        else:
+            into.append(option)
+
+def _build_command_payloads(commands: List[Command]) -> List[Dict[str, Any]]:
+    # subcommands of the same base command are registered as a single command
+    merged: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for command in commands:
+        payload = command.app_command.to_dict()
+        key = (payload['type'], payload['name'])
+        if key in merged:
+            _merge_options(merged[key]['options'], payload['options'])
+        else:
+            merged[key] = payload
+    return list(merged.values())
+
+def _build_permissions_payload(commands: List[Command], app_commands: List[ApplicationCommand]) -> List[Dict[str, Any]]:
+    ids = {(c.type.value, c.name): c.id for c in app_commands}
+    permissions: Dict[int, List[Dict[str, Any]]] = {}
+    for command in commands:
+        command_id = ids.get((command.app_command.type.value, command.app_command.name))
+        if command.permissions and command_id is not None:
+            permissions.setdefault(command_id, []).extend(p.to_dict() for p in command.permissions)
+    return [{'id': command_id, 'permissions': p} for command_id, p in sorted(permissions.items())]
+
 class Bot(Client):
     def __init__(self, **options):
         super().__init__(**options)
         self.all_commands = {} # name: Command Object
+        self._commands_by_id: Dict[Tuple[int, str], Command] = {} # (command id, subcommand path): Command Object
         self.to_register = {} # partial command: guild ids
         self.extra_events: Dict[str, List] = {}
         self.__cogs: Dict[str, Cog] = {}
@@ -34,6 +96,12 @@ class Bot(Client):
         self.owner_id = options.get('owner_id')
         self.owner_ids = options.get('owner_ids', set())
         self.strip_after_prefix = options.get('strip_after_prefix', False)
+        self.autocomplete_debounce: float = options.get('autocomplete_debounce', 0.1)
+        self.auto_defer: Optional[float] = options.get('auto_defer')
+        self.auto_defer_ephemeral: bool = options.get('auto_defer_ephemeral', False)
+        self._autocomplete_latest: Dict[Tuple[int, int, str], int] = {} # (user id, command id, option): interaction id
+        self._autocomplete_cache = _AutocompleteCache()
+        self._deferral_tasks: Set[asyncio.Task] = set()
 
         if self.owner_id and self.owner_ids:
             raise TypeError('Both owner_id and owner_ids are set.')
@@ -95,6 +163,26 @@ class Bot(Client):
     def get_context(self, interaction: Interaction):
         return Context(self, interaction)
 
+    def _index_command(self, app_command: ApplicationCommand) -> None:
+        for command in self.all_commands.values():
+            base, _, path = command.name.partition(' ')
+            if base == app_command.name and command.app_command.type == app_command.type:
+                self._commands_by_id[(app_command.id, path)] = command
+
+    def _resolve_command(self, data) -> Tuple[str, Optional[Command]]:
+        path = []
+        options = data.get('options')
+        while options and options[0]['type'] in (1, 2):
+            path.append(options[0]['name'])
+            options = options[0].get('options')
+        subcommand = ' '.join(path)
+        command = self._commands_by_id.get((int(data['id']), subcommand))
+        if command is not None:
+            return command.name, command
+        # commands registered outside of sync_commands fall back to a name lookup
+        name = data['name'] + ' ' + subcommand if subcommand else data['name']
+        return name, self.all_commands.get(name)
+
     @property
     def commands(self):
         """Set[:class:`.Command`]: A unique, unordered set of commands without aliases that are registered
@@ -106,6 +194,8 @@ class Bot(Client):
         """
         This is called when an interaction is received from Discord.
         """
+        if interaction.type == InteractionType.autocomplete:
+            return await self.handle_autocomplete(self.get_context(interaction))
         if interaction.type != InteractionType.application_command:
             return
         ctx = self.get_context(interaction)
@@ -118,152 +208,285 @@ class Bot(Client):
         else:
             pass
 
-    async def sync_commands(self) -> None:
-        commands = [c.app_command for c in self.commands if c.guild_ids is None]
-        await self.overwrite_commands(*commands)
-        guilds = {} # guild id: [commands]
-        for command in [c for c in self.commands if c.guild_ids is not None]:
-            for guild_id in command.guild_ids:
-                guilds.setdefault(guild_id, []).append(command)
-        for guild, commands in guilds.items():
-            payload = [command.app_command.to_dict() for command in commands]
-            _cmds = {c.name: c for c in commands}
-            commands = await self.http.bulk_upsert_guild_commands(self.application_id, guild, payload)
-            for command in commands:
-                cmd = ApplicationCommand(state=self._connection, data=command)
-                cmd_name = cmd.name
-                for option in cmd.options:
-                    if option.type.value in (1, 2):
-                        cmd_name += ' ' + option.name
-                _cmds[cmd_name].app_command = cmd
-            perms_payload = []
-            for command in _cmds.values():
-                if command.permissions:
-                    perms_payload.append({
-                        'id': command.app_command.id,
-                        'permissions': [p.to_dict() for p in command.permissions]
-                    })
-            await self.http.bulk_edit_guild_application_command_permissions(self.application_id, guild, perms_payload)
+    async def sync_commands(self, *, cache_file: Optional[str] = None, force: bool = False, concurrency: int = 8) -> None:
+        """|coro|
+
+        Registers the bot's commands with Discord.
+
+        Every scope (the global commands and each guild) is hashed from the
+        ``to_dict()`` payloads of its commands. A scope is only overwritten if its
+        hash differs from the one recorded in ``cache_file`` and from the commands
+        currently registered with Discord, so restarting without changes costs
+        no writes. Guild scopes are synced concurrently, each guild being in its
+        own ratelimit bucket.
+
+        Parameters
+        -----------
+        cache_file: Optional[:class:`str`]
+            A JSON file recording the last synced state. When the recorded hash
+            of a scope matches, it is skipped without any request. Guilds recorded
+            in the file that no longer have commands are cleared. Without it,
+            guild command permissions are always re-applied.
+        force: :class:`bool`
+            Whether to overwrite every scope regardless of its hash.
+        concurrency: :class:`int`
+            The maximum number of scopes synced at once.
+        """
+        cache: Dict[str, Any] = {}
+        if cache_file is not None and not force:
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as fp:
+                    cache = json.load(fp)
+            except (OSError, ValueError):
+                cache = {}
+
+        scopes: Dict[Optional[int], List[Command]] = {None: []} # guild id: [commands]
+        for command in sorted(self.commands, key=lambda c: c.name):
+            guild_ids = command.guild_ids
+            if guild_ids is None:
+                scopes[None].append(command)
+                continue
+            for guild_id in ([guild_ids] if isinstance(guild_ids, int) else guild_ids):
+                scopes.setdefault(guild_id, []).append(command)
+
+        for key in cache:
+            if key != 'global':
+                scopes.setdefault(int(key), [])
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def sync(guild_id: Optional[int], commands: List[Command]) -> Dict[str, Any]:
+            key = 'global' if guild_id is None else str(guild_id)
+            async with semaphore:
+                return await self._sync_scope(guild_id, commands, cache.get(key), force=force)
+
+        keys = ['global' if g is None else str(g) for g in scopes]
+        results = await asyncio.gather(*(sync(g, c) for g, c in scopes.items()), return_exceptions=True)
+
+        error: Optional[BaseException] = None
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                cache.pop(key, None)
+                error = error or result
+            elif key != 'global' and not result['commands']:
+                cache.pop(key, None)
+            else:
+                cache[key] = result
+
+        if cache_file is not None:
+            tmp = cache_file + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as fp:
+                json.dump(cache, fp)
+            os.replace(tmp, cache_file)
+
+        if error is not None:
+            raise error
+
+    async def _sync_scope(
+        self, guild_id: Optional[int], commands: List[Command], cached: Optional[Dict[str, Any]], *, force: bool
+    ) -> Dict[str, Any]:
+        payload = _build_command_payloads(commands)
+        digest = _hash_payload(_normalize_commands(payload))
+
+        data = None
+        if not force:
+            if cached is not None and cached.get('hash') == digest:
+                data = cached['commands']
+            else:
+                if guild_id is None:
+                    remote = await self.http.get_global_commands(self.application_id)
+                else:
+                    remote = await self.http.get_guild_commands(self.application_id, guild_id)
+                if _hash_payload(_normalize_commands(remote)) == digest:
+                    data = remote
+
+        if data is None:
+            if guild_id is None:
+                data = await self.http.bulk_upsert_global_commands(self.application_id, payload)
+            else:
+                data = await self.http.bulk_upsert_guild_commands(self.application_id, guild_id, payload)
+
+        app_commands = [ApplicationCommand(state=self._connection, data=d) for d in data]
+        for app_command in app_commands:
+            self._index_command(app_command)
+
+        result: Dict[str, Any] = {'hash': digest, 'commands': data}
+        if guild_id is not None:
+            permissions = _build_permissions_payload(commands, app_commands)
+            permissions_digest = _hash_payload(permissions)
+            if force or cached is None or cached.get('permissions') != permissions_digest:
+                await self.http.bulk_edit_guild_application_command_permissions(self.application_id, guild_id, permissions)
+            result['permissions'] = permissions_digest
+        return result
+
+    def _start_deferral_watchdog(self, ctx: Context) -> Optional[asyncio.TimerHandle]:
+        delay = ctx.command.auto_defer
+        if delay is None:
+            delay = self.auto_defer
+        if delay is None or delay is False:
+            return None
+
+        # a timer instead of a task, nothing is allocated for handlers that respond in time
+        def fire() -> None:
+            if not ctx.interaction.response.is_done():
+                # referenced until done so it is not collected while waiting on the response lock
+                task = self.loop.create_task(self._run_deferral(ctx))
+                self._deferral_tasks.add(task)
+                task.add_done_callback(self._deferral_tasks.discard)
+                ctx._auto_defer_task = task
+
+        return self.loop.call_later(delay, fire)
+
+    async def _run_deferral(self, ctx: Context) -> None:
+        try:
+            await ctx._auto_defer(self.auto_defer_ephemeral)
+        except Exception as exc:
+            await ctx.command.dispatch_error(ctx, exc)
 
     async def handle_slash_command(self, ctx: Context):
-        if ctx.command_name not in self.all_commands:
+        command = ctx.command
+        if command is None:
             raise CommandNotFound(f'Command {ctx.command_name} was not found')
-        command = self.all_commands[ctx.command_name]
         if command.guild_ids is not None and ctx.guild_id not in command.guild_ids:
             raise CommandNotFound(f'Command {ctx.command_name} was not found in guild {ctx.guild_id}')
-        data = ctx._data
-        options = [o for o in data.get('options', []) if o.get('type') not in (1, 2)]
-        args = {}
-        resolved = data.get('resolved', {})
-        for option in options:
-            # attempts to convert values to their respective objects, falls back to int if fails
-            v = option['value']
-            if option['type'] == 6:
-                v = int(option['value'])
-                if str(option['value']) in resolved.get('members', []):
-                    v = resolved['members'][str(option['value'])]
-                    if str(option['value']) in resolved.get('users', []):
-                        v['user'] = resolved['users'][str(option['value'])]
-                    v = Member(data=v, guild=ctx.guild, state=self._connection)
-                else:
-                    if str(option['value']) in resolved.get('users', []):
-                        v = resolved['users'][str(option['value'])]
-                    v = User(data=v, state=self._connection)
-            elif option['type'] == 7:
-                v = int(option['value'])
-                if str(option['value']) in resolved.get('channels', []):
-                    data = resolved['channels'][str(option['value'])]
-                    factory, ch_type = _threaded_guild_channel_factory(data['type'])
-                    if factory is None:
-                        raise InvalidData('Unknown channel type {type} for channel ID {id}.'.format_map(data))
-                    if ch_type in (ChannelType.group, ChannelType.private):
-                        raise InvalidData('Channel ID resolved to a private channel')
-                    guild_id = int(data['guild_id'])
-                    if self.id != guild_id:
-                        raise InvalidData('Guild ID resolved to a different guild')
-                    v: GuildChannel = factory(guild=ctx.guild, state=self._connection, data=data)  # type: ignore
-            elif option['type'] == 8:
-                v = int(option['value'])
-                if str(option['value']) in resolved.get('roles', []):
-                    data = resolved['roles'][str(option['value'])]
-                    v = Role(data=data, state=self._connection, guild=ctx.guild)
-            elif option['type'] == 9: # mentionable can be a user or a role
-                v = int(option['value'])
-                if str(option['value']) in resolved.get('members', []):
-                    v = resolved['members'][str(option['value'])]
-                    if str(option['value']) in resolved.get('users', []):
-                        v['user'] = resolved['users'][str(option['value'])]
-                    v = Member(data=v, guild=ctx.guild, state=self._connection)
-                else:
-                    if str(option['value']) in resolved.get('users', []):
-                        v = resolved['users'][str(option['value'])]
-                        v = User(data=v, state=self._connection)
-                    else:
-                        if str(option['value']) in resolved.get('channels', []):
-                            data = resolved['channels'][str(option['value'])]
-                            factory, ch_type = _threaded_guild_channel_factory(data['type'])
-                            if factory is None:
-                                raise InvalidData('Unknown channel type {type} for channel ID {id}.'.format_map(data))
-                            if ch_type in (ChannelType.group, ChannelType.private):
-                                raise InvalidData('Channel ID resolved to a private channel')
-                            guild_id = int(data['guild_id'])
-                            if self.id != guild_id:
-                                raise InvalidData('Guild ID resolved to a different guild')
-                            v: GuildChannel = factory(guild=ctx.guild, state=self._connection, data=data)  # type: ignore
-            option['value'] = v
-            args[option['name']] = option['value']
-        ctx.args = args
-        self.dispatch('command', ctx)
+        # cooldowns and concurrency are checked first so rejected invocations skip conversion
+        try:
+            await command.prepare(ctx)
+        except CommandError as exc:
+            return await command.dispatch_error(ctx, exc)
+        watchdog = self._start_deferral_watchdog(ctx)
         try:
+            args = command.option_plan.convert(ctx, ctx._data.get('options', []))
+            ctx.args = args
+            self.dispatch('command', ctx)
             if ctx.cog is None:
                 return await ctx.command.callback(ctx, **args)
             return await ctx.command.callback(ctx.cog, ctx, **args)
         except Exception as exc:
             return await ctx.command.dispatch_error(ctx, exc)
         finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if command._max_concurrency is not None:
+                await command._max_concurrency.release(ctx)
             self.dispatch('command_completion', ctx)
 
+    async def handle_autocomplete(self, ctx: Context):
+        interaction = ctx.interaction
+        command = ctx.command
+        options = ctx._data.get('options')
+        while options and options[0]['type'] in (1, 2):
+            options = options[0].get('options')
+
+        focused = next((o for o in options or () if o.get('focused')), None)
+        handler = command.autocompleters.get(focused['name']) if command and focused else None
+        if handler is None:
+            return await interaction.response.autocomplete([])
+
+        key = (interaction.user.id, int(ctx._data['id']), focused['name'])
+        busy = key in self._autocomplete_latest
+        self._autocomplete_latest[key] = interaction.id
+        try:
+            if busy and self.autocomplete_debounce > 0:
+                # the user is still typing, only the latest request is shown so superseded ones are dropped
+                await asyncio.sleep(self.autocomplete_debounce)
+                if self._autocomplete_latest.get(key) != interaction.id:
+                    return
+            await self._run_autocomplete(ctx, handler, focused, options)
+        finally:
+            if self._autocomplete_latest.get(key) == interaction.id:
+                del self._autocomplete_latest[key]
+
+    async def _run_autocomplete(self, ctx: Context, handler, focused, options):
+        interaction = ctx.interaction
+        command = ctx.command
+        coro, cache_ttl = handler
+        value = focused['value']
+        # handlers see the other options through ctx.args, so they are part of the query
+        others = tuple(sorted((o['name'], o['value']) for o in options if o is not focused))
+        cache_key = (int(ctx._data['id']), command.name, focused['name'], value, others)
+        choices = self._autocomplete_cache.get(cache_key) if cache_ttl else None
+        if choices is None:
+            ctx.args = {o['name']: o['value'] for o in options}
+            try:
+                if ctx.cog is None:
+                    result = await coro(ctx, value)
+                else:
+                    result = await coro(ctx.cog, ctx, value)
+            except Exception as exc:
+                await interaction.response.autocomplete([])
+                return await command.dispatch_error(ctx, exc)
+
+            choices = []
+            for item in list(result or ())[:25]:
+                if isinstance(item, Choice):
+                    choices.append(item)
+                elif isinstance(item, tuple):
+                    choices.append(Choice(*item))
+                else:
+                    choices.append(Choice(str(item), item))
+            if cache_ttl:
+                self._autocomplete_cache.set(cache_key, choices, cache_ttl)
+
+        await interaction.response.autocomplete(choices)
+
     async def handle_message_command(self, ctx: Context):
-        if ctx.command_name not in self.all_commands:
+        command = ctx.command
+        if command is None:
             raise CommandNotFound(f'Command {ctx.command_name} was not found')
-        command = self.all_commands[ctx.command_name]
         if command.guild_ids is not None and ctx.guild_id not in command.guild_ids:
             raise CommandNotFound(f'Command {ctx.command_name} was not found in guild {ctx.guild_id}')
-        message = Message(state=self._connection, channel=ctx.channel, data=list(ctx._data['resolved']['messages'].values())[0])
-        ctx.args = {'message': message}
-        self.dispatch('command', ctx)
         try:
+            await command.prepare(ctx)
+        except CommandError as exc:
+            return await command.dispatch_error(ctx, exc)
+        watchdog = self._start_deferral_watchdog(ctx)
+        try:
+            message = Message(state=self._connection, channel=ctx.channel, data=list(ctx._data['resolved']['messages'].values())[0])
+            ctx.args = {'message': message}
+            self.dispatch('command', ctx)
             if ctx.cog is None:
                 return await ctx.command.callback(ctx, message=message)
             return await ctx.command.callback(ctx.cog, ctx, message=message)
         except Exception as exc:
             return await ctx.command.dispatch_error(ctx, exc)
         finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if command._max_concurrency is not None:
+                await command._max_concurrency.release(ctx)
             self.dispatch('command_completion', ctx)
 
     async def handle_user_command(self, ctx: Context):
-        resolved = ctx._data['resolved']
-        user = None
-        if resolved.get('members'):
-            user = list(resolved['members'].values())[0]
-            if resolved.get('users'):
-                user['user'] = list(resolved['users'].values())[0]
-            user = Member(data=user, guild=ctx.guild, state=self._connection)
-        else:
-            if resolved.get('users'):
-                v = list(resolved['users'].values())[0]
-                v = User(data=user, state=self._connection)
-        if user is None:
-            raise InvalidData('Could not resolve user')
-        ctx.args = {'user': user}
-        self.dispatch('command', ctx)
+        command = ctx.command
+        if command is None:
+            raise CommandNotFound(f'Command {ctx.command_name} was not found')
+        if command.guild_ids is not None and ctx.guild_id not in command.guild_ids:
+            raise CommandNotFound(f'Command {ctx.command_name} was not found in guild {ctx.guild_id}')
+        try:
+            await command.prepare(ctx)
+        except CommandError as exc:
+            return await command.dispatch_error(ctx, exc)
+        watchdog = self._start_deferral_watchdog(ctx)
         try:
+            resolved = ctx._data['resolved']
+            target_id = ctx._data.get('target_id') or next(iter(resolved.get('users') or ()), None)
+            # resolves without modifying the payload
+            user = None if target_id is None else _resolve_member(str(target_id), resolved, ctx)
+            if user is None:
+                raise InvalidData('Could not resolve user')
+            ctx.args = {'user': user}
+            self.dispatch('command', ctx)
             if ctx.cog is None:
                 return await ctx.command.callback(ctx, user=user)
             return await ctx.command.callback(ctx.cog, ctx, user=user)
         except Exception as exc:
             return await ctx.command.dispatch_error(ctx, exc)
         finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if command._max_concurrency is not None:
+                await command._max_concurrency.release(ctx)
             self.dispatch('command_completion', ctx)
 
     def add_command(self, command: Command):
@@ -272,7 +495,11 @@ class Bot(Client):
         self.all_commands[command.name] = command
         
     def remove_command(self, command: str):
-        return self.all_commands.pop(command, None)
+        removed = self.all_commands.pop(command, None)
+        if removed is not None:
+            for key in [k for k, v in self._commands_by_id.items() if v is removed]:
+                del self._commands_by_id[key]
+        return removed
 
     async def is_owner(self, user: discord.User) -> bool:
         """|coro|
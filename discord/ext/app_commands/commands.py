@@ -1,6 +1,9 @@
 import asyncio
 from typing import Optional
 from .cooldown import BucketType, CooldownMapping, MaxConcurrency
+from .errors import CommandOnCooldown
+from ...utils import DISCORD_EPOCH
+from .converter import OptionPlan
 import inspect
 
 
@@ -15,6 +18,7 @@ class Command:
         self.module = func.__module__
 
         self.app_command = application_command
+        self.option_plan = OptionPlan(getattr(application_command, 'options', None) or [])
         self.guild_ids = kwargs.get('guild_ids')
 
         name = kwargs.get('name') or func.__name__
@@ -24,6 +28,8 @@ class Command:
 
         self.callback = func
         self.enabled: bool = kwargs.get('enabled', True)
+        # None defers to the bot's auto_defer setting, False disables it for this command
+        self.auto_defer: Optional[float] = kwargs.get('auto_defer')
 
         try:
             permissions: list = func.__permissions__
@@ -32,6 +38,27 @@ class Command:
             permissions = []
 
         self.permissions = permissions
+        self.autocompleters = {} # option name: (coroutine, cache ttl)
+
+        try:
+            cooldown = func.__commands_cooldown__
+        except AttributeError:
+            cooldown = kwargs.get('cooldown')
+
+        if cooldown is None:
+            buckets = CooldownMapping(cooldown, BucketType.default)
+        elif isinstance(cooldown, CooldownMapping):
+            buckets = cooldown
+        else:
+            raise TypeError("Cooldown must be a an instance of CooldownMapping or None.")
+        self._buckets: CooldownMapping = buckets
+
+        try:
+            max_concurrency = func.__commands_max_concurrency__
+        except AttributeError:
+            max_concurrency = kwargs.get('max_concurrency')
+
+        self._max_concurrency: Optional[MaxConcurrency] = max_concurrency
 
         self.cog = None
 
@@ -47,6 +74,12 @@ class Command:
     def _ensure_assignment_on_copy(self, other):
         if self.permissions != other.permissions:
             other.permissions = self.permissions.copy()
+        other.autocompleters = self.autocompleters.copy()
+        if self._buckets.valid and not other._buckets.valid:
+            other._buckets = self._buckets.copy()
+        if self._max_concurrency != other._max_concurrency:
+            # _max_concurrency won't be None at this point
+            other._max_concurrency = self._max_concurrency.copy()  # type: ignore
         try:
             other.on_error = self.on_error
         except AttributeError:
@@ -60,6 +93,63 @@ class Command:
     def __str__(self) -> str:
         return self.name
 
+    @staticmethod
+    def _invoked_at(ctx) -> float:
+        # the interaction id carries its creation time, like a message's created_at
+        return ((ctx.interaction.id >> 22) + DISCORD_EPOCH) / 1000
+
+    def _prepare_cooldowns(self, ctx) -> None:
+        if self._buckets.valid:
+            current = self._invoked_at(ctx)
+            bucket = self._buckets.get_bucket(ctx, current)
+            if bucket is not None:
+                retry_after = bucket.update_rate_limit(current)
+                if retry_after:
+                    raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+
+    async def prepare(self, ctx) -> None:
+        """Applies the command's cooldown and concurrency limits to an invocation.
+
+        This runs before any option is converted, so rejected invocations
+        cost only a bucket lookup.
+
+        Raises
+        -------
+        CommandOnCooldown
+            The command is on cooldown for this invocation.
+        MaxConcurrencyReached
+            The command is already running the maximum number of times.
+        """
+        self._prepare_cooldowns(ctx)
+        if self._max_concurrency is not None:
+            await self._max_concurrency.acquire(ctx)
+
+    def is_on_cooldown(self, ctx) -> bool:
+        """Checks whether the command is currently on cooldown for the context."""
+        if not self._buckets.valid:
+            return False
+
+        current = self._invoked_at(ctx)
+        bucket = self._buckets.get_bucket(ctx, current)
+        return bucket is not None and bucket.get_tokens(current) == 0
+
+    def reset_cooldown(self, ctx) -> None:
+        """Resets the cooldown on this command for the context."""
+        if self._buckets.valid:
+            bucket = self._buckets.get_bucket(ctx)
+            if bucket is not None:
+                bucket.reset()
+
+    def get_cooldown_retry_after(self, ctx) -> float:
+        """Retrieves the amount of seconds before this command can be tried again."""
+        if self._buckets.valid:
+            current = self._invoked_at(ctx)
+            bucket = self._buckets.get_bucket(ctx, current)
+            if bucket is not None:
+                return bucket.get_retry_after(current)
+
+        return 0.0
+
     async def dispatch_error(self, ctx, error: Exception) -> None:
         from .cog import Cog
         ctx.command_failed = True
@@ -111,3 +201,56 @@ class Command:
 
         self.on_error = coro
         return coro
+
+    def autocomplete(self, option: str, *, cache_ttl: float = 0.0):
+        """A decorator that registers a coroutine as the autocomplete handler
+        of one of the command's options.
+
+        The handler is called with the context and the partial value typed so
+        far, and returns up to 25 suggestions as :class:`~discord.Choice`,
+        :class:`str` or ``(name, value)`` tuples. The values of the other
+        options are available in ``ctx.args``. An
+        :class:`AutocompleteIndex` can be used to answer quickly from large
+        choice sets.
+
+        Parameters
+        -----------
+        option: :class:`str`
+            The name of the option to autocomplete.
+        cache_ttl: :class:`float`
+            How long, in seconds, suggestions are reused for an identical query,
+            that is the same typed value with the same values for the other options.
+            Defaults to ``0``, no caching.
+
+        Raises
+        -------
+        TypeError
+            The coroutine passed is not actually a coroutine.
+        ValueError
+            The command has no option with that name.
+        """
+
+        def decorator(coro):
+            if not asyncio.iscoroutinefunction(coro):
+                raise TypeError('The autocomplete handler must be a coroutine.')
+
+            target = _find_option(getattr(self.app_command, 'options', None) or [], option)
+            if target is None:
+                raise ValueError(f'Command {self.name} has no option named {option!r}')
+
+            target.autocomplete = True
+            self.autocompleters[option] = (coro, cache_ttl)
+            return coro
+
+        return decorator
+
+
+def _find_option(options, name):
+    for option in options:
+        if option.type.value in (1, 2):
+            found = _find_option(option.options or [], name)
+            if found is not None:
+                return found
+        elif option.name == name:
+            return option
+    return None
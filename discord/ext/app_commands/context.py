@@ -1,36 +1,82 @@
+import asyncio
 from discord.message import Message
 from discord.enums import try_enum, ApplicationCommandType
-from ...application_commands import ApplicationCommand
 from ...webhook.async_ import _WebhookState, handle_message_parameters, async_context
-from ...errors import InvalidArgument
+from ...errors import HTTPException, InvalidArgument
 from ...interactions import Interaction
 from ...webhook import Webhook
 from ...http import Route
-from ...utils import MISSING
+from ...utils import MISSING, cached_property
+from typing import Optional
 
 class Context:
     def __init__(self, bot, interaction: Interaction):
         self.interaction = interaction
         self.bot = bot
-        self.channel = interaction.channel
-        self.channel_id = interaction.channel_id
-        self.guild = interaction.guild
-        self.guild_id = interaction.guild_id
-        self.author = interaction.user
-        self.permissions = interaction.permissions
         self._data = interaction.data
         self.message = None
+        self.auto_deferred = False
+        self._auto_defer_task: Optional[asyncio.Task] = None
+        # held while the initial response is being made, so a watchdog deferral
+        # and the handler's own response never race each other
+        self._response_lock = asyncio.Lock()
         self.command_type = try_enum(ApplicationCommandType, self._data['type'])
-        self.app_command = ApplicationCommand(state=self.bot._connection, data=self._data)
-        self.command_name = self.app_command.name
-        self.command = bot.all_commands[self.command_name]
-        self.cog = self.command.cog
-        for option in self.app_command.options:
-            if option.type.value in (1, 2):
-                self.command_name += ' ' + option.name
+        # the invoked command is looked up by id, nothing is rebuilt from the payload
+        self.command_name, self.command = bot._resolve_command(self._data)
+        self.cog = self.command.cog if self.command is not None else None
+
+    @property
+    def channel_id(self):
+        return self.interaction.channel_id
+
+    @property
+    def guild_id(self):
+        return self.interaction.guild_id
+
+    @property
+    def author(self):
+        return self.interaction.user
+
+    @cached_property
+    def channel(self):
+        return self.interaction.channel
+
+    @cached_property
+    def guild(self):
+        return self.interaction.guild
+
+    @cached_property
+    def permissions(self):
+        return self.interaction.permissions
+
+    @property
+    def app_command(self):
+        if self.command is None:
+            return None
+        return self.command.app_command
+
+    def _cancel_auto_defer(self) -> None:
+        # only called with the response lock held, so a pending deferral is still waiting for it
+        task = self._auto_defer_task
+        if task is not None and not task.done():
+            task.cancel()
 
     async def defer(self, *, ephemeral: bool = False):
-        await self.interaction.response.defer(ephemeral = ephemeral)
+        async with self._response_lock:
+            if self.auto_deferred:
+                return
+            self._cancel_auto_defer()
+            await self.interaction.response.defer(ephemeral = ephemeral)
+
+    async def _auto_defer(self, ephemeral: bool) -> None:
+        async with self._response_lock:
+            if self.interaction.response.is_done():
+                return
+            try:
+                await self.interaction.response.defer(ephemeral=ephemeral)
+            except HTTPException:
+                return
+            self.auto_deferred = True
 
     async def send(self, content: str = MISSING,
         *,
@@ -43,11 +89,13 @@ class Context:
         allowed_mentions = MISSING,
         view = MISSING,
     ):
-        if not self.interaction.response.is_done():
-            return await self.interaction.response.send_message(
-                content, tts=tts, ephemeral=ephemeral, embed=embed, 
-                embeds=embeds, allowed_mentions=allowed_mentions, view=view
-            )
+        async with self._response_lock:
+            if not self.interaction.response.is_done():
+                self._cancel_auto_defer()
+                return await self.interaction.response.send_message(
+                    content, tts=tts, ephemeral=ephemeral, embed=embed, 
+                    embeds=embeds, allowed_mentions=allowed_mentions, view=view
+                )
         followup: Webhook = self.interaction.followup
         if followup.token is None:
             raise InvalidArgument('This webhook does not have a token associated with it')
@@ -77,7 +125,7 @@ class Context:
         adapter = async_context.get()
         _params = {'wait': int(True)}
         route = Route('POST', '/webhooks/{webhook_id}/{webhook_token}', webhook_id=followup.id, webhook_token=followup.token)
-        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params)
+        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params, priority=followup._priority)
 
         msg = followup._create_message(data)
 
@@ -96,7 +144,7 @@ class Context:
             raise InvalidArgument('This webhook does not have a token associated with it')
         route = Route('DELETE', '/webhooks/{webhook_id}/{webhook_token}/messages/@original', webhook_id=followup.id, webhook_token=followup.token)
         adapter = async_context.get()
-        await adapter.request(route, followup.session)
+        await adapter.request(route, followup.session, priority=followup._priority)
 
     async def edit_message(self, 
         message_id: int,
@@ -132,7 +180,7 @@ class Context:
 
         _params = {'wait': int(True)}
         route = Route('PATCH', '/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}', webhook_id=followup.id, webhook_token=followup.token, message_id=message_id)
-        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params)
+        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params, priority=followup._priority)
 
         msg = followup._create_message(data)
 
@@ -149,7 +197,7 @@ class Context:
             raise InvalidArgument('This webhook does not have a token associated with it')
         route = Route('DELETE', '/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}', webhook_id=followup.id, webhook_token=followup.token, message_id=message_id)
         adapter = async_context.get()
-        await adapter.request(route, followup.session)
+        await adapter.request(route, followup.session, priority=followup._priority)
 
     async def edit(self, 
         *,
@@ -186,7 +234,7 @@ class Context:
 
         _params = {'wait': int(True)}
         route = Route('PATCH', '/webhooks/{webhook_id}/{webhook_token}/messages/@original', webhook_id=followup.id, webhook_token=followup.token)
-        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params)
+        data = await adapter.request(route, followup.session, payload=params.payload, multipart=params.multipart, files=files, params=_params, priority=followup._priority)
 
         msg = followup._create_message(data)
 
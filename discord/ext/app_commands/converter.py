@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+from ...channel import _threaded_guild_channel_factory
+from ...enums import ApplicationCommandOptionType, ChannelType
+from ...errors import InvalidData
+from ...member import Member
+from ...role import Role
+from ...user import User
+
+if TYPE_CHECKING:
+    from ...application_commands import Option
+    from .context import Context
+
+__all__ = (
+    'OptionPlan',
+)
+
+Converter = Callable[[Any, Dict[str, Any], 'Context'], Any]
+
+_SUBCOMMAND_TYPES = (ApplicationCommandOptionType.subcommand.value, ApplicationCommandOptionType.subcommand_group.value)
+
+
+def _resolve_member(key: str, resolved: Dict[str, Any], ctx: Context) -> Any:
+    members = resolved.get('members')
+    if members and key in members:
+        data = dict(members[key])
+        users = resolved.get('users')
+        if users and key in users:
+            data['user'] = users[key]
+        return Member(data=data, guild=ctx.guild, state=ctx.bot._connection)  # type: ignore
+
+    users = resolved.get('users')
+    if users and key in users:
+        return User(data=users[key], state=ctx.bot._connection)
+    return None
+
+
+def _convert_user(value: Any, resolved: Dict[str, Any], ctx: Context) -> Any:
+    user = _resolve_member(str(value), resolved, ctx)
+    return int(value) if user is None else user
+
+
+def _convert_channel(value: Any, resolved: Dict[str, Any], ctx: Context) -> Any:
+    key = str(value)
+    channels = resolved.get('channels')
+    if not channels or key not in channels:
+        return int(value)
+
+    data = channels[key]
+    factory, ch_type = _threaded_guild_channel_factory(data['type'])
+    if factory is None:
+        raise InvalidData('Unknown channel type {type} for channel ID {id}.'.format_map(data))
+    if ch_type in (ChannelType.group, ChannelType.private):
+        raise InvalidData('Channel ID resolved to a private channel')
+    guild_id = data.get('guild_id')
+    if guild_id is not None and int(guild_id) != ctx.guild_id:
+        raise InvalidData('Guild ID resolved to a different guild')
+    return factory(guild=ctx.guild, state=ctx.bot._connection, data=data)  # type: ignore
+
+
+def _convert_role(value: Any, resolved: Dict[str, Any], ctx: Context) -> Any:
+    key = str(value)
+    roles = resolved.get('roles')
+    if not roles or key not in roles:
+        return int(value)
+    return Role(data=roles[key], state=ctx.bot._connection, guild=ctx.guild)  # type: ignore
+
+
+def _convert_mentionable(value: Any, resolved: Dict[str, Any], ctx: Context) -> Any:
+    # mentionable can be a user or a role
+    user = _resolve_member(str(value), resolved, ctx)
+    if user is not None:
+        return user
+    return _convert_role(value, resolved, ctx)
+
+
+_CONVERTERS: Dict[int, Converter] = {
+    ApplicationCommandOptionType.user.value: _convert_user,
+    ApplicationCommandOptionType.channel.value: _convert_channel,
+    ApplicationCommandOptionType.role.value: _convert_role,
+    ApplicationCommandOptionType.mentionable.value: _convert_mentionable,
+}
+
+
+class OptionPlan:
+    """A conversion plan for the options of a slash command.
+
+    The plan is compiled once from the declared options of a command and maps
+    each option name to the converter for its type, so converting the options
+    of an interaction is a single pass over the received values. Options that
+    need no conversion (strings, numbers and booleans) are passed through as is.
+
+    Options nested under subcommands and subcommand groups are compiled per
+    subcommand, so subcommands may declare options with the same name but a
+    different type.
+
+    Parameters
+    -----------
+    options: List[:class:`~discord.Option`]
+        The declared options of the command.
+    """
+
+    __slots__ = ('converters',)
+
+    def __init__(self, options: Iterable[Option]):
+        # subcommand path -> option name -> converter
+        self.converters: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._compile((), options)
+
+    def _compile(self, path: Tuple[str, ...], options: Iterable[Option]) -> None:
+        converters = self.converters.setdefault(path, {})
+        for option in options:
+            option_type = int(getattr(option.type, 'value', option.type))
+            if option_type in _SUBCOMMAND_TYPES:
+                self._compile(path + (option.name,), option.options or ())
+            else:
+                converters[option.name] = _CONVERTERS.get(option_type)
+
+    def convert(self, ctx: Context, options: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Converts the raw options of an interaction into callback arguments.
+
+        Parameters
+        -----------
+        ctx: :class:`Context`
+            The invocation context.
+        options: List[:class:`dict`]
+            The ``options`` of the interaction data.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            A mapping of option name to converted value.
+        """
+        # descend into the invoked subcommand, its options carry the arguments
+        path: Tuple[str, ...] = ()
+        while options and options[0]['type'] in _SUBCOMMAND_TYPES:
+            path += (options[0]['name'],)
+            options = options[0].get('options', ())
+
+        args: Dict[str, Any] = {}
+        if not options:
+            return args
+
+        resolved = ctx._data.get('resolved') or {}
+        converters = self.converters.get(path, {})
+        for option in options:
+            name = option['name']
+            try:
+                converter = converters[name]
+            except KeyError:
+                converter = _CONVERTERS.get(option['type'])
+
+            value = option['value']
+            args[name] = value if converter is None else converter(value, resolved, ctx)
+        return args
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 
-from typing import Any, Callable, Deque, Dict, Optional, Type, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, TypeVar, TYPE_CHECKING, Union
 from discord.enums import Enum
 import time
 import asyncio
+import heapq
+import itertools
 from collections import deque
 
-from ...abc import PrivateChannel
 from .errors import MaxConcurrencyReached
 
 if TYPE_CHECKING:
-    from ...message import Message
+    from ...interactions import Interaction
+    from .context import Context
 
 __all__ = (
     'BucketType',
@@ -33,26 +35,26 @@ class BucketType(Enum):
     category = 5
     role     = 6
 
-    def get_key(self, msg: Message) -> Any:
+    def get_key(self, ctx: Union[Context, Interaction]) -> Any:
+        interaction = getattr(ctx, 'interaction', ctx)
         if self is BucketType.user:
-            return msg.author.id
+            return interaction.user.id
         elif self is BucketType.guild:
-            return (msg.guild or msg.author).id
+            return interaction.guild_id or interaction.user.id
         elif self is BucketType.channel:
-            return msg.channel.id
+            return interaction.channel_id
         elif self is BucketType.member:
-            return ((msg.guild and msg.guild.id), msg.author.id)
+            return (interaction.guild_id, interaction.user.id)
         elif self is BucketType.category:
-            return (msg.channel.category or msg.channel).id  # type: ignore
+            return getattr(interaction.channel, 'category_id', None) or interaction.channel_id
         elif self is BucketType.role:
-            # we return the channel id of a private-channel as there are only roles in guilds
+            # outside of guilds the channel id is used, as there are only roles in guilds
             # and that yields the same result as for a guild with only the @everyone role
-            # NOTE: PrivateChannel doesn't actually have an id attribute but we assume we are
-            # recieving a DMChannel or GroupChannel which inherit from PrivateChannel and do
-            return (msg.channel if isinstance(msg.channel, PrivateChannel) else msg.author.top_role).id  # type: ignore
+            top_role = getattr(interaction.user, 'top_role', None)
+            return interaction.channel_id if top_role is None else top_role.id
 
-    def __call__(self, msg: Message) -> Any:
-        return self.get_key(msg)
+    def __call__(self, ctx: Union[Context, Interaction]) -> Any:
+        return self.get_key(ctx)
 
 
 class Cooldown:
@@ -172,18 +174,23 @@ class CooldownMapping:
     def __init__(
         self,
         original: Optional[Cooldown],
-        type: Callable[[Message], Any],
+        type: Callable[[Context], Any],
     ) -> None:
         if not callable(type):
             raise TypeError('Cooldown type must be a BucketType or callable')
 
         self._cache: Dict[Any, Cooldown] = {}
+        # one (deadline, counter, key) entry per cached bucket, so expired buckets
+        # are found without scanning the whole cache
+        self._expiry: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
         self._cooldown: Optional[Cooldown] = original
-        self._type: Callable[[Message], Any] = type
+        self._type: Callable[[Context], Any] = type
 
     def copy(self) -> CooldownMapping:
         ret = CooldownMapping(self._cooldown, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
         return ret
 
     @property
@@ -191,68 +198,82 @@ class CooldownMapping:
         return self._cooldown is not None
 
     @property
-    def type(self) -> Callable[[Message], Any]:
+    def type(self) -> Callable[[Context], Any]:
         return self._type
 
     @classmethod
     def from_cooldown(cls: Type[C], rate, per, type) -> C:
         return cls(Cooldown(rate, per), type)
 
-    def _bucket_key(self, msg: Message) -> Any:
-        return self._type(msg)
+    def _bucket_key(self, ctx: Context) -> Any:
+        return self._type(ctx)
 
     def _verify_cache_integrity(self, current: Optional[float] = None) -> None:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s and it has not been used in 60s then that key should be deleted
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
-
-    def create_bucket(self, message: Message) -> Cooldown:
+        expiry = self._expiry
+        while expiry and expiry[0][0] < current:
+            _, _, key = heapq.heappop(expiry)
+            bucket = self._cache.get(key)
+            if bucket is None:
+                continue
+            deadline = bucket._last + bucket.per
+            if current > deadline:
+                del self._cache[key]
+            else:
+                # used since the entry was pushed, check again when the new window ends
+                heapq.heappush(expiry, (deadline, next(self._counter), key))
+
+    def create_bucket(self, ctx: Context) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
 
-    def get_bucket(self, message: Message, current: Optional[float] = None) -> Cooldown:
-        if self._type is BucketType.default:
-            return self._cooldown  # type: ignore
+    def get_bucket(self, ctx: Context, current: Optional[float] = None) -> Cooldown:
+        if self._type is BucketType.default and self._cooldown is not None:
+            return self._cooldown
+        # dynamic mappings have no fixed cooldown, their default bucket is
+        # made by the factory and cached under the key None like any other
 
+        current = current or time.time()
         self._verify_cache_integrity(current)
-        key = self._bucket_key(message)
-        if key not in self._cache:
-            bucket = self.create_bucket(message)
+        key = self._bucket_key(ctx)
+        try:
+            bucket = self._cache[key]
+        except KeyError:
+            bucket = self.create_bucket(ctx)
             if bucket is not None:
                 self._cache[key] = bucket
-        else:
-            bucket = self._cache[key]
+                heapq.heappush(self._expiry, (current + bucket.per, next(self._counter), key))
 
         return bucket
 
-    def update_rate_limit(self, message: Message, current: Optional[float] = None) -> Optional[float]:
-        bucket = self.get_bucket(message, current)
+    def update_rate_limit(self, ctx: Context, current: Optional[float] = None) -> Optional[float]:
+        bucket = self.get_bucket(ctx, current)
         return bucket.update_rate_limit(current)
 
 class DynamicCooldownMapping(CooldownMapping):
 
     def __init__(
         self,
-        factory: Callable[[Message], Cooldown],
-        type: Callable[[Message], Any]
+        factory: Callable[[Context], Cooldown],
+        type: Callable[[Context], Any]
     ) -> None:
         super().__init__(None, type)
-        self._factory: Callable[[Message], Cooldown] = factory
+        self._factory: Callable[[Context], Cooldown] = factory
 
     def copy(self) -> DynamicCooldownMapping:
         ret = DynamicCooldownMapping(self._factory, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
         return ret
 
     @property
     def valid(self) -> bool:
         return True
 
-    def create_bucket(self, message: Message) -> Cooldown:
-        return self._factory(message)
+    def create_bucket(self, ctx: Context) -> Cooldown:
+        return self._factory(ctx)
 
 class _Semaphore:
     """This class is a version of a semaphore.
@@ -334,11 +355,11 @@ class MaxConcurrency:
     def __repr__(self) -> str:
         return f'<MaxConcurrency per={self.per!r} number={self.number} wait={self.wait}>'
 
-    def get_key(self, message: Message) -> Any:
-        return self.per.get_key(message)
+    def get_key(self, ctx: Context) -> Any:
+        return self.per.get_key(ctx)
 
-    async def acquire(self, message: Message) -> None:
-        key = self.get_key(message)
+    async def acquire(self, ctx: Context) -> None:
+        key = self.get_key(ctx)
 
         try:
             sem = self._mapping[key]
@@ -349,10 +370,10 @@ class MaxConcurrency:
         if not acquired:
             raise MaxConcurrencyReached(self.number, self.per)
 
-    async def release(self, message: Message) -> None:
+    async def release(self, ctx: Context) -> None:
         # Technically there's no reason for this function to be async
         # But it might be more useful in the future
-        key = self.get_key(message)
+        key = self.get_key(ctx)
 
         try:
             sem = self._mapping[key]
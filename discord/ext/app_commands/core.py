@@ -3,13 +3,14 @@ import discord
 import functools
 import inspect
 from .commands import Command
+from .cooldown import BucketType, Cooldown, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
 from .errors import CheckAnyFailure, CheckFailure, CommandNotFound, CommandError
 from ...role import Role
 from ...channel import _threaded_guild_channel_factory
 from ...errors import InvalidData
 from ...user import User
 from ...member import Member
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from ...application_commands import ApplicationCommandPermission, Option, PartialApplicationCommand, Subcommand, SubcommandGroup
 from ...enums import ApplicationCommandOptionType, ApplicationCommandPermissionType, ApplicationCommandType, ChannelType
 from .context import Context
@@ -134,3 +135,56 @@ def permissions(
         return func
 
     return decorator
+
+def cooldown(rate: int, per: float, type: Union[BucketType, Callable[[Context], Any]] = BucketType.default):
+    """
+    Adds a cooldown to a command.
+    When it is triggered, CommandOnCooldown is sent to the error handlers.
+    """
+
+    def decorator(func):
+        if isinstance(func, Command):
+            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+        else:
+            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)
+
+        return func
+
+    return decorator
+
+def dynamic_cooldown(cooldown: Callable[[Context], Optional[Cooldown]], type: BucketType = BucketType.default):
+    """
+    Adds a cooldown to a command, chosen per invocation by a function taking the context.
+    Returning None bypasses the cooldown for that invocation.
+    The function is called when a bucket is created, so with the default type it picks
+    the cooldown shared by every invocation until that bucket expires.
+    """
+    if not callable(cooldown):
+        raise TypeError("A callable must be provided")
+
+    def decorator(func):
+        if isinstance(func, Command):
+            func._buckets = DynamicCooldownMapping(cooldown, type)
+        else:
+            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)
+
+        return func
+
+    return decorator
+
+def max_concurrency(number: int, per: BucketType = BucketType.default, *, wait: bool = False):
+    """
+    Limits how many invocations of a command can run at the same time.
+    When the limit is reached and wait is False, MaxConcurrencyReached is sent to the error handlers.
+    """
+
+    def decorator(func):
+        value = MaxConcurrency(number, per=per, wait=wait)
+        if isinstance(func, Command):
+            func._max_concurrency = value
+        else:
+            func.__commands_max_concurrency__ = value
+
+        return func
+
+    return decorator
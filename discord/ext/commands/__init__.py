@@ -17,3 +17,4 @@ from .converter import *
 from .cooldowns import *
 from .cog import *
 from .flags import *
+from discord.ext.offload import *
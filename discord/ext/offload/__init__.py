@@ -0,0 +1,383 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import discord
+from discord.errors import DiscordException
+
+__all__ = (
+    'CommandExecutor',
+    'ExecutorMetrics',
+    'ExecutorQueueFull',
+    'OffloadedContext',
+    'offload',
+)
+
+T = TypeVar('T')
+
+# offloaded functions by '<module>:<qualname>', so worker processes can find
+# them even though the module attribute now holds the command
+_offloaded: Dict[str, Callable[..., Any]] = {}
+
+
+def _call_offloaded(key: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    try:
+        func = _offloaded[key]
+    except KeyError:
+        # a freshly spawned worker, importing the module registers the function
+        importlib.import_module(key.partition(':')[0])
+        func = _offloaded[key]
+    return func(*args, **kwargs)
+
+
+class ExecutorQueueFull(DiscordException):
+    """Exception raised when an offloaded command is invoked while the queue
+    of its :class:`CommandExecutor` is full.
+
+    Attributes
+    ------------
+    executor: :class:`CommandExecutor`
+        The executor that rejected the invocation.
+    """
+
+    def __init__(self, executor: CommandExecutor) -> None:
+        self.executor: CommandExecutor = executor
+        super().__init__('This command is busy. Try again later.')
+
+
+class ExecutorMetrics:
+    """Counters describing the work done by a :class:`CommandExecutor`.
+
+    Attributes
+    -----------
+    submitted: :class:`int`
+        The number of calls accepted by the executor.
+    completed: :class:`int`
+        The number of calls that returned.
+    failed: :class:`int`
+        The number of calls that raised.
+    rejected: :class:`int`
+        The number of calls rejected because the queue was full.
+    pending: :class:`int`
+        The number of calls queued or running.
+    total_time: :class:`float`
+        The seconds spent by finished calls, from submission to result.
+    """
+
+    __slots__ = ('submitted', 'completed', 'failed', 'rejected', 'pending', 'total_time')
+
+    def __init__(self) -> None:
+        self.submitted: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self.rejected: int = 0
+        self.pending: int = 0
+        self.total_time: float = 0.0
+
+    def __repr__(self) -> str:
+        attrs = ' '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'<ExecutorMetrics {attrs}>'
+
+    @property
+    def average_time(self) -> float:
+        """:class:`float`: The average seconds a finished call took, including queueing."""
+        finished = self.completed + self.failed
+        return self.total_time / finished if finished else 0.0
+
+
+class CommandExecutor:
+    """A thread or process pool that runs offloaded command handlers away from
+    the event loop.
+
+    Calls beyond ``max_workers + max_queue`` in flight are rejected with
+    :exc:`ExecutorQueueFull` instead of piling up, so a burst of heavy commands
+    cannot exhaust memory or delay other commands indefinitely.
+
+    Parameters
+    -----------
+    max_workers: Optional[:class:`int`]
+        The number of workers. Defaults to the default of the underlying
+        :mod:`concurrent.futures` executor.
+    process: :class:`bool`
+        Whether to run calls in worker processes instead of threads. Process
+        workers are not limited by the GIL, but offloaded functions, their
+        arguments and their results must be picklable.
+    max_queue: Optional[:class:`int`]
+        The number of calls allowed to wait for a free worker. ``None`` means
+        unbounded.
+
+    Attributes
+    -----------
+    metrics: :class:`ExecutorMetrics`
+        The counters of this executor.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, *, process: bool = False, max_queue: Optional[int] = None) -> None:
+        self.max_workers: Optional[int] = max_workers
+        self.process: bool = process
+        self.max_queue: Optional[int] = max_queue
+        self.metrics: ExecutorMetrics = ExecutorMetrics()
+        self._executor: Optional[Executor] = None
+
+    def __repr__(self) -> str:
+        kind = 'process' if self.process else 'thread'
+        return f'<CommandExecutor {kind} max_workers={self.max_workers} max_queue={self.max_queue} pending={self.metrics.pending}>'
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.process:
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='discord.ext.offload')
+        return self._executor
+
+    def _capacity(self) -> Optional[int]:
+        if self.max_queue is None:
+            return None
+        executor = self._get_executor()
+        workers = self.max_workers or getattr(executor, '_max_workers', 1)
+        return workers + self.max_queue
+
+    def is_full(self) -> bool:
+        """:class:`bool`: Whether a new call would be rejected."""
+        capacity = self._capacity()
+        return capacity is not None and self.metrics.pending >= capacity
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        r"""|coro|
+
+        Runs a function in the pool and waits for its result.
+
+        Parameters
+        -----------
+        func: Callable[..., Any]
+            The function to run.
+        \*args
+            The positional arguments to call it with.
+        \*\*kwargs
+            The keyword arguments to call it with.
+
+        Raises
+        -------
+        ExecutorQueueFull
+            Too many calls are already queued.
+
+        Returns
+        --------
+        Any
+            The return value of the function.
+        """
+        metrics = self.metrics
+        if self.is_full():
+            metrics.rejected += 1
+            raise ExecutorQueueFull(self)
+
+        metrics.submitted += 1
+        metrics.pending += 1
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+        except Exception:
+            metrics.failed += 1
+            raise
+        else:
+            metrics.completed += 1
+            return result
+        finally:
+            metrics.pending -= 1
+            metrics.total_time += time.perf_counter() - start
+
+    def close(self, *, wait: bool = True) -> None:
+        """Shuts the pool down.
+
+        Parameters
+        -----------
+        wait: :class:`bool`
+            Whether to wait for running calls to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+class OffloadedContext:
+    """A picklable snapshot of an invocation context, passed to offloaded
+    functions that run in a process pool.
+
+    Attributes
+    -----------
+    command_name: :class:`str`
+        The name of the invoked command.
+    author_id: :class:`int`
+        The ID of the invoking user.
+    channel_id: Optional[:class:`int`]
+        The ID of the channel the command was invoked in.
+    guild_id: Optional[:class:`int`]
+        The ID of the guild the command was invoked in.
+    """
+
+    __slots__ = ('command_name', 'author_id', 'channel_id', 'guild_id')
+
+    def __init__(self, command_name: str, author_id: int, channel_id: Optional[int], guild_id: Optional[int]) -> None:
+        self.command_name: str = command_name
+        self.author_id: int = author_id
+        self.channel_id: Optional[int] = channel_id
+        self.guild_id: Optional[int] = guild_id
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_context(cls, ctx: Any) -> OffloadedContext:
+        channel = getattr(ctx, 'channel', None)
+        guild = getattr(ctx, 'guild', None)
+        return cls(
+            command_name=str(ctx.command),
+            author_id=ctx.author.id,
+            channel_id=getattr(ctx, 'channel_id', None) or getattr(channel, 'id', None),
+            guild_id=getattr(ctx, 'guild_id', None) or getattr(guild, 'id', None),
+        )
+
+
+_default_executor: Optional[CommandExecutor] = None
+
+
+def _get_default_executor() -> CommandExecutor:
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = CommandExecutor()
+    return _default_executor
+
+
+def _is_context(obj: Any) -> bool:
+    # only modules that are already imported can have created the context,
+    # looking them up this way avoids importing either extension from here
+    for name in ('discord.ext.commands.context', 'discord.ext.app_commands.context'):
+        module = sys.modules.get(name)
+        if module is not None and isinstance(obj, module.Context):
+            return True
+    return False
+
+
+async def _send_result(ctx: Any, result: Any) -> None:
+    if result is None:
+        return
+
+    if isinstance(result, dict):
+        kwargs = result
+    elif isinstance(result, discord.File):
+        kwargs = {'file': result}
+    elif isinstance(result, discord.Embed):
+        kwargs = {'embed': result}
+    else:
+        kwargs = {'content': str(result)}
+
+    interaction = getattr(ctx, 'interaction', None)
+    if interaction is not None and ('file' in kwargs or 'files' in kwargs) and not interaction.response.is_done():
+        # files can only be sent through the followup webhook
+        await ctx.defer()
+
+    await ctx.send(**kwargs)
+
+
+def offload(executor: Optional[CommandExecutor] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """A decorator that turns a synchronous function into a command callback
+    that runs in a :class:`CommandExecutor`, off the event loop.
+
+    This is meant for CPU-bound handlers such as image generation, which
+    would otherwise block the gateway for every other command and shard.
+    It works with both ``discord.ext.commands`` and ``discord.ext.app_commands``
+    commands, which re-export it, and must be applied below the command
+    decorator.
+
+    The function is declared like a regular command callback and its
+    return value is sent with ``ctx.send``:
+
+    - ``None`` sends nothing.
+    - A :class:`dict` is passed as keyword arguments.
+    - A :class:`discord.File` or :class:`discord.Embed` is sent as such.
+    - Anything else is sent as text.
+
+    In a thread pool the function receives the real context, but it must not
+    call its coroutine methods. In a process pool it receives an
+    :class:`OffloadedContext` instead, and it must be a module level function
+    of an importable module. Its arguments and return value must also be
+    picklable.
+
+    Example
+    ---------
+
+    .. code-block:: python3
+
+        renderer = commands.CommandExecutor(4, process=True, max_queue=16)
+
+        @bot.command()
+        @commands.offload(renderer)
+        def render(ctx, text: str):
+            return discord.File(make_image(text), filename='render.png')
+
+    Parameters
+    -----------
+    executor: Optional[:class:`CommandExecutor`]
+        The pool to run in. Defaults to a shared thread pool.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(func):
+            raise TypeError('Offloaded functions must not be coroutines.')
+
+        key = f'{func.__module__}:{func.__qualname__}'
+        _offloaded[key] = func
+
+        @functools.wraps(func)
+        async def callback(*args: Any, **kwargs: Any) -> None:
+            pool = executor or _get_default_executor()
+            # callbacks are called with (ctx, ...) or (cog, ctx, ...)
+            index = 0 if _is_context(args[0]) else 1
+            ctx = args[index]
+            if pool.process:
+                if index:
+                    raise TypeError('Cog commands cannot be offloaded to a process pool.')
+                result = await pool.run(_call_offloaded, key, (OffloadedContext.from_context(ctx), *args[1:]), kwargs)
+            else:
+                result = await pool.run(func, *args, **kwargs)
+            await _send_result(ctx, result)
+
+        return callback
+
+    return decorator
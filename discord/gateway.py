@@ -285,6 +285,8 @@ class DiscordWebSocket:
         self._buffer = bytearray()
         self._close_code = None
         self._rate_limiter = GatewayRatelimiter()
+        self._event_sink = None
+        self._event_stats = None
 
     @property
     def open(self):
@@ -323,6 +325,8 @@ class DiscordWebSocket:
         ws.session_id = session
         ws.sequence = sequence
         ws._max_heartbeat_timeout = client._connection.heartbeat_timeout
+        ws._event_sink = client._event_sink
+        ws._event_stats = client._event_stats
 
         if client._enable_debug_events:
             ws.send = ws.debug_send
@@ -430,6 +434,12 @@ class DiscordWebSocket:
             self._buffer = bytearray()
 
         self.log_receive(msg)
+        stats = self._event_stats
+        if stats is not None:
+            received = time.perf_counter()
+            # the size of the decompressed JSON text in bytes
+            size = len(msg) if msg.isascii() else len(msg.encode('utf-8'))
+
         msg = utils._from_json(msg)
 
         _log.debug('For Shard ID %s: WebSocket Event: %s', self.shard_id, msg)
@@ -504,12 +514,22 @@ class DiscordWebSocket:
             _log.info('Shard ID %s has successfully RESUMED session %s under trace %s.',
                      self.shard_id, self.session_id, ', '.join(trace))
 
+        if self._event_sink is not None:
+            pending = self._event_sink.publish(self.shard_id, msg)
+            if pending is not None:
+                await pending
+
         try:
             func = self._discord_parsers[event]
         except KeyError:
             _log.debug('Unknown event %s.', event)
         else:
-            func(data)
+            if stats is None:
+                pending = func(data)
+            else:
+                pending = stats._record_parse(event, func, data, size, received)
+            if pending is not None:
+                await pending
 
         # remove the dispatched listeners
         removed = []
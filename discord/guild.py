@@ -29,8 +29,10 @@ from discord.application_commands import ApplicationCommand, ApplicationCommandP
 import unicodedata
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Sequence,
@@ -77,6 +79,7 @@ from .stage_instance import StageInstance
 from .threads import Thread, ThreadMember
 from .sticker import GuildSticker
 from .file import File
+from .bulk import BulkMemberResult, _run_bulk_member_operation
 
 
 __all__ = (
@@ -92,6 +95,8 @@ if TYPE_CHECKING:
         Thread as ThreadPayload,
     )
     from .types.voice import GuildVoiceState
+    from .types.member import MemberWithUser as MemberWithUserPayload
+    from .types.activity import PartialPresenceUpdate
     from .permissions import Permissions
     from .channel import VoiceChannel, StageChannel, TextChannel, CategoryChannel, StoreChannel
     from .template import Template
@@ -448,13 +453,7 @@ class Guild(Hashable):
             stage_instance = StageInstance(guild=self, data=s, state=state)
             self._stage_instances[stage_instance.id] = stage_instance
 
-        cache_joined = self._state.member_cache_flags.joined
-        self_id = self._state.self_id
-        for mdata in guild.get('members', []):
-            member = Member(data=mdata, guild=self, state=state)
-            if cache_joined or member.id == self_id:
-                self._add_member(member)
-
+        self._load_members(guild.get('members', []))
         self._sync(guild)
         self._large: Optional[bool] = None if member_count is None else self._member_count >= 250
 
@@ -464,6 +463,23 @@ class Guild(Hashable):
         for obj in guild.get('voice_states', []):
             self._update_voice_state(obj, int(obj['channel_id']))
 
+    def _load_members(self, members: Sequence[MemberWithUserPayload], /) -> None:
+        state = self._state
+        cache_joined = state.member_cache_flags.joined
+        self_id = state.self_id
+        for mdata in members:
+            member = Member(data=mdata, guild=self, state=state)
+            if cache_joined or member.id == self_id:
+                self._add_member(member)
+
+    def _load_presences(self, presences: Sequence[PartialPresenceUpdate], /) -> None:
+        empty_tuple = tuple()
+        for presence in presences:
+            user_id = int(presence['user']['id'])
+            member = self.get_member(user_id)
+            if member is not None:
+                member._presence_update(presence, empty_tuple)  # type: ignore
+
     # TODO: refactor/remove?
     def _sync(self, data: GuildPayload) -> None:
         try:
@@ -471,12 +487,7 @@ class Guild(Hashable):
         except KeyError:
             pass
 
-        empty_tuple = tuple()
-        for presence in data.get('presences', []):
-            user_id = int(presence['user']['id'])
-            member = self.get_member(user_id)
-            if member is not None:
-                member._presence_update(presence, empty_tuple)  # type: ignore
+        self._load_presences(data.get('presences', []))
 
         if 'channels' in data:
             channels = data['channels']
@@ -1633,7 +1644,9 @@ class Guild(Hashable):
         return threads
 
     # TODO: Remove Optional typing here when async iterators are refactored
-    def fetch_members(self, *, limit: int = 1000, after: Optional[SnowflakeTime] = None) -> MemberIterator:
+    def fetch_members(
+        self, *, limit: int = 1000, after: Optional[SnowflakeTime] = None, prefetch: int = 0
+    ) -> MemberIterator:
         """Retrieves an :class:`.AsyncIterator` that enables receiving the guild's members. In order to use this,
         :meth:`Intents.members` must be enabled.
 
@@ -1654,6 +1667,12 @@ class Guild(Hashable):
             Retrieve members after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages of 1000 members to fetch in the background while the
+            current page is being consumed, at the cost of keeping up to ``prefetch``
+            extra pages in memory. Defaults to ``0``.
+
+            .. versionadded:: 2.0
 
         Raises
         ------
@@ -1684,7 +1703,7 @@ class Guild(Hashable):
         if not self._state._intents.members:
             raise ClientException('Intents.members must be enabled to use this.')
 
-        return MemberIterator(self, limit=limit, after=after)
+        return MemberIterator(self, limit=limit, after=after, prefetch=prefetch)
 
     async def fetch_member(self, member_id: int, /) -> Member:
         """|coro|
@@ -2212,6 +2231,280 @@ class Guild(Hashable):
         )
         return data['pruned']
 
+    async def bulk_add_roles(
+        self,
+        members: Iterable[Snowflake],
+        *roles: Snowflake,
+        atomic: bool = True,
+        reason: Optional[str] = None,
+        concurrency: int = 4,
+        stop_on_error: bool = False,
+        progress: Optional[Callable[[BulkMemberResult], Any]] = None,
+    ) -> BulkMemberResult:
+        r"""|coro|
+
+        Gives a number of :class:`Role`\s to many members.
+
+        Requests are sent with :attr:`RequestPriority.bulk` as fast as the rate
+        limits allow. Cached members that already have every role are skipped.
+
+        You must have the :attr:`~Permissions.manage_roles` permission to
+        use this.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        members: Iterable[:class:`abc.Snowflake`]
+            The members to give the roles to.
+        \*roles: :class:`abc.Snowflake`
+            An argument list of :class:`abc.Snowflake` representing a :class:`Role`
+            to give to the members.
+        atomic: :class:`bool`
+            Whether to add every role with its own request, see :meth:`Member.add_roles`.
+            If ``False``, cached members are updated with a single request each.
+        reason: Optional[:class:`str`]
+            The reason for doing this action. Shows up on the audit log.
+        concurrency: :class:`int`
+            The number of members processed at the same time. Requests to the
+            same rate limit bucket are still sent one after another, this only
+            keeps the next request ready as soon as the bucket allows it. Adding
+            or removing a single role and editing a member are separate buckets.
+            Defaults to ``4``.
+        stop_on_error: :class:`bool`
+            Whether to stop processing members after the first failure. The
+            members that were not processed are found in :attr:`BulkMemberResult.pending`.
+        progress: Optional[Callable[[:class:`BulkMemberResult`], Any]]
+            A function or coroutine called with the current result every time
+            a member has been processed.
+
+        Raises
+        -------
+        ValueError
+            ``concurrency`` is not greater than 0.
+
+        Returns
+        --------
+        :class:`BulkMemberResult`
+            The outcome of the operation. Errors raised while updating a member
+            are collected in :attr:`BulkMemberResult.failed` instead of being raised.
+        """
+
+        http = self._state.http
+        role_ids = [role.id for role in roles]
+
+        async def add_roles(member_id: int) -> bool:
+            member = self.get_member(member_id)
+            if member is None:
+                missing = role_ids
+            else:
+                missing = [role_id for role_id in role_ids if not member._roles.has(role_id)]
+                if not missing:
+                    return False
+
+            if atomic or member is None:
+                for role_id in missing:
+                    await http.add_role(self.id, member_id, role_id, reason=reason)
+            else:
+                await http.edit_member(self.id, member_id, reason=reason, roles=[*member._roles, *missing])
+            return True
+
+        return await _run_bulk_member_operation(
+            self._state,
+            members,
+            add_roles,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+            progress=progress,
+        )
+
+    async def bulk_remove_roles(
+        self,
+        members: Iterable[Snowflake],
+        *roles: Snowflake,
+        atomic: bool = True,
+        reason: Optional[str] = None,
+        concurrency: int = 4,
+        stop_on_error: bool = False,
+        progress: Optional[Callable[[BulkMemberResult], Any]] = None,
+    ) -> BulkMemberResult:
+        r"""|coro|
+
+        Removes a number of :class:`Role`\s from many members.
+
+        Requests are sent with :attr:`RequestPriority.bulk` as fast as the rate
+        limits allow. Cached members that have none of the roles are skipped.
+
+        You must have the :attr:`~Permissions.manage_roles` permission to
+        use this.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        members: Iterable[:class:`abc.Snowflake`]
+            The members to remove the roles from.
+        \*roles: :class:`abc.Snowflake`
+            An argument list of :class:`abc.Snowflake` representing a :class:`Role`
+            to remove from the members.
+        atomic: :class:`bool`
+            Whether to remove every role with its own request, see :meth:`Member.remove_roles`.
+            If ``False``, cached members are updated with a single request each.
+        reason: Optional[:class:`str`]
+            The reason for doing this action. Shows up on the audit log.
+        concurrency: :class:`int`
+            The number of members processed at the same time. Requests to the
+            same rate limit bucket are still sent one after another, this only
+            keeps the next request ready as soon as the bucket allows it. Adding
+            or removing a single role and editing a member are separate buckets.
+            Defaults to ``4``.
+        stop_on_error: :class:`bool`
+            Whether to stop processing members after the first failure. The
+            members that were not processed are found in :attr:`BulkMemberResult.pending`.
+        progress: Optional[Callable[[:class:`BulkMemberResult`], Any]]
+            A function or coroutine called with the current result every time
+            a member has been processed.
+
+        Raises
+        -------
+        ValueError
+            ``concurrency`` is not greater than 0.
+
+        Returns
+        --------
+        :class:`BulkMemberResult`
+            The outcome of the operation. Errors raised while updating a member
+            are collected in :attr:`BulkMemberResult.failed` instead of being raised.
+        """
+
+        http = self._state.http
+        role_ids = [role.id for role in roles]
+
+        async def remove_roles(member_id: int) -> bool:
+            member = self.get_member(member_id)
+            if member is None:
+                present = role_ids
+            else:
+                present = [role_id for role_id in role_ids if member._roles.has(role_id)]
+                if not present:
+                    return False
+
+            if atomic or member is None:
+                for role_id in present:
+                    await http.remove_role(self.id, member_id, role_id, reason=reason)
+            else:
+                kept = [role_id for role_id in member._roles if role_id not in present]
+                await http.edit_member(self.id, member_id, reason=reason, roles=kept)
+            return True
+
+        return await _run_bulk_member_operation(
+            self._state,
+            members,
+            remove_roles,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+            progress=progress,
+        )
+
+    async def bulk_edit_members(
+        self,
+        members: Iterable[Snowflake],
+        *,
+        nick: Optional[str] = MISSING,
+        mute: bool = MISSING,
+        deafen: bool = MISSING,
+        roles: List[Snowflake] = MISSING,
+        reason: Optional[str] = None,
+        concurrency: int = 4,
+        stop_on_error: bool = False,
+        progress: Optional[Callable[[BulkMemberResult], Any]] = None,
+    ) -> BulkMemberResult:
+        """|coro|
+
+        Edits many members at once, see :meth:`Member.edit`.
+
+        Requests are sent with :attr:`RequestPriority.bulk` as fast as the rate
+        limits allow. Fields that already have the requested value on a cached
+        member are not sent, members without any change are skipped.
+
+        Discord rejects ``mute`` and ``deafen`` for members that are not connected
+        to a voice channel, so these are only sent to members with a cached voice
+        state. This requires :attr:`Intents.voice_states`, without it they are sent
+        to every member.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        members: Iterable[:class:`abc.Snowflake`]
+            The members to edit.
+        nick: Optional[:class:`str`]
+            The members' new nickname. Use ``None`` to remove the nickname.
+        mute: :class:`bool`
+            Indicates if the members should be guild muted or un-muted.
+        deafen: :class:`bool`
+            Indicates if the members should be guild deafened or un-deafened.
+        roles: List[:class:`Role`]
+            The members' new list of roles. This *replaces* the roles.
+        reason: Optional[:class:`str`]
+            The reason for doing this action. Shows up on the audit log.
+        concurrency: :class:`int`
+            The number of members processed at the same time. Requests to the
+            same rate limit bucket are still sent one after another, this only
+            keeps the next request ready as soon as the bucket allows it. Adding
+            or removing a single role and editing a member are separate buckets.
+            Defaults to ``4``.
+        stop_on_error: :class:`bool`
+            Whether to stop processing members after the first failure. The
+            members that were not processed are found in :attr:`BulkMemberResult.pending`.
+        progress: Optional[Callable[[:class:`BulkMemberResult`], Any]]
+            A function or coroutine called with the current result every time
+            a member has been processed.
+
+        Raises
+        -------
+        ValueError
+            ``concurrency`` is not greater than 0.
+
+        Returns
+        --------
+        :class:`BulkMemberResult`
+            The outcome of the operation. Errors raised while updating a member
+            are collected in :attr:`BulkMemberResult.failed` instead of being raised.
+        """
+
+        http = self._state.http
+        role_ids = MISSING if roles is MISSING else {role.id for role in roles}
+        tracks_voice = self._state._intents.voice_states
+
+        async def edit(member_id: int) -> bool:
+            member = self.get_member(member_id)
+            voice = self._voice_state_for(member_id)
+            in_voice = voice is not None and voice.channel is not None
+            payload: Dict[str, Any] = {}
+            if nick is not MISSING and (member is None or member.nick != (nick or None)):
+                payload['nick'] = nick or ''
+            if mute is not MISSING and (in_voice or not tracks_voice) and (voice is None or voice.mute != mute):
+                payload['mute'] = mute
+            if deafen is not MISSING and (in_voice or not tracks_voice) and (voice is None or voice.deaf != deafen):
+                payload['deaf'] = deafen
+            if role_ids is not MISSING and (member is None or set(member._roles) != role_ids):
+                payload['roles'] = list(role_ids)
+
+            if not payload:
+                return False
+            await http.edit_member(self.id, member_id, reason=reason, **payload)
+            return True
+
+        return await _run_bulk_member_operation(
+            self._state,
+            members,
+            edit,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+            progress=progress,
+        )
+
     async def templates(self) -> List[Template]:
         """|coro|
 
@@ -3023,6 +3316,7 @@ class Guild(Hashable):
         oldest_first: Optional[bool] = None,
         user: Snowflake = None,
         action: AuditLogAction = None,
+        prefetch: int = 0,
     ) -> AuditLogIterator:
         """Returns an :class:`AsyncIterator` that enables receiving the guild's audit logs.
 
@@ -3065,6 +3359,12 @@ class Guild(Hashable):
             The moderator to filter entries from.
         action: :class:`AuditLogAction`
             The action to filter with.
+        prefetch: :class:`int`
+            The number of pages of 100 entries to fetch in the background while the
+            current page is being consumed, at the cost of keeping up to ``prefetch``
+            extra pages in memory. Defaults to ``0``.
+
+            .. versionadded:: 2.0
 
         Raises
         -------
@@ -3087,7 +3387,14 @@ class Guild(Hashable):
             action = action.value
 
         return AuditLogIterator(
-            self, before=before, after=after, limit=limit, oldest_first=oldest_first, user_id=user_id, action_type=action
+            self,
+            before=before,
+            after=after,
+            limit=limit,
+            oldest_first=oldest_first,
+            user_id=user_id,
+            action_type=action,
+            prefetch=prefetch,
         )
 
     async def widget(self) -> Widget:
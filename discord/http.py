@@ -25,18 +25,34 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+import contextlib
+import contextvars
+import copy
+import hashlib
+import heapq
+import itertools
+import io
 import json
 import logging
+import os
 import sys
+import tempfile
+import time
 from typing import (
     Any,
+    AsyncIterator,
+    Callable,
     ClassVar,
     Coroutine,
     Dict,
+    Iterator,
+    FrozenSet,
     Iterable,
     List,
     Optional,
     Sequence,
+    Set,
     TYPE_CHECKING,
     Tuple,
     Type,
@@ -48,9 +64,11 @@ import weakref
 
 import aiohttp
 
+from .enums import RequestPriority
 from .errors import HTTPException, Forbidden, NotFound, LoginFailure, DiscordServerError, GatewayNotFound, InvalidArgument
 from .gateway import DiscordClientWebSocketResponse
 from . import __version__, utils
+from .stats import RequestTrace
 from .utils import MISSING
 
 _log = logging.getLogger(__name__)
@@ -124,9 +142,20 @@ class Route:
         self.webhook_id: Optional[Snowflake] = parameters.get('webhook_id')
         self.webhook_token: Optional[str] = parameters.get('webhook_token')
 
+    @property
+    def priority(self) -> Optional[RequestPriority]:
+        # interaction tokens expire quickly so their routes always go first,
+        # the webhook adapter names these parameters webhook_id and webhook_token
+        path = self.path
+        if '{interaction_token}' in path or path.startswith('/interactions/') or path.endswith('/@original'):
+            return RequestPriority.interaction
+        return None
+
     @property
     def bucket(self) -> str:
         # the bucket is just method + path w/ major parameters
+        if self.webhook_id is not None:
+            return f'{self.webhook_id}:{self.webhook_token}:{self.path}'
         return f'{self.channel_id}:{self.guild_id}:{self.path}'
 
 
@@ -151,6 +180,385 @@ class MaybeUnlock:
             self.lock.release()
 
 
+_request_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    '_request_priority', default=RequestPriority.normal
+)
+_waiter_ids = itertools.count()
+PRIORITY_AGING: float = 2.0
+
+
+def _waiter_key(priority: RequestPriority) -> Tuple[float, int]:
+    # a waiter one priority class lower is let through first once it has
+    # been waiting PRIORITY_AGING seconds longer, this keeps bulk work from
+    # being starved while still sending interaction traffic ahead of it
+    return (time.monotonic() + priority.value * PRIORITY_AGING, next(_waiter_ids))
+
+
+class PriorityLock:
+    """An :class:`asyncio.Lock` that is handed to its waiters by priority
+    rather than in the order they started waiting."""
+
+    def __init__(self) -> None:
+        self._locked: bool = False
+        self._waiters: List[Tuple[Tuple[float, int], asyncio.Future[None]]] = []
+
+    def locked(self) -> bool:
+        return self._locked
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.normal) -> bool:
+        if not self._locked:
+            self._locked = True
+            return True
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (_waiter_key(priority), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the lock was handed over right as we got cancelled
+                self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        if not self._locked:
+            raise RuntimeError('Lock is not acquired.')
+
+        # ownership is passed directly to the next waiter
+        while self._waiters:
+            _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._locked = False
+
+
+class PriorityEvent:
+    """An :class:`asyncio.Event` whose waiters are woken up by priority."""
+
+    def __init__(self) -> None:
+        self._value: bool = False
+        self._waiters: List[Tuple[Tuple[float, int], asyncio.Future[None]]] = []
+
+    def is_set(self) -> bool:
+        return self._value
+
+    def set(self) -> None:
+        self._value = True
+        # waiters resume in the order their futures are resolved
+        while self._waiters:
+            _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+
+    def clear(self) -> None:
+        self._value = False
+
+    async def wait(self, priority: RequestPriority = RequestPriority.normal) -> bool:
+        if self._value:
+            return True
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (_waiter_key(priority), future))
+        await future
+        return True
+
+
+async def _trace_request_start(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace._attempt_started = time.perf_counter()
+
+
+async def _trace_request_end(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace.ttfb += time.perf_counter() - trace._attempt_started
+
+
+async def _trace_dns_start(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace._dns_started = time.perf_counter()
+
+
+async def _trace_dns_end(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace.dns += time.perf_counter() - trace._dns_started
+
+
+async def _trace_connection_start(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace._connect_started = time.perf_counter()
+
+
+async def _trace_connection_end(session: Any, ctx: Any, params: Any) -> None:
+    trace: Optional[RequestTrace] = ctx.trace_request_ctx
+    if trace is not None:
+        trace.connect += time.perf_counter() - trace._connect_started
+
+
+def _create_trace_config() -> aiohttp.TraceConfig:
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_trace_request_start)
+    config.on_request_end.append(_trace_request_end)
+    config.on_dns_resolvehost_start.append(_trace_dns_start)
+    config.on_dns_resolvehost_end.append(_trace_dns_end)
+    config.on_connection_create_start.append(_trace_connection_start)
+    config.on_connection_create_end.append(_trace_connection_end)
+    return config
+
+
+class _LeaderCancelled(Exception):
+    # raised to the callers waiting on a coalesced request whose sender was cancelled
+    pass
+
+
+class ResponseCache:
+    """A time and size bounded LRU cache of API responses.
+
+    Entries are invalidated by the gateway events that signal a change
+    to the underlying data, the TTL only bounds how stale they can get
+    when such an event is missed.
+    """
+
+    # GET routes whose response can be invalidated through gateway events
+    PATHS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            '/users/{user_id}',
+            '/channels/{channel_id}',
+            '/guilds/{guild_id}/members/{member_id}',
+            '/guilds/{guild_id}/roles',
+        }
+    )
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        # url -> tokens of the fetches whose response is still valid
+        self._fetching: Dict[str, Set[object]] = {}
+
+    def get(self, url: str) -> Any:
+        try:
+            expires, data = self._data[url]
+        except KeyError:
+            return MISSING
+
+        if expires < time.monotonic():
+            del self._data[url]
+            return MISSING
+
+        self._data.move_to_end(url)
+        return data
+
+    def begin(self, url: str) -> object:
+        token = object()
+        self._fetching.setdefault(url, set()).add(token)
+        return token
+
+    def discard(self, url: str, token: object) -> bool:
+        # returns whether the fetch was still valid
+        tokens = self._fetching.get(url)
+        if tokens is None or token not in tokens:
+            return False
+
+        tokens.remove(token)
+        if not tokens:
+            del self._fetching[url]
+        return True
+
+    def finish(self, url: str, token: object, data: Any) -> None:
+        # responses that were invalidated while in-flight are not stored
+        if not self.discard(url, token):
+            return
+
+        self._data[url] = (time.monotonic() + self.ttl, data)
+        self._data.move_to_end(url)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        self._data.pop(url, None)
+        self._fetching.pop(url, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._fetching.clear()
+
+
+class CDNCache:
+    """A size bounded on-disk LRU cache of CDN assets.
+
+    Every asset is stored as a ``<hash>`` data file next to a ``<hash>.json``
+    file with its validators. The URL of an asset includes its key, format and
+    size so each variant is cached separately. Entries older than
+    ``revalidate_after`` seconds are revalidated with a conditional request.
+
+    The index is kept in memory and only touched from the event loop, while
+    every file system access runs in the loop's default executor. An existing
+    directory is read on first use rather than when the cache is created.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_size: int, revalidate_after: float) -> None:
+        self.directory: str = os.fspath(directory)
+        self.max_size: int = max_size
+        self.revalidate_after: float = revalidate_after
+        self.size: int = 0
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._loading: Optional[asyncio.Future[None]] = None
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _read_index(self) -> List[Tuple[float, Dict[str, Any]]]:
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+
+            meta_path = os.path.join(self.directory, name)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                # the data file's mtime records when it was last used
+                used = os.stat(meta_path[:-5]).st_mtime
+            except (OSError, ValueError):
+                continue
+            entries.append((used, entry))
+        return entries
+
+    async def load(self) -> None:
+        loading = self._loading
+        if loading is None:
+            self._loading = loading = asyncio.ensure_future(self._load())
+        # shielded so a cancelled caller does not abort the load for everyone else
+        await asyncio.shield(loading)
+
+    async def _load(self) -> None:
+        try:
+            entries = await self._run(self._read_index)
+        except OSError:
+            self._loading = None
+            raise
+
+        for _, entry in sorted(entries, key=lambda e: e[0]):
+            self._entries[entry['url']] = entry
+            self.size += entry['size']
+        await self._evict()
+
+    def _write_meta(self, entry: Dict[str, Any]) -> None:
+        with open(f'{self._path(entry["url"])}.json', 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+
+    def _remove_files(self, *urls: str) -> None:
+        for url in urls:
+            path = self._path(url)
+            for file in (path, f'{path}.json'):
+                try:
+                    os.remove(file)
+                except OSError:
+                    pass
+
+    async def _evict(self) -> None:
+        evicted = []
+        while self.size > self.max_size and self._entries:
+            url, entry = self._entries.popitem(last=False)
+            self.size -= entry['size']
+            evicted.append(url)
+        if evicted:
+            await self._run(self._remove_files, *evicted)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(url)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry['validated'] < self.revalidate_after
+
+    def validators(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None:
+            if entry['etag'] is not None:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified'] is not None:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def _open_file(path: str) -> io.BufferedReader:
+        fp = open(path, 'rb')
+        os.utime(path)
+        return fp
+
+    async def open(self, url: str) -> Optional[io.BufferedReader]:
+        try:
+            fp = await self._run(self._open_file, self._path(url))
+        except OSError:
+            await self.remove(url)
+            return None
+
+        if url in self._entries:
+            self._entries.move_to_end(url)
+        return fp
+
+    async def revalidated(self, url: str) -> None:
+        entry = self._entries.get(url)
+        if entry is not None:
+            entry['validated'] = time.time()
+            await self._run(self._write_meta, entry.copy())
+
+    def _open_temporary(self) -> Tuple[io.BufferedWriter, str]:
+        fd, path = tempfile.mkstemp(dir=self.directory, prefix='.download-')
+        return os.fdopen(fd, 'wb'), path
+
+    async def create_temporary(self) -> Tuple[io.BufferedWriter, str]:
+        return await self._run(self._open_temporary)
+
+    def _commit(self, temporary: str, entry: Dict[str, Any]) -> None:
+        os.replace(temporary, self._path(entry['url']))
+        self._write_meta(entry)
+
+    async def store(self, url: str, temporary: str, size: int, headers: Any) -> None:
+        if size > self.max_size:
+            await self._run(os.remove, temporary)
+            return
+
+        entry = {
+            'url': url,
+            'size': size,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'validated': time.time(),
+        }
+        await self._run(self._commit, temporary, entry)
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self.size -= old['size']
+
+        self._entries[url] = entry
+        self.size += size
+        await self._evict()
+
+    async def remove(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.size -= entry['size']
+        await self._run(self._remove_files, url)
+
+    async def clear(self) -> None:
+        urls = list(self._entries)
+        self._entries.clear()
+        self.size = 0
+        await self._run(self._remove_files, *urls)
+
+
 # For some reason, the Discord voice websocket expects this header to be
 # completely lowercase while aiohttp respects spec and does it as case-insensitive
 aiohttp.hdrs.WEBSOCKET = 'websocket'  # type: ignore
@@ -159,6 +567,9 @@ aiohttp.hdrs.WEBSOCKET = 'websocket'  # type: ignore
 class HTTPClient:
     """Represents an HTTP client sending HTTP requests to the Discord API."""
 
+    # id(session) -> the client that owns it, used to route webhook requests
+    _session_owners: ClassVar[weakref.WeakValueDictionary[int, HTTPClient]] = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         connector: Optional[aiohttp.BaseConnector] = None,
@@ -167,27 +578,53 @@ class HTTPClient:
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         unsync_clock: bool = True,
+        trace_hook: Optional[Callable[[RequestTrace], Any]] = None,
+        coalesce: Union[bool, Iterable[str]] = False,
+        response_cache: Optional[ResponseCache] = None,
+        cdn_cache: Optional[CDNCache] = None,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
-        self._global_over: asyncio.Event = asyncio.Event()
+        self._global_over: PriorityEvent = PriorityEvent()
         self._global_over.set()
         self.token: Optional[str] = None
         self.bot_token: bool = False
         self.proxy: Optional[str] = proxy
         self.proxy_auth: Optional[aiohttp.BasicAuth] = proxy_auth
         self.use_clock: bool = not unsync_clock
+        self.trace_hook: Optional[Callable[[RequestTrace], Any]] = trace_hook
+        self._trace_configs: List[aiohttp.TraceConfig] = [_create_trace_config()] if trace_hook is not None else []
+
+        # concurrent GET requests to these route paths share a single response
+        self.coalesce_all: bool = coalesce is True
+        self.coalesce_paths: Set[str] = set() if isinstance(coalesce, bool) else set(coalesce)
+        self._inflight: Dict[Tuple[str, Any, Any], asyncio.Future[Any]] = {}
+        self._response_cache: Optional[ResponseCache] = response_cache
+        self.cdn_cache: Optional[CDNCache] = cdn_cache
 
         user_agent = 'DiscordBot (https://github.com/Rapptz/discord.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}'
         self.user_agent: str = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
 
+    def _create_session(self) -> None:
+        self.__session = aiohttp.ClientSession(
+            connector=self.connector,
+            ws_response_class=DiscordClientWebSocketResponse,
+            trace_configs=self._trace_configs,
+        )
+        self._session_owners[id(self.__session)] = self
+
+    @classmethod
+    def from_session(cls, session: aiohttp.ClientSession) -> Optional[HTTPClient]:
+        http = cls._session_owners.get(id(session))
+        if http is not None and http.__session is session:
+            return http
+        return None
+
     def recreate(self) -> None:
         if self.__session.closed:
-            self.__session = aiohttp.ClientSession(
-                connector=self.connector, ws_response_class=DiscordClientWebSocketResponse
-            )
+            self._create_session()
 
     async def ws_connect(self, url: str, *, compress: int = 0) -> Any:
         kwargs = {
@@ -204,12 +641,137 @@ class HTTPClient:
 
         return await self.__session.ws_connect(url, **kwargs)
 
+    @contextlib.contextmanager
+    def priority(self, priority: RequestPriority) -> Iterator[None]:
+        token = _request_priority.set(priority)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
     async def request(
         self,
         route: Route,
         *,
         files: Optional[Sequence[File]] = None,
         form: Optional[Iterable[Dict[str, Any]]] = None,
+        priority: Optional[RequestPriority] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if priority is None:
+            priority = route.priority
+            if priority is None:
+                priority = _request_priority.get()
+        kwargs['priority'] = priority
+
+        cache = self._response_cache
+        if route.method == 'GET':
+            if cache is not None and route.path in cache.PATHS and not kwargs.get('params'):
+                return await self._cached_request(cache, route, **kwargs)
+            if self.coalesce_all or route.path in self.coalesce_paths:
+                return await self._coalesced_request(route, **kwargs)
+        elif cache is not None:
+            cache.invalidate(route.url)
+
+        return await self._traced_request(route, files=files, form=form, **kwargs)
+
+    async def _cached_request(self, cache: ResponseCache, route: Route, **kwargs: Any) -> Any:
+        url = route.url
+        data = cache.get(url)
+        if data is not MISSING:
+            return copy.deepcopy(data)
+
+        token = cache.begin(url)
+        try:
+            if self.coalesce_all or route.path in self.coalesce_paths:
+                data = await self._coalesced_request(route, **kwargs)
+            else:
+                data = await self._traced_request(route, **kwargs)
+        except BaseException:
+            cache.discard(url, token)
+            raise
+
+        cache.finish(url, token, copy.deepcopy(data))
+        return data
+
+    def invalidate_cached(self, path: str, **parameters: Any) -> None:
+        cache = self._response_cache
+        if cache is not None:
+            cache.invalidate(Route('GET', path, **parameters).url)
+
+    def clear_cached(self) -> None:
+        cache = self._response_cache
+        if cache is not None:
+            cache.clear()
+
+    async def _coalesced_request(self, route: Route, **kwargs: Any) -> Any:
+        params = kwargs.get('params')
+        auth_token = kwargs.get('auth_token', MISSING)
+        if auth_token is MISSING:
+            auth_token = self.token
+        key = (route.url, tuple(sorted(params.items())) if params else None, auth_token)
+        while key in self._inflight:
+            _log.debug('Coalescing %s %s with an in-flight request.', route.method, route.url)
+            try:
+                data = await asyncio.shield(self._inflight[key])
+            except _LeaderCancelled:
+                # the caller sending the request was cancelled, not us, so send it ourselves
+                continue
+            # every caller gets its own copy since models are free to mutate their payload
+            return copy.deepcopy(data)
+
+        self._inflight[key] = future = self.loop.create_future()
+        try:
+            data = await self._traced_request(route, **kwargs)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # prevent the exception from being logged if nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[key]
+
+    async def _traced_request(
+        self,
+        route: Route,
+        *,
+        files: Optional[Sequence[File]] = None,
+        form: Optional[Iterable[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        trace_hook = self.trace_hook
+        if trace_hook is None:
+            return await self._request(route, None, files=files, form=form, **kwargs)
+
+        trace = RequestTrace(route, kwargs['priority'])
+        try:
+            return await self._request(route, trace, files=files, form=form, **kwargs)
+        except Exception as exc:
+            trace.error = exc
+            raise
+        finally:
+            trace.total = time.perf_counter() - trace._started
+            try:
+                trace_hook(trace)
+            except Exception:
+                _log.exception('HTTP trace hook %r raised an exception', trace_hook)
+
+    async def _request(
+        self,
+        route: Route,
+        trace: Optional[RequestTrace],
+        *,
+        files: Optional[Sequence[File]] = None,
+        form: Optional[Iterable[Dict[str, Any]]] = None,
+        priority: RequestPriority = RequestPriority.normal,
+        auth_token: Optional[str] = MISSING,
         **kwargs: Any,
     ) -> Any:
         bucket = route.bucket
@@ -218,7 +780,7 @@ class HTTPClient:
 
         lock = self._locks.get(bucket)
         if lock is None:
-            lock = asyncio.Lock()
+            lock = PriorityLock()
             if bucket is not None:
                 self._locks[bucket] = lock
 
@@ -227,8 +789,11 @@ class HTTPClient:
             'User-Agent': self.user_agent,
         }
 
-        if self.token is not None:
-            headers['Authorization'] = 'Bot ' + self.token
+        # webhook requests pass their own token, or None to be sent without one
+        if auth_token is MISSING:
+            auth_token = self.token
+        if auth_token is not None:
+            headers['Authorization'] = 'Bot ' + auth_token
         # some checking if it's a JSON request
         if 'json' in kwargs:
             headers['Content-Type'] = 'application/json'
@@ -250,15 +815,28 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs['proxy_auth'] = self.proxy_auth
 
+        if trace is not None:
+            kwargs['trace_request_ctx'] = trace
+
         if not self._global_over.is_set():
             # wait until the global lock is complete
-            await self._global_over.wait()
+            start = time.perf_counter()
+            await self._global_over.wait(priority)
+            if trace is not None:
+                trace.global_wait += time.perf_counter() - start
 
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
-        await lock.acquire()
+        start = time.perf_counter()
+        await lock.acquire(priority)
+        if trace is not None:
+            trace.lock_wait += time.perf_counter() - start
+
         with MaybeUnlock(lock) as maybe_lock:
             for tries in range(5):
+                if trace is not None:
+                    trace.retries = tries
+
                 if files:
                     for f in files:
                         f.reset(seek=tries)
@@ -272,6 +850,8 @@ class HTTPClient:
                 try:
                     async with self.__session.request(method, url, **kwargs) as response:
                         _log.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), response.status)
+                        if trace is not None:
+                            trace.status = response.status
 
                         # even errors have text involved in them so this is safe to call
                         data = await json_or_text(response)
@@ -310,6 +890,8 @@ class HTTPClient:
 
                             await asyncio.sleep(retry_after)
                             _log.debug('Done sleeping for the rate limit. Retrying...')
+                            if trace is not None:
+                                trace.ratelimit_wait += retry_after
 
                             # release the global lock now that the
                             # global rate limit has passed
@@ -352,6 +934,9 @@ class HTTPClient:
             raise RuntimeError('Unreachable code in HTTP handling')
 
     async def get_from_cdn(self, url: str) -> bytes:
+        if self.cdn_cache is not None:
+            return b''.join([chunk async for chunk in self.stream_from_cdn(url)])
+
         async with self.__session.get(url) as resp:
             if resp.status == 200:
                 return await resp.read()
@@ -362,6 +947,69 @@ class HTTPClient:
             else:
                 raise HTTPException(resp, 'failed to get asset')
 
+    async def stream_from_cdn(self, url: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        cache = self.cdn_cache
+        entry = None
+        if cache is not None:
+            await cache.load()
+            entry = cache.get(url)
+        if cache is not None and entry is not None and cache.is_fresh(entry):
+            fp = await cache.open(url)
+            if fp is not None:
+                async for chunk in self._read_cached(fp, chunk_size):
+                    yield chunk
+                return
+            entry = None
+
+        headers = cache.validators(entry) if cache is not None else {}
+        async with self.__session.get(url, headers=headers) as resp:
+            if resp.status == 304 and cache is not None:
+                await cache.revalidated(url)
+                fp = await cache.open(url)
+            elif resp.status == 200:
+                fp = None
+                if cache is None:
+                    async for chunk in resp.content.iter_chunked(chunk_size):
+                        yield chunk
+                    return
+
+                # written to a temporary file first so partial downloads are never cached
+                out, temporary = await cache.create_temporary()
+                size = 0
+                try:
+                    with out:
+                        async for chunk in resp.content.iter_chunked(chunk_size):
+                            await self.loop.run_in_executor(None, out.write, chunk)
+                            size += len(chunk)
+                            yield chunk
+                except BaseException:
+                    os.remove(temporary)
+                    raise
+                await cache.store(url, temporary, size, resp.headers)
+                return
+            elif resp.status == 404:
+                raise NotFound(resp, 'asset not found')
+            elif resp.status == 403:
+                raise Forbidden(resp, 'cannot retrieve asset')
+            else:
+                raise HTTPException(resp, 'failed to get asset')
+
+        if fp is None:
+            # the cached file went missing after it was revalidated
+            async for chunk in self.stream_from_cdn(url, chunk_size):
+                yield chunk
+        else:
+            async for chunk in self._read_cached(fp, chunk_size):
+                yield chunk
+
+    async def _read_cached(self, fp: io.BufferedReader, chunk_size: int) -> AsyncIterator[bytes]:
+        with fp:
+            while True:
+                chunk = await self.loop.run_in_executor(None, fp.read, chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
     # state management
 
     async def close(self) -> None:
@@ -372,7 +1020,7 @@ class HTTPClient:
 
     async def static_login(self, token: str) -> user.User:
         # Necessary to get aiohttp to stop complaining about session creation
-        self.__session = aiohttp.ClientSession(connector=self.connector, ws_response_class=DiscordClientWebSocketResponse)
+        self._create_session()
         old_token = self.token
         self.token = token
 
@@ -1117,7 +1765,7 @@ class HTTPClient:
         return self.request(Route('POST', '/guilds/templates/{code}', code=code), json=payload)
 
     def get_bans(self, guild_id: Snowflake) -> Response[List[guild.Ban]]:
-        return self.request(Route('GET', '/guilds/{guild_id}/bans', guild_id=guild_id))
+        return self.request(Route('GET', '/guilds/{guild_id}/bans', guild_id=guild_id), priority=RequestPriority.bulk)
 
     def get_ban(self, user_id: Snowflake, guild_id: Snowflake) -> Response[guild.Ban]:
         return self.request(Route('GET', '/guilds/{guild_id}/bans/{user_id}', guild_id=guild_id, user_id=user_id))
@@ -1142,7 +1790,7 @@ class HTTPClient:
             params['after'] = after
 
         r = Route('GET', '/guilds/{guild_id}/members', guild_id=guild_id)
-        return self.request(r, params=params)
+        return self.request(r, params=params, priority=RequestPriority.bulk)
 
     def get_member(self, guild_id: Snowflake, member_id: Snowflake) -> Response[member.MemberWithUser]:
         return self.request(Route('GET', '/guilds/{guild_id}/members/{member_id}', guild_id=guild_id, member_id=member_id))
@@ -1346,7 +1994,7 @@ class HTTPClient:
             params['action_type'] = action_type
 
         r = Route('GET', '/guilds/{guild_id}/audit-logs', guild_id=guild_id)
-        return self.request(r, params=params)
+        return self.request(r, params=params, priority=RequestPriority.bulk)
 
     def get_widget(self, guild_id: Snowflake) -> Response[widget.Widget]:
         return self.request(Route('GET', '/guilds/{guild_id}/widget.json', guild_id=guild_id))
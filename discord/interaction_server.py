@@ -0,0 +1,223 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from aiohttp import web
+
+from . import utils
+from .enums import InteractionType, InteractionResponseType
+from .interactions import Interaction
+
+if TYPE_CHECKING:
+    from .client import Client
+
+has_nacl: bool
+
+try:
+    import nacl.signing  # type: ignore
+    import nacl.exceptions  # type: ignore
+
+    has_nacl = True
+except ImportError:
+    has_nacl = False
+
+__all__ = ('InteractionServer',)
+
+_log = logging.getLogger(__name__)
+
+
+class InteractionServer:
+    """An HTTP server that receives interactions through an outgoing webhook
+    instead of the gateway.
+
+    Discord posts every interaction to the *Interactions Endpoint URL* configured
+    for the application. Each request is verified against the application's
+    public key, turned into an :class:`Interaction` through the client's
+    internal state and dispatched exactly like a gateway ``INTERACTION_CREATE``,
+    so :func:`on_interaction`, views and application command handlers all work
+    unchanged.
+
+    The initial response (:meth:`InteractionResponse.send_message`,
+    :meth:`~InteractionResponse.defer`, etc.) is delivered in the body of the
+    HTTP reply rather than through a separate REST call. If no response is
+    made within ``response_timeout`` seconds the interaction is deferred on the
+    handler's behalf; the handler can then continue through
+    :attr:`Interaction.followup` or :meth:`Interaction.edit_original_message`.
+
+    The client must be logged in with :meth:`Client.login` so that follow-up
+    requests can be made. Connecting to the gateway is not required.
+
+    This requires the PyNaCl library to verify request signatures.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client whose state builds and dispatches the interactions.
+    public_key: :class:`str`
+        The hex encoded public key of the application, as shown in the
+        developer portal.
+    path: :class:`str`
+        The path the endpoint is served at. Defaults to ``/interactions``.
+    response_timeout: :class:`float`
+        How long to wait for the initial response before deferring the
+        interaction. Discord fails interactions that are not answered within
+        3 seconds. Defaults to ``2.5``.
+
+    Attributes
+    -----------
+    app: :class:`aiohttp.web.Application`
+        The underlying application. This can be mounted into an existing
+        aiohttp application instead of calling :meth:`start`.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        public_key: str,
+        *,
+        path: str = '/interactions',
+        response_timeout: float = 2.5,
+    ) -> None:
+        if not has_nacl:
+            raise RuntimeError('PyNaCl library needed in order to verify interaction signatures')
+
+        self.client: Client = client
+        self.path: str = path
+        self.response_timeout: float = response_timeout
+        self._verify_key = nacl.signing.VerifyKey(bytes.fromhex(public_key))
+        self._runner: Optional[web.AppRunner] = None
+        self.app: web.Application = web.Application()
+        self.app.router.add_post(path, self.handle)
+
+    def verify(self, body: bytes, signature: str, timestamp: str) -> bool:
+        """Checks the Ed25519 signature of a request.
+
+        Parameters
+        -----------
+        body: :class:`bytes`
+            The raw request body.
+        signature: :class:`str`
+            The value of the ``X-Signature-Ed25519`` header.
+        timestamp: :class:`str`
+            The value of the ``X-Signature-Timestamp`` header.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the signature is valid.
+        """
+        try:
+            self._verify_key.verify(timestamp.encode() + body, bytes.fromhex(signature))
+        except (ValueError, nacl.exceptions.BadSignatureError):
+            return False
+        return True
+
+    @staticmethod
+    def _response(payload: Dict[str, Any]) -> web.Response:
+        return web.Response(text=utils._to_json(payload), content_type='application/json')
+
+    @staticmethod
+    def _deferral(interaction: Interaction) -> Dict[str, Any]:
+        if interaction.type is InteractionType.component:
+            return {'type': InteractionResponseType.deferred_message_update.value}
+        if interaction.type is InteractionType.autocomplete:
+            # autocomplete cannot be deferred, answer with no suggestions instead
+            return {'type': InteractionResponseType.autocomplete_result.value, 'data': {'choices': []}}
+        return {'type': InteractionResponseType.deferred_channel_message.value}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """|coro|
+
+        The request handler registered at :attr:`path`.
+
+        Requests with a missing or invalid signature are rejected with
+        ``401 Unauthorized``, as Discord requires.
+        """
+        signature = request.headers.get('X-Signature-Ed25519')
+        timestamp = request.headers.get('X-Signature-Timestamp')
+        body = await request.read()
+        if signature is None or timestamp is None or not self.verify(body, signature, timestamp):
+            return web.Response(status=401, text='invalid request signature')
+
+        try:
+            data = utils._from_json(body)
+        except ValueError:
+            return web.Response(status=400, text='invalid request body')
+
+        if data.get('type') == InteractionType.ping.value:
+            return self._response({'type': InteractionResponseType.pong.value})
+
+        state = self.client._connection
+        future: asyncio.Future[Dict[str, Any]] = state.loop.create_future()
+        interaction = Interaction(data=data, state=state)
+        interaction._response_future = future
+        state.dispatch_interaction(interaction)
+
+        try:
+            payload = await asyncio.wait_for(future, timeout=self.response_timeout)
+        except asyncio.TimeoutError:
+            # answer on the handler's behalf so the token stays usable for follow-ups
+            interaction._response_future = None
+            interaction.response._responded = True
+            payload = self._deferral(interaction)
+            _log.debug('Interaction %s was not responded to in time, deferring it.', interaction.id)
+
+        return self._response(payload)
+
+    async def start(self, host: str = '0.0.0.0', port: int = 8080) -> None:
+        """|coro|
+
+        Starts serving the endpoint.
+
+        Parameters
+        -----------
+        host: :class:`str`
+            The interface to bind to.
+        port: :class:`int`
+            The port to listen on.
+        """
+        if self._runner is not None:
+            return
+
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        self._runner = runner
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops serving the endpoint.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
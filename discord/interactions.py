@@ -58,6 +58,7 @@ if TYPE_CHECKING:
     from aiohttp import ClientSession
     from .embeds import Embed
     from .ui.view import View
+    from .application_commands import Choice
     from .channel import VoiceChannel, StageChannel, TextChannel, CategoryChannel, StoreChannel, PartialMessageable
     from .threads import Thread
 
@@ -114,6 +115,7 @@ class Interaction:
         '_state',
         '_session',
         '_original_message',
+        '_response_future',
         '_cs_response',
         '_cs_followup',
         '_cs_channel',
@@ -123,6 +125,9 @@ class Interaction:
         self._state: ConnectionState = state
         self._session: ClientSession = state.http._HTTPClient__session
         self._original_message: Optional[InteractionMessage] = None
+        # set by the InteractionServer when the initial response is
+        # delivered in the body of the HTTP reply rather than over REST
+        self._response_future: Optional[asyncio.Future[Dict[str, Any]]] = None
         self._from_data(data)
 
     def _from_data(self, data: InteractionPayload):
@@ -384,6 +389,21 @@ class InteractionResponse:
         """
         return self._responded
 
+    async def _create_response(self, type: int, data: Optional[Dict[str, Any]] = None) -> None:
+        parent = self._parent
+        future = parent._response_future
+        if future is not None:
+            parent._response_future = None
+            if not future.done():
+                payload: Dict[str, Any] = {'type': type}
+                if data is not None:
+                    payload['data'] = data
+                future.set_result(payload)
+                return
+
+        adapter = async_context.get()
+        await adapter.create_interaction_response(parent.id, parent.token, session=parent._session, type=type, data=data)
+
     async def defer(self, *, ephemeral: bool = False) -> None:
         """|coro|
 
@@ -419,10 +439,7 @@ class InteractionResponse:
                 data = {'flags': 64}
 
         if defer_type:
-            adapter = async_context.get()
-            await adapter.create_interaction_response(
-                parent.id, parent.token, session=parent._session, type=defer_type, data=data
-            )
+            await self._create_response(defer_type, data)
             self._responded = True
 
     async def pong(self) -> None:
@@ -444,10 +461,7 @@ class InteractionResponse:
 
         parent = self._parent
         if parent.type is InteractionType.ping:
-            adapter = async_context.get()
-            await adapter.create_interaction_response(
-                parent.id, parent.token, session=parent._session, type=InteractionResponseType.pong.value
-            )
+            await self._create_response(InteractionResponseType.pong.value)
             self._responded = True
 
     async def send_message(
@@ -525,15 +539,7 @@ class InteractionResponse:
         if allowed_mentions is not MISSING:
             payload['allowed_mentions'] = allowed_mentions.to_dict()
 
-        parent = self._parent
-        adapter = async_context.get()
-        await adapter.create_interaction_response(
-            parent.id,
-            parent.token,
-            session=parent._session,
-            type=InteractionResponseType.channel_message.value,
-            data=payload,
-        )
+        await self._create_response(InteractionResponseType.channel_message.value, payload)
 
         if view is not MISSING:
             if ephemeral and view.timeout is None:
@@ -621,14 +627,7 @@ class InteractionResponse:
             else:
                 payload['components'] = view.to_components()
 
-        adapter = async_context.get()
-        await adapter.create_interaction_response(
-            parent.id,
-            parent.token,
-            session=parent._session,
-            type=InteractionResponseType.message_update.value,
-            data=payload,
-        )
+        await self._create_response(InteractionResponseType.message_update.value, payload)
 
         if view and not view.is_finished():
             state.store_view(view, message_id)
@@ -636,6 +635,38 @@ class InteractionResponse:
         self._responded = True
 
 
+    async def autocomplete(self, choices: List[Choice]) -> None:
+        """|coro|
+
+        Responds to an autocomplete interaction with suggested choices.
+
+        Parameters
+        -----------
+        choices: List[:class:`Choice`]
+            The choices to suggest. Maximum of 25.
+
+        Raises
+        -------
+        HTTPException
+            Responding to the interaction failed.
+        ValueError
+            The length of ``choices`` was invalid.
+        InteractionResponded
+            This interaction has already been responded to before.
+        """
+        if self._responded:
+            raise InteractionResponded(self._parent)
+
+        if len(choices) > 25:
+            raise ValueError('choices cannot exceed maximum of 25 elements')
+
+        parent = self._parent
+        if parent.type is InteractionType.autocomplete:
+            payload = {'choices': [{'name': c.name, 'value': c.value} for c in choices]}
+            await self._create_response(InteractionResponseType.autocomplete_result.value, payload)
+            self._responded = True
+
+
 class _InteractionMessageState:
     __slots__ = ('_parent', '_interaction')
 
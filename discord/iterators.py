@@ -25,17 +25,32 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import datetime
-from typing import Awaitable, TYPE_CHECKING, TypeVar, Optional, Any, Callable, Union, List, AsyncIterator
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .errors import NoMoreItems
-from .utils import snowflake_time, time_snowflake, maybe_coroutine
+from .utils import snowflake_time, time_snowflake, maybe_coroutine, utcnow
 from .object import Object
 from .audit_logs import AuditLogEntry
 
 __all__ = (
     'ReactionIterator',
     'HistoryIterator',
+    'HistoryScanIterator',
     'AuditLogIterator',
     'GuildIterator',
     'MemberIterator',
@@ -74,9 +89,50 @@ _Func = Callable[[T], Union[OT, Awaitable[OT]]]
 OLDEST_OBJECT = Object(id=0)
 
 
+def _retrieve_exception(task: asyncio.Task[None]) -> None:
+    # pages prefetched for an abandoned iterator are never awaited
+    if not task.cancelled():
+        task.exception()
+
+
+async def _chain_fill(previous: asyncio.Task[None], fill: Callable[[], Awaitable[None]]) -> None:
+    # every page needs the cursor left behind by the previous one
+    await previous
+    await fill()
+
+
 class _AsyncIterator(AsyncIterator[T]):
     __slots__ = ()
 
+    # the number of pages fetched ahead of the consumer
+    prefetch: int = 0
+    _prefetching: Optional[Deque[asyncio.Task[None]]] = None
+
+    async def _fill_ahead(self, fill: Callable[[], Awaitable[None]], queue: asyncio.Queue[Any]) -> None:
+        if self.prefetch <= 0:
+            return await fill()
+
+        pending = self._prefetching
+        if pending is None:
+            pending = self._prefetching = deque()
+        if not pending:
+            pending.append(asyncio.ensure_future(fill()))
+
+        # pages that were already prefetched have been consumed by now
+        while pending and queue.empty():
+            current = pending.popleft()
+            await current
+
+        if queue.empty():
+            return
+
+        # the next pages are fetched while the consumer handles this one
+        previous = pending[-1] if pending else current
+        while len(pending) < self.prefetch:
+            previous = asyncio.ensure_future(_chain_fill(previous, fill))
+            previous.add_done_callback(_retrieve_exception)
+            pending.append(previous)
+
     async def next(self) -> T:
         raise NotImplementedError
 
@@ -265,9 +321,12 @@ class HistoryIterator(_AsyncIterator['Message']):
     oldest_first: Optional[:class:`bool`]
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if `after` is specified, otherwise ``False``.
+    prefetch: :class:`int`
+        The number of pages to fetch in the background while the current one
+        is consumed.
     """
 
-    def __init__(self, messageable, limit, before=None, after=None, around=None, oldest_first=None):
+    def __init__(self, messageable, limit, before=None, after=None, around=None, oldest_first=None, prefetch=0):
 
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -283,6 +342,7 @@ class HistoryIterator(_AsyncIterator['Message']):
 
         self.messageable = messageable
         self.limit = limit
+        self.prefetch = prefetch
         self.before = before
         self.after = after or OLDEST_OBJECT
         self.around = around
@@ -320,7 +380,7 @@ class HistoryIterator(_AsyncIterator['Message']):
 
     async def next(self) -> Message:
         if self.messages.empty():
-            await self.fill_messages()
+            await self._fill_ahead(self.fill_messages, self.messages)
 
         try:
             return self.messages.get_nowait()
@@ -390,8 +450,167 @@ class HistoryIterator(_AsyncIterator['Message']):
         return []
 
 
+class HistoryScanIterator(_AsyncIterator['Message']):
+    """Iterator for receiving a channel's message history by scanning
+    multiple snowflake ranges concurrently.
+
+    The time between ``after`` and ``before`` is split into ``partitions``
+    ranges using :func:`utils.time_snowflake`. Every range is walked from
+    oldest to newest with the ``after`` parameter by its own task. Requests
+    still go through the channel's rate limit bucket, which sends them one
+    at a time, so the tasks only overlap fetching with the consumer's
+    processing rather than fetching in parallel.
+
+    Parameters
+    -----------
+    messageable: :class:`abc.Messageable`
+        Messageable class to retrieve message history from.
+    before: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+        Message before which all messages must be. Defaults to the current time.
+    after: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+        Message after which all messages must be. Defaults to the creation of the channel.
+    partitions: :class:`int`
+        The number of ranges to scan concurrently.
+    ordered: :class:`bool`
+        Whether to return messages in oldest->newest order. If ``False``
+        messages are returned as soon as any range receives them.
+
+    The scanning tasks are cancelled once the iterator is exhausted, closed
+    with :meth:`close` or garbage collected, so breaking out of the loop early
+    does not leave them running.
+    """
+
+    # the number of messages buffered per range before its task waits for the consumer
+    BUFFER: ClassVar[int] = 200
+
+    def __init__(self, messageable, before=None, after=None, partitions=4, ordered=True):
+        if partitions <= 0:
+            raise ValueError('partitions must be greater than 0')
+
+        if before is None:
+            before = utcnow()
+        if isinstance(before, datetime.datetime):
+            before = Object(id=time_snowflake(before, high=False))
+        if isinstance(after, datetime.datetime):
+            after = Object(id=time_snowflake(after, high=True))
+
+        self.messageable = messageable
+        self.before = before
+        self.after = after
+        self.partitions = partitions
+        self.ordered = ordered
+
+        self.state = self.messageable._state
+        self.logs_from = self.state.http.logs_from
+        self._queues: List[asyncio.Queue[Any]] = []
+        self._tasks: List[asyncio.Task[None]] = []
+        self._current = 0
+        self._remaining = partitions
+
+    def _get_ranges(self) -> List[Tuple[int, int]]:
+        # ranges are [start, end) with the ends being the following range's start
+        start = self.after.id + 1
+        end = self.before.id
+        if start >= end:
+            return []
+
+        first = snowflake_time(start)
+        span = snowflake_time(end) - first
+        bounds = [start]
+        for i in range(1, self.partitions):
+            bound = time_snowflake(first + span * i / self.partitions, high=False)
+            if bound > bounds[-1]:
+                bounds.append(bound)
+        bounds.append(end)
+        return list(zip(bounds, bounds[1:]))
+
+    async def _start(self) -> None:
+        channel = await self.messageable._get_channel()
+        if self.after is None:
+            # no message can predate the channel it is in
+            self.after = Object(id=channel.id)
+
+        ranges = self._get_ranges()
+        self._remaining = len(ranges)
+        if self.ordered:
+            self._queues = [asyncio.Queue(self.BUFFER) for _ in ranges]
+        else:
+            self._queues = [asyncio.Queue(self.BUFFER * max(len(ranges), 1))]
+
+        for index, (start, end) in enumerate(ranges):
+            queue = self._queues[index if self.ordered else 0]
+            scan = self._scan(self.state, self.logs_from, channel, start, end, queue)
+            self._tasks.append(asyncio.ensure_future(scan))
+
+    @staticmethod
+    async def _scan(state, logs_from, channel, start: int, end: int, queue: asyncio.Queue[Any]) -> None:
+        # this does not reference the iterator, so that abandoning it lets it be
+        # collected right away, which cancels this task
+        after = start - 1
+        try:
+            while True:
+                data: List[MessagePayload] = await logs_from(channel.id, 100, after=after)
+                done = len(data) < 100
+                for element in reversed(data):
+                    if int(element['id']) >= end:
+                        done = True
+                        break
+                    await queue.put(state.create_message(channel=channel, data=element))
+
+                if done:
+                    break
+                after = int(data[0]['id'])
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(None)
+
+    async def next(self) -> Message:
+        if not self._tasks and self._remaining:
+            await self._start()
+
+        while self._remaining:
+            item = await self._queues[self._current].get()
+            if item is None:
+                # a range is exhausted
+                self._remaining -= 1
+                if self.ordered:
+                    self._current += 1
+                continue
+
+            if isinstance(item, Exception):
+                self.close()
+                raise item
+            return item
+
+        raise NoMoreItems()
+
+    def close(self) -> None:
+        """Stops the scan, cancelling the tasks of the ranges that are still being scanned."""
+        self._remaining = 0
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    async def aclose(self) -> None:
+        """|coro|
+
+        The same as :meth:`close`, for use with :func:`contextlib.aclosing`.
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except RuntimeError:
+            # the event loop is already closed
+            pass
+
+
 class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
-    def __init__(self, guild, limit=None, before=None, after=None, oldest_first=None, user_id=None, action_type=None):
+    def __init__(
+        self, guild, limit=None, before=None, after=None, oldest_first=None, user_id=None, action_type=None, prefetch=0
+    ):
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
         if isinstance(after, datetime.datetime):
@@ -406,6 +625,7 @@ class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
         self.loop = guild._state.loop
         self.request = guild._state.http.get_audit_logs
         self.limit = limit
+        self.prefetch = prefetch
         self.before = before
         self.user_id = user_id
         self.action_type = action_type
@@ -453,7 +673,7 @@ class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
 
     async def next(self) -> AuditLogEntry:
         if self.entries.empty():
-            await self._fill()
+            await self._fill_ahead(self._fill, self.entries)
 
         try:
             return self.entries.get_nowait()
@@ -521,9 +741,12 @@ class GuildIterator(_AsyncIterator['Guild']):
         Object before which all guilds must be.
     after: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
         Object after which all guilds must be.
+    prefetch: :class:`int`
+        The number of pages to fetch in the background while the current one
+        is consumed.
     """
 
-    def __init__(self, bot, limit, before=None, after=None):
+    def __init__(self, bot, limit, before=None, after=None, prefetch=0):
 
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -532,6 +755,7 @@ class GuildIterator(_AsyncIterator['Guild']):
 
         self.bot = bot
         self.limit = limit
+        self.prefetch = prefetch
         self.before = before
         self.after = after
 
@@ -551,7 +775,7 @@ class GuildIterator(_AsyncIterator['Guild']):
 
     async def next(self) -> Guild:
         if self.guilds.empty():
-            await self.fill_guilds()
+            await self._fill_ahead(self.fill_guilds, self.guilds)
 
         try:
             return self.guilds.get_nowait()
@@ -610,7 +834,7 @@ class GuildIterator(_AsyncIterator['Guild']):
 
 
 class MemberIterator(_AsyncIterator['Member']):
-    def __init__(self, guild, limit=1000, after=None):
+    def __init__(self, guild, limit=1000, after=None, prefetch=0):
 
         if isinstance(after, datetime.datetime):
             after = Object(id=time_snowflake(after, high=True))
@@ -618,6 +842,7 @@ class MemberIterator(_AsyncIterator['Member']):
         self.guild = guild
         self.limit = limit
         self.after = after or OLDEST_OBJECT
+        self.prefetch = prefetch
 
         self.state = self.guild._state
         self.get_members = self.state.http.get_members
@@ -625,7 +850,7 @@ class MemberIterator(_AsyncIterator['Member']):
 
     async def next(self) -> Member:
         if self.members.empty():
-            await self.fill_members()
+            await self._fill_ahead(self.fill_members, self.members)
 
         try:
             return self.members.get_nowait()
@@ -647,6 +872,7 @@ class MemberIterator(_AsyncIterator['Member']):
             data = await self.get_members(self.guild.id, self.retrieve, after)
             if not data:
                 # no data, terminate
+                self.limit = 0
                 return
 
             if len(data) < 1000:
@@ -672,10 +898,12 @@ class ArchivedThreadIterator(_AsyncIterator['Thread']):
         joined: bool,
         private: bool,
         before: Optional[Union[Snowflake, datetime.datetime]] = None,
+        prefetch: int = 0,
     ):
         self.channel_id = channel_id
         self.guild = guild
         self.limit = limit
+        self.prefetch = prefetch
         self.joined = joined
         self.private = private
         self.http = guild._state.http
@@ -712,7 +940,7 @@ class ArchivedThreadIterator(_AsyncIterator['Thread']):
 
     async def next(self) -> Thread:
         if self.queue.empty():
-            await self.fill_queue()
+            await self._fill_ahead(self.fill_queue, self.queue)
 
         try:
             return self.queue.get_nowait()
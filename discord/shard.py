@@ -42,6 +42,7 @@ from .errors import (
 )
 
 from .enums import Status
+from .stats import CacheStats
 
 from typing import TYPE_CHECKING, Any, Callable, Tuple, Type, Optional, List, Dict, TypeVar
 
@@ -325,6 +326,9 @@ class AutoShardedClient(Client):
         self.shard_ids: Optional[List[int]] = kwargs.pop('shard_ids', None)
         super().__init__(*args, loop=loop, **kwargs)
 
+        if self._event_source is not None:
+            raise ClientException('AutoShardedClient cannot be used with an event_source, use Client instead.')
+
         if self.shard_ids is not None:
             if self.shard_count is None:
                 raise ClientException('When passing manual shard_ids, you must provide a shard_count.')
@@ -383,6 +387,27 @@ class AutoShardedClient(Client):
         else:
             return ShardInfo(parent, self.shard_count)
 
+    def cache_stats(self, shard_id: Optional[int] = None) -> CacheStats:
+        """Returns the number of objects in each internal cache along with their estimated size.
+
+        This walks every cache and could be slow for clients with a large cache,
+        so it should not be called too often.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        shard_id: Optional[:class:`int`]
+            The shard ID to restrict the statistics to. Users and views are shared
+            between every shard and are always reported in full.
+
+        Returns
+        --------
+        :class:`.CacheStats`
+            The statistics of the internal cache.
+        """
+        return self._connection.cache_stats(shard_id)
+
     @property
     def shards(self) -> Dict[int, ShardInfo]:
         """Mapping[int, :class:`ShardInfo`]: Returns a mapping of shard IDs to their respective info object."""
@@ -420,6 +445,9 @@ class AutoShardedClient(Client):
 
     async def connect(self, *, reconnect: bool = True) -> None:
         self._reconnect = reconnect
+        if self._event_sink is not None:
+            await self._event_sink.start()
+
         await self.launch_shards()
 
         while not self.is_closed():
@@ -462,6 +490,9 @@ class AutoShardedClient(Client):
         if to_close:
             await asyncio.wait(to_close)
 
+        if self._event_sink is not None:
+            await self._event_sink.close()
+
         await self.http.close()
         self.__queue.put_nowait(EventItem(EventType.clean_close, None, None))
 
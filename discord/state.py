@@ -32,6 +32,7 @@ import itertools
 import logging
 from typing import Dict, Optional, TYPE_CHECKING, Union, Callable, Any, List, TypeVar, Coroutine, Sequence, Tuple, Deque
 import inspect
+import time
 
 import os
 
@@ -48,7 +49,7 @@ from .channel import _channel_factory
 from .raw_models import *
 from .member import Member
 from .role import Role
-from .enums import ChannelType, try_enum, Status
+from .enums import ChannelType, InteractionType, try_enum, Status
 from . import utils
 from .flags import ApplicationFlags, Intents, MemberCacheFlags
 from .object import Object
@@ -59,6 +60,7 @@ from .ui.view import ViewStore, View
 from .stage_instance import StageInstance
 from .threads import Thread, ThreadMember
 from .sticker import GuildSticker
+from .stats import CacheStats
 
 if TYPE_CHECKING:
     from .abc import PrivateChannel
@@ -133,6 +135,26 @@ class ChunkRequest:
 _log = logging.getLogger(__name__)
 
 
+class _StatelessParsers(dict):
+    # In stateless mode every gateway event is dispatched as-is, so the
+    # parser for an event is only built the first time the event is seen.
+    # The gateway_ prefix keeps these apart from the raw_ events, which
+    # carry the Raw*Event models rather than the payload.
+    def __init__(self, dispatch: Callable[..., None]) -> None:
+        super().__init__()
+        self.dispatch: Callable[..., None] = dispatch
+
+    def __missing__(self, key: str) -> Callable[[Dict[str, Any]], None]:
+        event = 'gateway_' + key.lower()
+        dispatch = self.dispatch
+
+        def parser(data: Dict[str, Any]) -> None:
+            dispatch(event, data)
+
+        self[key] = parser
+        return parser
+
+
 async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) -> Optional[T]:
     try:
         await coroutine
@@ -173,6 +195,10 @@ class ConnectionState:
         if self.guild_ready_timeout < 0:
             raise ValueError('guild_ready_timeout cannot be negative')
 
+        self.guild_create_slice_size: Optional[int] = options.get('guild_create_slice_size')
+        if self.guild_create_slice_size is not None and self.guild_create_slice_size <= 0:
+            raise ValueError('guild_create_slice_size must be greater than 0')
+
         allowed_mentions = options.get('allowed_mentions')
 
         if allowed_mentions is not None and not isinstance(allowed_mentions, AllowedMentions):
@@ -229,10 +255,16 @@ class ConnectionState:
             self.store_user = self.create_user  # type: ignore
             self.deref_user = self.deref_user_no_intents  # type: ignore
 
-        self.parsers = parsers = {}
-        for attr, func in inspect.getmembers(self):
-            if attr.startswith('parse_'):
-                parsers[attr[6:].upper()] = func
+        self.stateless: bool = options.get('stateless', False)
+        if self.stateless:
+            self.parsers = parsers = _StatelessParsers(self.dispatch)
+            parsers['READY'] = self._stateless_ready
+            parsers['RESUMED'] = self.parse_resumed
+        else:
+            self.parsers = parsers = {}
+            for attr, func in inspect.getmembers(self):
+                if attr.startswith('parse_'):
+                    parsers[attr[6:].upper()] = func
 
         self.clear()
 
@@ -269,6 +301,45 @@ class ConnectionState:
         else:
             self._messages: Optional[Deque[Message]] = None
 
+        # fetched results may be stale as the events that invalidate them could have been missed
+        self.http.clear_cached()
+
+    def cache_stats(self, shard_id: Optional[int] = None) -> CacheStats:
+        if shard_id is None:
+            guilds = list(self._guilds.values())
+            emojis = list(self._emojis.values())
+            stickers = list(self._stickers.values())
+            messages = list(self._messages or ())
+        else:
+            guilds = [guild for guild in self._guilds.values() if guild.shard_id == shard_id]
+            emojis = [emoji for guild in guilds for emoji in guild.emojis]
+            stickers = [sticker for guild in guilds for sticker in guild.stickers]
+            # direct messages are always sent to the first shard
+            messages = [m for m in self._messages or () if (m.guild.shard_id if m.guild else 0) == shard_id]
+
+        views = {view.id: view for view, _ in self._view_store._views.values()}
+        for view in self._view_store._synced_message_views.values():
+            views[view.id] = view
+
+        def flatten(attr: str) -> Tuple[int, Any]:
+            mappings = [getattr(guild, attr) for guild in guilds]
+            count = sum(map(len, mappings))
+            return count, itertools.chain.from_iterable(mapping.values() for mapping in mappings)
+
+        caches = {
+            'guilds': (len(guilds), guilds),
+            'members': flatten('_members'),
+            'users': (len(self._users), self._users.values()),
+            'messages': (len(messages), messages),
+            'channels': flatten('_channels'),
+            'threads': flatten('_threads'),
+            'emojis': (len(emojis), emojis),
+            'stickers': (len(stickers), stickers),
+            'views': (len(views), views.values()),
+            'private_channels': (len(self._private_channels), self._private_channels.values()),
+        }
+        return CacheStats(shard_id, caches)
+
     def process_chunk_requests(self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool) -> None:
         removed = []
         for key, request in self._chunk_requests.items():
@@ -582,6 +653,32 @@ class ConnectionState:
         self.dispatch('connect')
         self._ready_task = asyncio.create_task(self._delay_ready())
 
+    def _add_shard_ready(self, data) -> None:
+        # READY of another shard feeding the same client through an event source,
+        # unlike parse_ready this keeps the guilds received from the other shards
+        for guild_data in data['guilds']:
+            self._add_guild_from_data(guild_data)
+
+    def _stateless_ready(self, data) -> None:
+        # Only the data needed to keep the connection usable is retained,
+        # the guilds in the payload are passed through untouched.
+        self.clear(views=False)
+        self.user = ClientUser(state=self, data=data['user'])
+
+        if self.application_id is None:
+            try:
+                application = data['application']
+            except KeyError:
+                pass
+            else:
+                self.application_id = utils._get_as_snowflake(application, 'id')
+                self.application_flags = ApplicationFlags._from_value(application['flags'])
+
+        self.dispatch('gateway_ready', data)
+        self.dispatch('connect')
+        self.call_handlers('ready')
+        self.dispatch('ready')
+
     def parse_resumed(self, data) -> None:
         self.dispatch('resumed')
 
@@ -712,7 +809,10 @@ class ConnectionState:
 
     def parse_interaction_create(self, data) -> None:
         interaction = Interaction(data=data, state=self)
-        if data['type'] == 3:  # interaction component
+        self.dispatch_interaction(interaction)
+
+    def dispatch_interaction(self, interaction: Interaction) -> None:
+        if interaction.type is InteractionType.component:
             custom_id = interaction.data['custom_id']  # type: ignore
             component_type = interaction.data['component_type']  # type: ignore
             self._view_store.dispatch(component_type, custom_id, interaction)
@@ -737,6 +837,7 @@ class ConnectionState:
         old_member = Member._copy(member)
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self.http.invalidate_cached('/users/{user_id}', user_id=member_id)
             self.dispatch('user_update', user_update[0], user_update[1])
 
         self.dispatch('presence_update', old_member, member)
@@ -745,6 +846,7 @@ class ConnectionState:
         # self.user is *always* cached when this is called
         user: ClientUser = self.user  # type: ignore
         user._update(data)
+        self.http.invalidate_cached('/users/{user_id}', user_id=user.id)
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
@@ -760,6 +862,7 @@ class ConnectionState:
     def parse_channel_delete(self, data) -> None:
         guild = self._get_guild(utils._get_as_snowflake(data, 'guild_id'))
         channel_id = int(data['id'])
+        self.http.invalidate_cached('/channels/{channel_id}', channel_id=channel_id)
         if guild is not None:
             channel = guild.get_channel(channel_id)
             if channel is not None:
@@ -769,6 +872,7 @@ class ConnectionState:
     def parse_channel_update(self, data) -> None:
         channel_type = try_enum(ChannelType, data.get('type'))
         channel_id = int(data['id'])
+        self.http.invalidate_cached('/channels/{channel_id}', channel_id=channel_id)
         if channel_type is ChannelType.group:
             channel = self._get_private_channel(channel_id)
             old_channel = copy.copy(channel)
@@ -843,6 +947,7 @@ class ConnectionState:
 
     def parse_thread_update(self, data) -> None:
         guild_id = int(data['guild_id'])
+        self.http.invalidate_cached('/channels/{channel_id}', channel_id=data['id'])
         guild = self._get_guild(guild_id)
         if guild is None:
             _log.debug('THREAD_UPDATE referencing an unknown guild ID: %s. Discarding', guild_id)
@@ -861,6 +966,7 @@ class ConnectionState:
 
     def parse_thread_delete(self, data) -> None:
         guild_id = int(data['guild_id'])
+        self.http.invalidate_cached('/channels/{channel_id}', channel_id=data['id'])
         guild = self._get_guild(guild_id)
         if guild is None:
             _log.debug('THREAD_DELETE referencing an unknown guild ID: %s. Discarding', guild_id)
@@ -974,6 +1080,9 @@ class ConnectionState:
         self.dispatch('member_join', member)
 
     def parse_guild_member_remove(self, data) -> None:
+        self.http.invalidate_cached(
+            '/guilds/{guild_id}/members/{member_id}', guild_id=data['guild_id'], member_id=data['user']['id']
+        )
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
             try:
@@ -993,6 +1102,8 @@ class ConnectionState:
         guild = self._get_guild(int(data['guild_id']))
         user = data['user']
         user_id = int(user['id'])
+        self.http.invalidate_cached('/guilds/{guild_id}/members/{member_id}', guild_id=data['guild_id'], member_id=user_id)
+        self.http.invalidate_cached('/users/{user_id}', user_id=user_id)
         if guild is None:
             _log.debug('GUILD_MEMBER_UPDATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
             return
@@ -1082,14 +1193,52 @@ class ConnectionState:
         else:
             self.dispatch('guild_join', guild)
 
-    def parse_guild_create(self, data) -> None:
+    def parse_guild_create(self, data) -> Optional[Coroutine[Any, Any, None]]:
         unavailable = data.get('unavailable')
         if unavailable is True:
             # joined a guild with unavailable == True so..
             return
 
+        slice_size = self.guild_create_slice_size
+        if slice_size is not None and len(data.get('members', ())) > slice_size:
+            # the gateway awaits this before reading the next event of this shard
+            return self._incremental_guild_create(data, slice_size)
+
         guild = self._get_create_guild(data)
+        self._guild_create_complete(guild, unavailable)
 
+    async def _incremental_guild_create(self, data, slice_size: int) -> None:
+        start = time.perf_counter()
+        unavailable = data.get('unavailable')
+        partial = data.copy()
+        members = partial.pop('members')
+        presences = partial.pop('presences', [])
+        voice_states = partial.pop('voice_states', [])
+
+        guild = self._get_create_guild(partial)
+        # the guild is only marked as available once every member is loaded
+        guild.unavailable = True
+        worst = time.perf_counter() - start
+
+        for items, load in ((members, guild._load_members), (presences, guild._load_presences)):
+            for index in range(0, len(items), slice_size):
+                await asyncio.sleep(0)
+                start = time.perf_counter()
+                load(items[index : index + slice_size])
+                worst = max(worst, time.perf_counter() - start)
+
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        for obj in voice_states:
+            guild._update_voice_state(obj, int(obj['channel_id']))
+
+        guild.unavailable = False
+        worst = max(worst, time.perf_counter() - start)
+
+        _log.debug('Processed GUILD_CREATE for guild ID %s in slices, blocking the loop for at most %.2fms.', guild.id, worst * 1000)
+        self._guild_create_complete(guild, unavailable)
+
+    def _guild_create_complete(self, guild: Guild, unavailable: Optional[bool]) -> None:
         try:
             # Notify the on_ready state, if any, that this guild is complete.
             self._ready_state.put_nowait(guild)
@@ -1164,6 +1313,7 @@ class ConnectionState:
             self.dispatch('member_unban', guild, user)
 
     def parse_guild_role_create(self, data) -> None:
+        self.http.invalidate_cached('/guilds/{guild_id}/roles', guild_id=data['guild_id'])
         guild = self._get_guild(int(data['guild_id']))
         if guild is None:
             _log.debug('GUILD_ROLE_CREATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -1175,6 +1325,7 @@ class ConnectionState:
         self.dispatch('guild_role_create', role)
 
     def parse_guild_role_delete(self, data) -> None:
+        self.http.invalidate_cached('/guilds/{guild_id}/roles', guild_id=data['guild_id'])
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
             role_id = int(data['role_id'])
@@ -1188,6 +1339,7 @@ class ConnectionState:
             _log.debug('GUILD_ROLE_DELETE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
 
     def parse_guild_role_update(self, data) -> None:
+        self.http.invalidate_cached('/guilds/{guild_id}/roles', guild_id=data['guild_id'])
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
             role_data = data['role']
@@ -1537,6 +1689,11 @@ class AutoShardedConnectionState(ConnectionState):
         if self._ready_task is None:
             self._ready_task = asyncio.create_task(self._delay_ready())
 
+    def _stateless_ready(self, data) -> None:
+        self.dispatch('shard_connect', data['__shard_id__'])
+        super()._stateless_ready(data)
+        self.dispatch('shard_ready', data['__shard_id__'])
+
     def parse_resumed(self, data) -> None:
         self.dispatch('resumed')
         self.dispatch('shard_resumed', data['__shard_id__'])
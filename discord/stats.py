@@ -0,0 +1,486 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import sys
+import time
+import types
+from typing import Any, Callable, Coroutine, Dict, Generator, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .enums import RequestPriority
+    from .http import Route
+
+__all__ = (
+    'CacheStats',
+    'EventStats',
+    'GatewayEventStats',
+    'RequestTrace',
+)
+
+_log = logging.getLogger(__name__)
+
+
+class GatewayEventStats:
+    """Timing information about a single gateway event type.
+
+    All durations are in seconds.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    event: :class:`str`
+        The gateway event type, e.g. ``'MESSAGE_CREATE'``.
+    count: :class:`int`
+        The number of events of this type that were received.
+    bytes: :class:`int`
+        The total size in bytes of the decompressed JSON payloads of this type.
+        Events received through an :class:`EventSource` are not counted.
+    parse_time: :class:`float`
+        The total time spent in the library parsing events of this type. This
+        includes parsing that continues in the background, such as loading the
+        members of a large guild in slices on ``GUILD_CREATE``, but not the time
+        spent waiting in between.
+    max_parse_time: :class:`float`
+        The longest time spent parsing a single event of this type.
+    max_block_time: :class:`float`
+        The longest time parsing an event of this type blocked the event loop
+        without yielding. This is the same as :attr:`max_parse_time` except for
+        parsing that continues in the background, where it is the longest single
+        step, such as one slice of members of a large guild on ``GUILD_CREATE``.
+    listeners: :class:`int`
+        The number of event listeners that ran as a result of events of this type.
+    listener_delay: :class:`float`
+        The total time between receiving an event and one of its listeners starting.
+    max_listener_delay: :class:`float`
+        The longest time between receiving an event and one of its listeners starting.
+    listener_time: :class:`float`
+        The total time between receiving an event and one of its listeners finishing.
+    max_listener_time: :class:`float`
+        The longest time between receiving an event and one of its listeners finishing.
+    """
+
+    __slots__ = (
+        'event',
+        'count',
+        'bytes',
+        'parse_time',
+        'max_parse_time',
+        'max_block_time',
+        'listeners',
+        'listener_delay',
+        'max_listener_delay',
+        'listener_time',
+        'max_listener_time',
+    )
+
+    def __init__(self, event: str) -> None:
+        self.event: str = event
+        self.count: int = 0
+        self.bytes: int = 0
+        self.parse_time: float = 0.0
+        self.max_parse_time: float = 0.0
+        self.max_block_time: float = 0.0
+        self.listeners: int = 0
+        self.listener_delay: float = 0.0
+        self.max_listener_delay: float = 0.0
+        self.listener_time: float = 0.0
+        self.max_listener_time: float = 0.0
+
+    def __repr__(self) -> str:
+        return f'<GatewayEventStats event={self.event!r} count={self.count} parse_time={self.parse_time:.6f}>'
+
+    @property
+    def average_parse_time(self) -> float:
+        """:class:`float`: The average time spent parsing a single event of this type."""
+        return self.parse_time / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as a :class:`dict` suitable for exporters."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+
+class EventStats:
+    """Collects per event type statistics about gateway events.
+
+    This is only available through :attr:`Client.event_stats` when the client
+    is created with ``enable_event_stats`` set to ``True``.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    events: Dict[:class:`str`, :class:`GatewayEventStats`]
+        A mapping of gateway event type to its statistics.
+    started_at: :class:`float`
+        The :func:`time.perf_counter` value at which collection started or was last reset.
+    """
+
+    def __init__(self) -> None:
+        self.events: Dict[str, GatewayEventStats] = {}
+        self.started_at: float = time.perf_counter()
+        self._exporters: List[Callable[[EventStats], Any]] = []
+        # the gateway event type and receive time of the event currently being parsed
+        self._current: Optional[Tuple[GatewayEventStats, float]] = None
+
+    def __repr__(self) -> str:
+        return f'<EventStats events={len(self.events)}>'
+
+    def get(self, event: str) -> Optional[GatewayEventStats]:
+        """Returns the statistics of a gateway event type, or ``None`` if it was never received.
+
+        Parameters
+        -----------
+        event: :class:`str`
+            The gateway event type, e.g. ``'MESSAGE_CREATE'``.
+
+        Returns
+        --------
+        Optional[:class:`GatewayEventStats`]
+            The statistics of the event type.
+        """
+        return self.events.get(event)
+
+    def reset(self) -> None:
+        """Clears every collected statistic."""
+        self.events = {}
+        self.started_at = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a snapshot of the statistics keyed by gateway event type."""
+        return {event: stats.to_dict() for event, stats in self.events.items()}
+
+    def add_exporter(self, func: Callable[[EventStats], Any]) -> None:
+        """Registers a callable that is called with this object on every :meth:`export`.
+
+        Parameters
+        -----------
+        func
+            The exporter to register.
+        """
+        self._exporters.append(func)
+
+    def remove_exporter(self, func: Callable[[EventStats], Any]) -> None:
+        """Removes a previously registered exporter. This does nothing if it is not registered.
+
+        Parameters
+        -----------
+        func
+            The exporter to remove.
+        """
+        try:
+            self._exporters.remove(func)
+        except ValueError:
+            pass
+
+    def export(self) -> None:
+        """Calls every registered exporter.
+
+        This is meant to be called periodically, e.g. from a :class:`~discord.ext.tasks.Loop`.
+        Exceptions raised by exporters are logged and otherwise ignored.
+        """
+        for func in self._exporters:
+            try:
+                func(self)
+            except Exception:
+                _log.exception('Exporter %r raised an exception', func)
+
+    def _record_parse(self, event: str, func: Callable[[Any], Any], data: Any, size: int, received: float) -> Any:
+        try:
+            stats = self.events[event]
+        except KeyError:
+            stats = self.events[event] = GatewayEventStats(event)
+
+        stats.count += 1
+        stats.bytes += size
+        self._current = (stats, received)
+        start = time.perf_counter()
+        pending = None
+        try:
+            pending = func(data)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._current = None
+            self._add_block_time(stats, elapsed)
+            if pending is None:
+                self._add_parse_time(stats, elapsed)
+
+        if pending is None:
+            return None
+        # the parser continues in a coroutine, e.g. GUILD_CREATE of a large guild
+        return self._time_pending(pending, stats, received, elapsed)
+
+    def _add_parse_time(self, stats: GatewayEventStats, elapsed: float) -> None:
+        stats.parse_time += elapsed
+        if elapsed > stats.max_parse_time:
+            stats.max_parse_time = elapsed
+
+    def _add_block_time(self, stats: GatewayEventStats, elapsed: float) -> None:
+        if elapsed > stats.max_block_time:
+            stats.max_block_time = elapsed
+
+    @types.coroutine
+    def _time_pending(
+        self, coro: Coroutine[Any, Any, Any], stats: GatewayEventStats, received: float, elapsed: float
+    ) -> Generator[Any, Any, Any]:
+        # steps through the coroutine by hand so that only the time spent in it
+        # is counted, not the time it spends suspended
+        value: Any = None
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                self._current = (stats, received)
+                start = time.perf_counter()
+                try:
+                    if error is None:
+                        yielded = coro.send(value)
+                    else:
+                        yielded = coro.throw(error)
+                except StopIteration as exc:
+                    return exc.value
+                finally:
+                    step = time.perf_counter() - start
+                    elapsed += step
+                    self._add_block_time(stats, step)
+                    self._current = None
+
+                try:
+                    value, error = (yield yielded), None
+                except BaseException as exc:
+                    value, error = None, exc
+        finally:
+            self._add_parse_time(stats, elapsed)
+
+    async def _time_listener(self, coro: Coroutine[Any, Any, Any], stats: GatewayEventStats, received: float) -> None:
+        delay = time.perf_counter() - received
+        try:
+            await coro
+        finally:
+            total = time.perf_counter() - received
+            stats.listeners += 1
+            stats.listener_delay += delay
+            stats.listener_time += total
+            if delay > stats.max_listener_delay:
+                stats.max_listener_delay = delay
+            if total > stats.max_listener_time:
+                stats.max_listener_time = total
+
+
+class RequestTrace:
+    """Timing information about a single HTTP request made to the Discord API.
+
+    These are passed to the ``http_trace_hook`` of a :class:`Client` once a
+    request finishes, whether it succeeded or not. All durations are in seconds
+    and accumulate over every attempt of the request.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    method: :class:`str`
+        The HTTP method of the request.
+    path: :class:`str`
+        The route template of the request, e.g. ``'/channels/{channel_id}/messages'``.
+    bucket: :class:`str`
+        The rate limit bucket the request was handled under.
+    priority: :class:`RequestPriority`
+        The priority class the request was sent with.
+    global_wait: :class:`float`
+        The time spent waiting for the global rate limit to be over.
+    lock_wait: :class:`float`
+        The time spent waiting for the rate limit bucket to be available.
+    ratelimit_wait: :class:`float`
+        The time spent sleeping after receiving a 429 response.
+    dns: :class:`float`
+        The time spent resolving host names.
+    connect: :class:`float`
+        The time spent establishing new connections.
+    ttfb: :class:`float`
+        The time between sending the request and receiving the response headers,
+        including the time spent establishing a connection.
+    total: :class:`float`
+        The total time spent in the request, including waiting for rate limits.
+    status: Optional[:class:`int`]
+        The HTTP status of the last response, if any was received.
+    retries: :class:`int`
+        The number of times the request was retried.
+    error: Optional[:class:`Exception`]
+        The exception the request raised, if any.
+    """
+
+    __slots__ = (
+        'method',
+        'path',
+        'bucket',
+        'priority',
+        'global_wait',
+        'lock_wait',
+        'ratelimit_wait',
+        'dns',
+        'connect',
+        'ttfb',
+        'total',
+        'status',
+        'retries',
+        'error',
+        '_started',
+        '_attempt_started',
+        '_dns_started',
+        '_connect_started',
+    )
+
+    def __init__(self, route: Route, priority: RequestPriority) -> None:
+        self.method: str = route.method
+        self.path: str = route.path
+        self.bucket: str = route.bucket
+        self.priority: RequestPriority = priority
+        self.global_wait: float = 0.0
+        self.lock_wait: float = 0.0
+        self.ratelimit_wait: float = 0.0
+        self.dns: float = 0.0
+        self.connect: float = 0.0
+        self.ttfb: float = 0.0
+        self.total: float = 0.0
+        self.status: Optional[int] = None
+        self.retries: int = 0
+        self.error: Optional[Exception] = None
+        self._started: float = time.perf_counter()
+        self._attempt_started: float = self._started
+        self._dns_started: float = self._started
+        self._connect_started: float = self._started
+
+    def __repr__(self) -> str:
+        return f'<RequestTrace method={self.method} path={self.path!r} status={self.status} total={self.total:.6f}>'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the trace as a :class:`dict` suitable for exporters."""
+        return {attr: getattr(self, attr) for attr in self.__slots__ if attr[0] != '_'}
+
+
+# only values owned by an object are counted towards its size, references
+# to other models are accounted for in their own cache
+_OWNED_TYPES = (str, bytes, int, float, tuple, list, dict, set, frozenset)
+
+
+def _object_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for attr in slots:
+            value = getattr(obj, attr, None)
+            if isinstance(value, _OWNED_TYPES) and value.__class__ is not bool:
+                size += sys.getsizeof(value)
+
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+        for value in attrs.values():
+            if isinstance(value, _OWNED_TYPES) and value.__class__ is not bool:
+                size += sys.getsizeof(value)
+    return size
+
+
+def _estimate_size(objects: Iterable[Any], count: int, sample_size: int) -> int:
+    sample = list(itertools.islice(objects, sample_size))
+    if not sample:
+        return 0
+    return int(sum(map(_object_size, sample)) / len(sample) * count)
+
+
+class CacheStats:
+    """A snapshot of the size of the internal cache of a :class:`Client`.
+
+    This is returned by :meth:`Client.cache_stats`. Sizes are estimated from a sample
+    of each cache and only account for the data owned by each object, so they are
+    meant for spotting trends and leaks rather than exact accounting.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    shard_id: Optional[:class:`int`]
+        The shard the statistics are restricted to, if any.
+    guilds: :class:`int`
+        The number of cached guilds.
+    members: :class:`int`
+        The number of cached members.
+    users: :class:`int`
+        The number of cached users.
+    messages: :class:`int`
+        The number of cached messages.
+    channels: :class:`int`
+        The number of cached guild channels.
+    threads: :class:`int`
+        The number of cached threads.
+    emojis: :class:`int`
+        The number of cached emojis.
+    stickers: :class:`int`
+        The number of cached stickers.
+    views: :class:`int`
+        The number of views listening for interactions.
+    private_channels: :class:`int`
+        The number of cached private channels.
+    sizes: Dict[:class:`str`, :class:`int`]
+        The estimated size in bytes of each cache, keyed by the attribute name of its count.
+    """
+
+    __slots__ = (
+        'shard_id',
+        'guilds',
+        'members',
+        'users',
+        'messages',
+        'channels',
+        'threads',
+        'emojis',
+        'stickers',
+        'views',
+        'private_channels',
+        'sizes',
+    )
+
+    def __init__(self, shard_id: Optional[int], caches: Dict[str, Tuple[int, Iterable[Any]]], *, sample_size: int = 64) -> None:
+        self.shard_id: Optional[int] = shard_id
+        self.sizes: Dict[str, int] = {}
+        for name, (count, objects) in caches.items():
+            setattr(self, name, count)
+            self.sizes[name] = _estimate_size(objects, count, sample_size)
+
+    def __repr__(self) -> str:
+        return f'<CacheStats shard_id={self.shard_id} guilds={self.guilds} members={self.members} users={self.users}>'
+
+    @property
+    def total_size(self) -> int:
+        """:class:`int`: The estimated size in bytes of every cache combined."""
+        return sum(self.sizes.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as a :class:`dict` suitable for exporters."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
@@ -38,10 +38,10 @@ import aiohttp
 from .. import utils
 from ..errors import InvalidArgument, HTTPException, Forbidden, NotFound, DiscordServerError
 from ..message import Message
-from ..enums import try_enum, WebhookType
+from ..enums import try_enum, RequestPriority, WebhookType
 from ..user import BaseUser, User
 from ..asset import Asset
-from ..http import Route
+from ..http import HTTPClient, Route
 from ..mixins import Hashable
 from ..channel import PartialMessageable
 
@@ -108,7 +108,19 @@ class AsyncWebhookAdapter:
         reason: Optional[str] = None,
         auth_token: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Any:
+        http = HTTPClient.from_session(session)
+        if http is not None:
+            # webhooks bound to a client share its rate limits, priorities and request traces
+            # only send the token the webhook was given, webhook token routes are unauthenticated
+            kwargs: Dict[str, Any] = {'reason': reason, 'params': params, 'auth_token': auth_token, 'priority': priority}
+            if payload is not None:
+                kwargs['json'] = payload
+            data = await http.request(route, form=multipart, files=files, **kwargs)
+            # empty responses are returned as None rather than an empty string
+            return None if data == '' else data
+
         headers: Dict[str, str] = {}
         files = files or []
         to_send: Optional[Union[str, aiohttp.FormData]] = None
@@ -260,12 +272,15 @@ class AsyncWebhookAdapter:
         files: Optional[List[File]] = None,
         thread_id: Optional[int] = None,
         wait: bool = False,
+        priority: Optional[RequestPriority] = None,
     ) -> Response[Optional[MessagePayload]]:
         params = {'wait': int(wait)}
         if thread_id:
             params['thread_id'] = thread_id
         route = Route('POST', '/webhooks/{webhook_id}/{webhook_token}', webhook_id=webhook_id, webhook_token=token)
-        return self.request(route, session, payload=payload, multipart=multipart, files=files, params=params)
+        return self.request(
+            route, session, payload=payload, multipart=multipart, files=files, params=params, priority=priority
+        )
 
     def get_webhook_message(
         self,
@@ -274,6 +289,7 @@ class AsyncWebhookAdapter:
         message_id: int,
         *,
         session: aiohttp.ClientSession,
+        priority: Optional[RequestPriority] = None,
     ) -> Response[MessagePayload]:
         route = Route(
             'GET',
@@ -282,7 +298,7 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
-        return self.request(route, session)
+        return self.request(route, session, priority=priority)
 
     def edit_webhook_message(
         self,
@@ -294,6 +310,7 @@ class AsyncWebhookAdapter:
         payload: Optional[Dict[str, Any]] = None,
         multipart: Optional[List[Dict[str, Any]]] = None,
         files: Optional[List[File]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Response[Message]:
         route = Route(
             'PATCH',
@@ -302,7 +319,7 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
-        return self.request(route, session, payload=payload, multipart=multipart, files=files)
+        return self.request(route, session, payload=payload, multipart=multipart, files=files, priority=priority)
 
     def delete_webhook_message(
         self,
@@ -311,6 +328,7 @@ class AsyncWebhookAdapter:
         message_id: int,
         *,
         session: aiohttp.ClientSession,
+        priority: Optional[RequestPriority] = None,
     ) -> Response[None]:
         route = Route(
             'DELETE',
@@ -319,7 +337,7 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
-        return self.request(route, session)
+        return self.request(route, session, priority=priority)
 
     def fetch_webhook(
         self,
@@ -937,6 +955,13 @@ class Webhook(BaseWebhook):
         """:class:`str` : Returns the webhook's url."""
         return f'https://discord.com/api/webhooks/{self.id}/{self.token}'
 
+    @property
+    def _priority(self) -> Optional[RequestPriority]:
+        # application webhooks are interaction followups, whose tokens expire quickly
+        if self.type is WebhookType.application:
+            return RequestPriority.interaction
+        return None
+
     @classmethod
     def partial(cls, id: int, token: str, *, session: aiohttp.ClientSession, bot_token: Optional[str] = None) -> Webhook:
         """Creates a partial :class:`Webhook`.
@@ -1393,6 +1418,7 @@ class Webhook(BaseWebhook):
             files=params.files,
             thread_id=thread_id,
             wait=wait,
+            priority=self._priority,
         )
 
         msg = None
@@ -1443,6 +1469,7 @@ class Webhook(BaseWebhook):
             self.token,
             id,
             session=self.session,
+            priority=self._priority,
         )
         return self._create_message(data)
 
@@ -1549,6 +1576,7 @@ class Webhook(BaseWebhook):
             payload=params.payload,
             multipart=params.multipart,
             files=params.files,
+            priority=self._priority,
         )
 
         message = self._create_message(data)
@@ -1587,4 +1615,5 @@ class Webhook(BaseWebhook):
             self.token,
             message_id,
             session=self.session,
+            priority=self._priority,
         )
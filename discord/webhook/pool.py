@@ -0,0 +1,304 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Sequence, TYPE_CHECKING
+
+from .. import utils
+from ..errors import InvalidArgument
+
+if TYPE_CHECKING:
+    from .async_ import Webhook
+    from ..embeds import Embed
+
+__all__ = (
+    'WebhookPool',
+)
+
+_log = logging.getLogger(__name__)
+
+MISSING = utils.MISSING
+
+
+class _QueuedMessage:
+    __slots__ = ('content', 'embeds', 'username', 'avatar_url')
+
+    def __init__(self, content: Optional[str], embeds: List[Embed], username: Any, avatar_url: Any) -> None:
+        self.content: Optional[str] = content
+        self.embeds: List[Embed] = embeds
+        self.username: Any = username
+        self.avatar_url: Any = avatar_url
+
+
+class _Batch:
+    __slots__ = ('content', 'embeds', 'username', 'avatar_url', 'count', 'merge_content', '_embed_length')
+
+    def __init__(self, message: _QueuedMessage, merge_content: bool) -> None:
+        self.merge_content: bool = merge_content
+        self.content: Optional[str] = message.content
+        self.embeds: List[Embed] = list(message.embeds)
+        self.username: Any = message.username
+        self.avatar_url: Any = message.avatar_url
+        self.count: int = 1
+        self._embed_length: int = sum(len(e) for e in message.embeds)
+
+    @property
+    def full(self) -> bool:
+        return len(self.embeds) >= 10
+
+    def add(self, message: _QueuedMessage) -> bool:
+        # MISSING never compares equal, not even to itself
+        if not (message.username is self.username or message.username == self.username):
+            return False
+        if not (message.avatar_url is self.avatar_url or message.avatar_url == self.avatar_url):
+            return False
+
+        # Discord allows 10 embeds with 6000 characters in total and 2000 characters of content
+        embed_length = self._embed_length + sum(len(e) for e in message.embeds)
+        if len(self.embeds) + len(message.embeds) > 10 or embed_length > 6000:
+            return False
+
+        content = self.content
+        if not self.merge_content and (content is not None or message.content is not None):
+            return False
+
+        if message.content is not None:
+            content = message.content if content is None else f'{content}\n{message.content}'
+            if len(content) > 2000:
+                return False
+
+        self.content = content
+        self.embeds.extend(message.embeds)
+        self._embed_length = embed_length
+        self.count += 1
+        return True
+
+
+class WebhookPool:
+    """Sends messages through a pool of webhooks, coalescing queued messages.
+
+    Every webhook is rate limited on its own, so spreading messages over
+    multiple webhooks of the same channel multiplies the throughput. Queued
+    messages made only of embeds that have the same ``username`` and
+    ``avatar_url`` are merged into a single message as long as the result has
+    at most 10 embeds and fits Discord's embed length limits. Messages with
+    content are sent as they are, unless ``merge_content`` is enabled.
+
+    Every webhook sends the next batch as soon as it is no longer rate limited,
+    so messages sent through different webhooks may arrive out of order.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ------------
+    webhooks: Sequence[:class:`Webhook`]
+        The webhooks to send messages through. These should all belong to the
+        same channel and must have a token.
+    max_queue: :class:`int`
+        The maximum number of messages waiting to be sent. Once reached,
+        :meth:`send` waits until there is room again. Defaults to ``1000``.
+    flush_interval: :class:`float`
+        The number of seconds to wait for more messages to merge with once a
+        message is queued. Defaults to ``0.5``.
+    merge_content: :class:`bool`
+        Whether messages with content are merged as well, joining their content
+        with newlines as long as it fits in 2000 characters. Defaults to ``False``.
+
+    Attributes
+    ------------
+    webhooks: List[:class:`Webhook`]
+        The webhooks messages are sent through.
+    flush_interval: :class:`float`
+        The number of seconds to wait for more messages to merge with.
+    merge_content: :class:`bool`
+        Whether messages with content are merged as well.
+    """
+
+    def __init__(
+        self,
+        webhooks: Sequence[Webhook],
+        *,
+        max_queue: int = 1000,
+        flush_interval: float = 0.5,
+        merge_content: bool = False,
+    ):
+        if not webhooks:
+            raise ValueError('at least one webhook is required')
+
+        self.webhooks: List[Webhook] = list(webhooks)
+        self.flush_interval: float = flush_interval
+        self.merge_content: bool = merge_content
+        self._max_queue: int = max_queue
+        # created on first use so they bind to the running loop on Python < 3.10
+        self._queue: Optional[asyncio.Queue[_QueuedMessage]] = None
+        self._batch_lock: Optional[asyncio.Lock] = None
+        self._leftover: Optional[_QueuedMessage] = None
+        self._workers: List[asyncio.Task[None]] = []
+
+    def __repr__(self) -> str:
+        return f'<WebhookPool webhooks={len(self.webhooks)} queued={self.queued}>'
+
+    @property
+    def queued(self) -> int:
+        """:class:`int`: The number of messages waiting to be sent."""
+        queue = self._queue
+        return (0 if queue is None else queue.qsize()) + (self._leftover is not None)
+
+    async def send(
+        self,
+        content: Optional[str] = None,
+        *,
+        embed: Embed = MISSING,
+        embeds: List[Embed] = MISSING,
+        username: str = MISSING,
+        avatar_url: Any = MISSING,
+    ) -> None:
+        """|coro|
+
+        Queues a message to be sent through the pool.
+
+        This waits while the queue is full. Errors raised while sending are
+        logged rather than raised, since the message is sent in the background.
+
+        Parameters
+        ------------
+        content: Optional[:class:`str`]
+            The content of the message to send.
+        embed: :class:`Embed`
+            The rich embed for the content to send. This cannot be mixed with
+            ``embeds`` parameter.
+        embeds: List[:class:`Embed`]
+            A list of embeds to send with the content. Maximum of 10. This cannot
+            be mixed with the ``embed`` parameter.
+        username: :class:`str`
+            The username to send with this message. If no username is provided
+            then the default username for the webhook is used.
+        avatar_url: :class:`str`
+            The avatar URL to send with this message. If no avatar URL is provided
+            then the default avatar for the webhook is used.
+
+        Raises
+        --------
+        InvalidArgument
+            Both ``embed`` and ``embeds`` were passed, more than 10 embeds were
+            passed, or the message was empty.
+        """
+        if embed is not MISSING and embeds is not MISSING:
+            raise InvalidArgument('Cannot mix embed and embeds keyword arguments.')
+
+        if embed is not MISSING:
+            embeds = [embed]
+        elif embeds is MISSING:
+            embeds = []
+        elif len(embeds) > 10:
+            raise InvalidArgument('embeds has a maximum of 10 elements.')
+
+        if content is not None:
+            content = str(content)
+        elif not embeds:
+            raise InvalidArgument('Cannot send an empty message.')
+
+        if self._queue is None:
+            self._queue = asyncio.Queue(self._max_queue)
+            self._batch_lock = asyncio.Lock()
+
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker(webhook)) for webhook in self.webhooks]
+
+        await self._queue.put(_QueuedMessage(content, embeds, username, avatar_url))
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Waits until every queued message has been sent.
+        """
+        if self._workers and self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Sends every queued message and stops the pool.
+        """
+        await self.flush()
+        for task in self._workers:
+            task.cancel()
+        self._workers = []
+
+    async def _get(self, timeout: Optional[float]) -> Optional[_QueuedMessage]:
+        if self._leftover is not None:
+            message, self._leftover = self._leftover, None
+            return message
+
+        queue: asyncio.Queue[_QueuedMessage] = self._queue  # type: ignore
+        if timeout is None:
+            return await queue.get()
+
+        try:
+            return queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _next_batch(self) -> _Batch:
+        # one batch is assembled at a time so messages are merged in order
+        async with self._batch_lock:  # type: ignore
+            loop = asyncio.get_running_loop()
+            batch = _Batch(await self._get(None), self.merge_content)  # type: ignore
+            deadline = loop.time() + self.flush_interval
+            while not batch.full:
+                message = await self._get(deadline - loop.time())
+                if message is None:
+                    break
+                if not batch.add(message):
+                    self._leftover = message
+                    break
+            return batch
+
+    async def _worker(self, webhook: Webhook) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await webhook.send(
+                    batch.content or MISSING,
+                    embeds=batch.embeds or MISSING,
+                    username=batch.username,
+                    avatar_url=batch.avatar_url,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _log.exception('Sending %s queued message(s) through webhook ID %s failed.', batch.count, webhook.id)
+            finally:
+                for _ in range(batch.count):
+                    self._queue.task_done()  # type: ignore
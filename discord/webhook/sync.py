@@ -32,12 +32,16 @@ from __future__ import annotations
 
 import threading
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
+import os
 import time
 import re
+import weakref
 
 from urllib.parse import quote as urlquote
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Tuple, Type, TypeVar, Union, overload
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, TYPE_CHECKING, Tuple, Type, TypeVar, Union, overload
 
 from .. import utils
 from ..errors import InvalidArgument, HTTPException, Forbidden, NotFound, DiscordServerError
@@ -50,10 +54,13 @@ from .async_ import BaseWebhook, handle_message_parameters, _WebhookState
 __all__ = (
     'SyncWebhook',
     'SyncWebhookMessage',
+    'SyncWebhookSender',
 )
 
 _log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 if TYPE_CHECKING:
     from ..file import File
     from ..embeds import Embed
@@ -89,9 +96,84 @@ class DeferredLock:
         self.lock.release()
 
 
+class MultipartStream:
+    """A ``multipart/form-data`` request body that reads its files lazily.
+
+    ``requests`` reads every file into memory when building a multipart body,
+    this is passed as a file-like body instead so that files are streamed from
+    their current position as the request is sent.
+    """
+
+    def __init__(self, multipart: List[Dict[str, Any]]):
+        boundary = os.urandom(16).hex()
+        self.content_type: str = f'multipart/form-data; boundary={boundary}'
+        self._parts: List[Any] = []
+        self._remaining: List[int] = []
+        for p in multipart:
+            name = p['name'].replace('"', '%22')
+            header = f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+            filename = p.get('filename')
+            if filename is not None:
+                filename = filename.replace('"', '%22')
+                header = f'{header}; filename="{filename}"'
+            content_type = p.get('content_type')
+            if content_type is not None:
+                header = f'{header}\r\nContent-Type: {content_type}'
+
+            self._add(f'{header}\r\n\r\n'.encode('utf-8'))
+            value = p['value']
+            if isinstance(value, str):
+                self._add(value.encode('utf-8'))
+            else:
+                position = value.tell()
+                size = value.seek(0, os.SEEK_END) - position
+                value.seek(position)
+                self._parts.append(value)
+                self._remaining.append(size)
+            self._add(b'\r\n')
+
+        self._add(f'--{boundary}--\r\n'.encode('utf-8'))
+        self.len: int = sum(self._remaining)
+
+    def _add(self, data: bytes) -> None:
+        self._parts.append(data)
+        self._remaining.append(len(data))
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and size != 0:
+            part = self._parts[0]
+            remaining = self._remaining[0]
+            amount = remaining if size < 0 else min(size, remaining)
+            if isinstance(part, bytes):
+                chunk = part[len(part) - remaining : len(part) - remaining + amount]
+            else:
+                chunk = part.read(amount)
+
+            if len(chunk) < amount or remaining == amount:
+                del self._parts[0]
+                del self._remaining[0]
+            else:
+                self._remaining[0] -= amount
+
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b''.join(chunks)
+
+
+# adapters are thread local but the rate limits they respect are not
+# a bucket's lock is only kept alive by the requests currently using it
+_bucket_locks: weakref.WeakValueDictionary[Any, threading.Lock] = weakref.WeakValueDictionary()
+_bucket_locks_guard = threading.Lock()
+
+
 class WebhookAdapter:
     def __init__(self):
-        self._locks: Dict[Any, threading.Lock] = {}
+        self._locks: weakref.WeakValueDictionary[Any, threading.Lock] = _bucket_locks
 
     def request(
         self,
@@ -107,13 +189,13 @@ class WebhookAdapter:
     ) -> Any:
         headers: Dict[str, str] = {}
         files = files or []
-        to_send: Optional[Union[str, Dict[str, Any]]] = None
+        to_send: Optional[Union[str, MultipartStream]] = None
         bucket = (route.webhook_id, route.webhook_token)
 
-        try:
-            lock = self._locks[bucket]
-        except KeyError:
-            self._locks[bucket] = lock = threading.Lock()
+        with _bucket_locks_guard:
+            lock = self._locks.get(bucket)
+            if lock is None:
+                self._locks[bucket] = lock = threading.Lock()
 
         if payload is not None:
             headers['Content-Type'] = 'application/json'
@@ -127,7 +209,6 @@ class WebhookAdapter:
 
         response: Optional[Response] = None
         data: Optional[Union[Dict[str, Any], str]] = None
-        file_data: Optional[Dict[str, Any]] = None
         method = route.method
         url = route.url
         webhook_id = route.webhook_id
@@ -138,18 +219,11 @@ class WebhookAdapter:
                     file.reset(seek=attempt)
 
                 if multipart:
-                    file_data = {}
-                    for p in multipart:
-                        name = p['name']
-                        if name == 'payload_json':
-                            to_send = {'payload_json': p['value']}
-                        else:
-                            file_data[name] = (p['filename'], p['value'], p['content_type'])
+                    to_send = MultipartStream(multipart)
+                    headers['Content-Type'] = to_send.content_type
 
                 try:
-                    with session.request(
-                        method, url, data=to_send, files=file_data, headers=headers, params=params
-                    ) as response:
+                    with session.request(method, url, data=to_send, headers=headers, params=params) as response:
                         _log.debug(
                             'Webhook ID %s with %s %s has returned status code %s',
                             webhook_id,
@@ -1065,3 +1139,176 @@ class SyncWebhook(BaseWebhook):
             message_id,
             session=self.session,
         )
+
+
+class SyncWebhookSender:
+    """Sends webhook messages from a pool of background threads.
+
+    Every call returns a :class:`concurrent.futures.Future` right away, so a
+    single thread can keep many webhook requests in flight. Requests are sent
+    through a pooled :class:`requests.Session` that keeps connections alive
+    between requests. Rate limits are shared between every thread.
+
+    Messages sent through :meth:`send` are sent in order, one at a time per
+    webhook, so a rate limited webhook only ever holds up a single thread while
+    the other threads keep sending for other webhooks.
+
+    This can be used as a context manager, which calls :meth:`close` on exit.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ------------
+    max_workers: :class:`int`
+        The number of threads sending requests. Defaults to ``4``.
+    max_pending: Optional[:class:`int`]
+        The maximum number of requests that are queued or in flight. Once
+        reached, :meth:`send` blocks until one finishes. Defaults to ``None``,
+        which does not limit the queue.
+
+    Attributes
+    ------------
+    session: :class:`requests.Session`
+        The pooled session requests are sent with. Webhooks created through
+        :meth:`partial` and :meth:`from_url` use this session.
+    """
+
+    def __init__(self, *, max_workers: int = 4, max_pending: Optional[int] = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session: Session = requests.Session()
+        pooled = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', pooled)
+        self.session.mount('http://', pooled)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers, thread_name_prefix='discord-webhook')
+        self._pending: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_pending) if max_pending is not None else None
+        )
+        # webhook -> sends waiting for the one in flight, present while a send is in flight
+        self._queues: Dict[Any, Deque[Tuple[Future[Any], Callable[..., Any], Any, Any]]] = {}
+        self._queues_lock: threading.Lock = threading.Lock()
+
+    def __enter__(self) -> SyncWebhookSender:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def partial(self, id: int, token: str, *, bot_token: Optional[str] = None) -> SyncWebhook:
+        """Creates a partial :class:`SyncWebhook` that uses the pooled session.
+
+        See :meth:`SyncWebhook.partial` for the parameters.
+        """
+        return SyncWebhook.partial(id, token, session=self.session, bot_token=bot_token)
+
+    def from_url(self, url: str, *, bot_token: Optional[str] = None) -> SyncWebhook:
+        """Creates a partial :class:`SyncWebhook` from a webhook URL that uses the pooled session.
+
+        See :meth:`SyncWebhook.from_url` for the parameters.
+        """
+        return SyncWebhook.from_url(url, session=self.session, bot_token=bot_token)
+
+    def submit(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        r"""Calls a function, such as a method of a :class:`SyncWebhook`, in the background.
+
+        Unlike :meth:`send`, calls are not ordered and run as soon as a thread
+        is free.
+
+        Parameters
+        ------------
+        func
+            The function to call.
+        \*args
+            The positional arguments to call the function with.
+        \*\*kwargs
+            The keyword arguments to call the function with.
+
+        Returns
+        --------
+        :class:`concurrent.futures.Future`
+            A future that is resolved with the result of the call.
+        """
+        pending = self._pending
+        if pending is None:
+            return self._executor.submit(func, *args, **kwargs)
+
+        pending.acquire()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            pending.release()
+            raise
+        future.add_done_callback(lambda _: pending.release())
+        return future
+
+    def send(self, webhook: SyncWebhook, /, *args: Any, **kwargs: Any) -> Future[Optional[SyncWebhookMessage]]:
+        """Sends a message using the webhook in the background.
+
+        This takes the same parameters as :meth:`SyncWebhook.send`.
+
+        Parameters
+        ------------
+        webhook: :class:`SyncWebhook`
+            The webhook to send the message with.
+
+        Returns
+        --------
+        :class:`concurrent.futures.Future`
+            A future that is resolved with the result of :meth:`SyncWebhook.send`.
+        """
+        future: Future[Optional[SyncWebhookMessage]] = Future()
+        pending = self._pending
+        if pending is not None:
+            pending.acquire()
+            future.add_done_callback(lambda _: pending.release())
+
+        key = (webhook.id, webhook.token)
+        with self._queues_lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((future, webhook.send, args, kwargs))
+                return future
+            self._queues[key] = deque()
+
+        try:
+            self._executor.submit(self._send_in_order, key, future, webhook.send, args, kwargs)
+        except BaseException as exc:
+            with self._queues_lock:
+                queue = self._queues.pop(key)
+            future.set_exception(exc)
+            for waiter, *_ in queue:
+                waiter.set_exception(exc)
+            raise
+        return future
+
+    def _send_in_order(
+        self, key: Any, future: Future[Any], func: Callable[..., Any], args: Any, kwargs: Any
+    ) -> None:
+        # runs the sends of a single webhook one after the other in one thread
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+
+            with self._queues_lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                future, func, args, kwargs = queue.popleft()
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stops the background threads and closes the session.
+
+        Parameters
+        ------------
+        wait: :class:`bool`
+            Whether to wait for every pending request to be sent first.
+        """
+        self._executor.shutdown(wait=wait)
+        self.session.close()
@@ -163,6 +163,7 @@ html_context = {
   'discord_extensions': [
     ('discord.ext.commands', 'ext/commands'),
     ('discord.ext.tasks', 'ext/tasks'),
+    ('discord.ext.offload', 'ext/offload'),
   ],
 }
 
@@ -52,6 +52,7 @@ packages = [
     'discord.webhook',
     'discord.ext.commands',
     'discord.ext.tasks',
+    'discord.ext.offload',
     'discord.ext.app_commands',
 ]
 
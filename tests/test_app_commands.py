@@ -0,0 +1,351 @@
+import asyncio
+import json
+import types
+
+import pytest
+
+from discord.application_commands import Choice, Option, Subcommand
+from discord.enums import ApplicationCommandOptionType, InteractionResponseType
+from discord.ext import app_commands
+from discord.ext.app_commands import autocomplete
+from discord.ext.app_commands.autocomplete import AutocompleteIndex
+from discord.ext.app_commands.converter import OptionPlan
+from discord.ext.app_commands.cooldown import BucketType, Cooldown, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
+from discord.ext.app_commands.errors import MaxConcurrencyReached
+from discord.interactions import Interaction, InteractionResponse
+
+
+def _context(resolved=None):
+    return types.SimpleNamespace(_data={'resolved': resolved or {}})
+
+
+def test_option_plan_passes_plain_values_through():
+    plan = OptionPlan([Option('text', 'd', ApplicationCommandOptionType.string)])
+    args = plan.convert(_context(), [{'name': 'text', 'type': 3, 'value': 'hello'}])
+    assert args == {'text': 'hello'}
+
+
+def test_option_plan_unresolved_ids_are_ints():
+    plan = OptionPlan([Option('role', 'd', ApplicationCommandOptionType.role)])
+    args = plan.convert(_context(), [{'name': 'role', 'type': 8, 'value': '42'}])
+    assert args == {'role': 42}
+
+
+def test_option_plan_is_keyed_by_subcommand():
+    plan = OptionPlan(
+        [
+            Subcommand('a', 'd', options=[Option('x', 'd', ApplicationCommandOptionType.string)]),
+            Subcommand('b', 'd', options=[Option('x', 'd', ApplicationCommandOptionType.role)]),
+        ]
+    )
+    ctx = _context()
+    a = plan.convert(ctx, [{'type': 1, 'name': 'a', 'options': [{'name': 'x', 'type': 3, 'value': 'text'}]}])
+    b = plan.convert(ctx, [{'type': 1, 'name': 'b', 'options': [{'name': 'x', 'type': 8, 'value': '5'}]}])
+    assert a == {'x': 'text'}
+    assert b == {'x': 5}
+
+
+class _FakeCommandHTTP:
+    def __init__(self):
+        self.remote = {}
+        self.calls = []
+
+    async def get_global_commands(self, application_id):
+        self.calls.append(('get', None))
+        return self.remote.get(None, [])
+
+    async def get_guild_commands(self, application_id, guild_id):
+        self.calls.append(('get', guild_id))
+        return self.remote.get(guild_id, [])
+
+    def _store(self, guild_id, payload):
+        data = json.loads(json.dumps(payload))
+        for index, command in enumerate(data):
+            command['id'] = str(1000 + index)
+            command['application_id'] = '5'
+        self.remote[guild_id] = data
+        return data
+
+    async def bulk_upsert_global_commands(self, application_id, payload):
+        self.calls.append(('put', None))
+        return self._store(None, payload)
+
+    async def bulk_upsert_guild_commands(self, application_id, guild_id, payload):
+        self.calls.append(('put', guild_id))
+        return self._store(guild_id, payload)
+
+    async def bulk_edit_guild_application_command_permissions(self, application_id, guild_id, payload):
+        self.calls.append(('permissions', guild_id))
+
+
+def _sync_bot():
+    bot = app_commands.Bot()
+    bot.http = _FakeCommandHTTP()
+    bot._connection.application_id = 5
+
+    @app_commands.slash_command(name='ping', description='d')
+    async def ping(ctx):
+        pass
+
+    @app_commands.slash_command(name='tag', description='d', guild_ids=[1])
+    async def tag(ctx):
+        pass
+
+    bot.add_command(ping)
+    bot.add_command(tag)
+    return bot
+
+
+def test_sync_skips_unchanged_scopes(tmp_path):
+    cache_file = str(tmp_path / 'commands.json')
+
+    async def run():
+        bot = _sync_bot()
+        await bot.sync_commands(cache_file=cache_file)
+        first = sorted(bot.http.calls, key=repr)
+        bot.http.calls.clear()
+        await bot.sync_commands(cache_file=cache_file)
+        cached = list(bot.http.calls)
+        bot.http.calls.clear()
+        await bot.sync_commands()
+        remote = sorted(bot.http.calls, key=repr)
+        return first, cached, remote
+
+    first, cached, remote = asyncio.run(run())
+    assert ('put', None) in first and ('put', 1) in first
+    # the cache file matches, nothing is requested
+    assert cached == []
+    # without a cache file the remote commands are compared instead
+    assert ('put', None) not in remote and ('put', 1) not in remote
+
+
+def test_sync_force_overwrites():
+    async def run():
+        bot = _sync_bot()
+        await bot.sync_commands()
+        bot.http.calls.clear()
+        await bot.sync_commands(force=True)
+        return bot.http.calls
+
+    calls = asyncio.run(run())
+    assert ('put', None) in calls and ('put', 1) in calls
+    assert ('get', None) not in calls
+
+
+def test_cooldown_mapping_buckets_and_expiry():
+    mapping = CooldownMapping(Cooldown(1, 10), lambda key: key)
+    now = 1000.0
+    assert mapping.update_rate_limit(1, now) is None
+    assert mapping.update_rate_limit(1, now + 1) == pytest.approx(9)
+    # separate keys are separate buckets
+    assert mapping.update_rate_limit(2, now + 1) is None
+
+    # expired buckets are dropped on the next lookup
+    mapping.get_bucket(3, now + 20)
+    assert 1 not in mapping._cache and 2 not in mapping._cache
+
+
+def test_bucket_type_keys():
+    interaction = types.SimpleNamespace(user=types.SimpleNamespace(id=4), guild_id=None, channel_id=7)
+    ctx = types.SimpleNamespace(interaction=interaction)
+    assert BucketType.user.get_key(ctx) == 4
+    # outside of guilds the user stands in for the guild
+    assert BucketType.guild.get_key(ctx) == 4
+    assert BucketType.channel.get_key(ctx) == 7
+    assert BucketType.member.get_key(ctx) == (None, 4)
+
+
+def test_max_concurrency():
+    concurrency = MaxConcurrency(1, per=BucketType.user, wait=False)
+    first = types.SimpleNamespace(interaction=types.SimpleNamespace(user=types.SimpleNamespace(id=1)))
+    other = types.SimpleNamespace(interaction=types.SimpleNamespace(user=types.SimpleNamespace(id=2)))
+
+    async def run():
+        await concurrency.acquire(first)
+        with pytest.raises(MaxConcurrencyReached):
+            await concurrency.acquire(first)
+        await concurrency.acquire(other)
+        await concurrency.release(first)
+        await concurrency.acquire(first)
+        await concurrency.release(first)
+        await concurrency.release(other)
+
+    asyncio.run(run())
+    assert concurrency._mapping == {}
+
+
+def test_autocomplete_index_prefix_search():
+    index = AutocompleteIndex(['New York', 'Newark', 'York', 'Amsterdam', Choice('Berlin', 'BER')])
+    assert [c.name for c in index.search('new')] == ['New York', 'Newark']
+    # later words match as well, after the names starting with the query
+    assert [c.name for c in index.search('YORK')] == ['York', 'New York']
+    assert [c.value for c in index.search('ber')] == ['BER']
+    assert index.search('paris') == []
+    # an empty query lists the candidates alphabetically
+    assert [c.name for c in index.search('')] == ['Amsterdam', 'Berlin', 'New York', 'Newark', 'York']
+
+    index.remove('Newark')
+    assert [c.name for c in index.search('new')] == ['New York']
+    assert len(index) == 4
+
+
+def test_autocomplete_index_limit():
+    index = AutocompleteIndex(f'item {i:03}' for i in range(100))
+    assert len(index.search('')) == 25
+    assert len(index.search('item', limit=10)) == 10
+    assert [c.name for c in index.search('item 01')] == [f'item {i:03}' for i in range(10, 20)]
+
+
+def test_autocomplete_cache_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(autocomplete.time, 'monotonic', lambda: now[0])
+    cache = autocomplete._AutocompleteCache(max_size=2)
+    choices = [Choice('a', 'a')]
+    cache.set('a', choices, 5)
+    assert cache.get('a') is choices
+    now[0] += 6
+    assert cache.get('a') is None
+
+    cache.set('a', [], 5)
+    cache.set('b', [], 5)
+    cache.set('c', [], 5)
+    assert cache.get('a') is None and cache.get('c') == []
+
+
+def _autocomplete_interaction(bot, id, value, other):
+    data = {
+        'id': str(id),
+        'application_id': '2',
+        'type': 4,
+        'token': 'token',
+        'version': 1,
+        'channel_id': '3',
+        'user': {'id': '4', 'username': 'user', 'discriminator': '0001', 'avatar': None},
+        'data': {
+            'id': '5',
+            'name': 'city',
+            'type': 1,
+            'options': [
+                {'name': 'name', 'type': 3, 'value': value, 'focused': True},
+                {'name': 'other', 'type': 3, 'value': other},
+            ],
+        },
+    }
+    interaction = Interaction(data=data, state=bot._connection)
+    interaction._response_future = future = bot.loop.create_future()
+    return interaction, future
+
+
+def test_autocomplete_response_payload():
+    calls = []
+
+    async def run():
+        bot = app_commands.Bot()
+        options = [
+            Option('name', 'd', ApplicationCommandOptionType.string),
+            Option('other', 'd', ApplicationCommandOptionType.string),
+        ]
+
+        @app_commands.slash_command(name='city', description='d', options=options)
+        async def city(ctx, name, other):
+            pass
+
+        @city.autocomplete('name', cache_ttl=60)
+        async def complete(ctx, value):
+            calls.append((value, ctx.args['other']))
+            return [f'{value} {i}' for i in range(30)]
+
+        bot.add_command(city)
+        payloads = []
+        for id, other in enumerate(('x', 'x', 'y'), 10):
+            interaction, future = _autocomplete_interaction(bot, id, 'a', other)
+            await bot.on_interaction(interaction)
+            payloads.append(future.result())
+        return payloads
+
+    first, cached, other = asyncio.run(run())
+    assert first['type'] == InteractionResponseType.autocomplete_result.value
+    choices = first['data']['choices']
+    assert len(choices) == 25
+    assert choices[0] == {'name': 'a 0', 'value': 'a 0'}
+    assert cached == first
+    # a different value for another option is not answered from the cache
+    assert calls == [('a', 'x'), ('a', 'y')]
+    assert other['data']['choices'][0] == {'name': 'a 0', 'value': 'a 0'}
+
+
+def _run_slash_command(monkeypatch, callback, auto_defer):
+    responses = []
+
+    async def create_response(self, type, data=None):
+        await asyncio.sleep(0.02)
+        responses.append(type)
+
+    monkeypatch.setattr(InteractionResponse, '_create_response', create_response)
+
+    async def run():
+        bot = app_commands.Bot(auto_defer=auto_defer)
+        bot.add_command(app_commands.slash_command(name='slow', description='d')(callback))
+        data = {
+            'id': '10',
+            'application_id': '2',
+            'type': 2,
+            'token': 'token',
+            'version': 1,
+            'channel_id': '3',
+            'user': {'id': '4', 'username': 'user', 'discriminator': '0001', 'avatar': None},
+            'data': {'id': '5', 'name': 'slow', 'type': 1},
+        }
+        await bot.on_interaction(Interaction(data=data, state=bot._connection))
+        await asyncio.sleep(0.1)
+        return bot
+
+    bot = asyncio.run(run())
+    assert not bot._deferral_tasks
+    return responses
+
+
+def test_watchdog_defers_slow_handlers(monkeypatch):
+    contexts = []
+
+    async def slow(ctx):
+        contexts.append(ctx)
+        await asyncio.sleep(0.1)
+
+    assert _run_slash_command(monkeypatch, slow, 0.01) == [InteractionResponseType.deferred_channel_message.value]
+    assert contexts[0].auto_deferred
+
+
+def test_watchdog_skips_handlers_that_respond(monkeypatch):
+    async def fast(ctx):
+        await ctx.send('done')
+        await asyncio.sleep(0.05)
+
+    assert _run_slash_command(monkeypatch, fast, 0.03) == [InteractionResponseType.channel_message.value]
+
+
+def test_watchdog_waits_for_a_response_in_progress(monkeypatch):
+    # the watchdog fires while the handler's response is still being sent
+    async def responding(ctx):
+        await ctx.send('done')
+
+    assert _run_slash_command(monkeypatch, responding, 0.01) == [InteractionResponseType.channel_message.value]
+
+
+def test_dynamic_cooldown_default_bucket():
+    invocations = []
+
+    def factory(ctx):
+        invocations.append(ctx)
+        return None if ctx == 'exempt' else Cooldown(1, 10)
+
+    mapping = DynamicCooldownMapping(factory, BucketType.default)
+    now = 1000.0
+    assert mapping.update_rate_limit('ctx', now) is None
+    # every invocation shares the one bucket
+    assert mapping.update_rate_limit('other', now + 1) == pytest.approx(9)
+    assert mapping.get_bucket('exempt', now + 1) is not None
+    assert len(invocations) == 1
+
+    mapping._cache.clear()
+    assert mapping.get_bucket('exempt', now + 2) is None
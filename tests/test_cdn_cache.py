@@ -0,0 +1,118 @@
+import asyncio
+import os
+
+from discord.http import CDNCache, HTTPClient
+
+
+class _FakeContent:
+    def __init__(self, body):
+        self.body = body
+
+    async def iter_chunked(self, size):
+        for index in range(0, len(self.body), size):
+            yield self.body[index : index + size]
+
+
+class _FakeResponse:
+    def __init__(self, status, body=b'', headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content = _FakeContent(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class _FakeCDN:
+    def __init__(self):
+        self.assets = {}
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers))
+        body = self.assets.get(url)
+        if body is None:
+            return _FakeResponse(404)
+        etag = f'"{len(body)}"'
+        if headers and headers.get('If-None-Match') == etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, body, {'ETag': etag})
+
+
+def _run(directory, test, max_size=100, revalidate_after=60.0):
+    async def run():
+        http = HTTPClient(loop=asyncio.get_running_loop(), cdn_cache=CDNCache(directory, max_size, revalidate_after))
+        cdn = _FakeCDN()
+        http._HTTPClient__session = cdn
+        return await test(http, cdn)
+
+    return asyncio.run(run())
+
+
+def test_cdn_cache_hits_and_misses(tmp_path):
+    async def test(http, cdn):
+        cdn.assets['a'] = b'x' * 30
+        first = await http.get_from_cdn('a')
+        second = await http.get_from_cdn('a')
+        return first, second, cdn.requests
+
+    first, second, requests = _run(tmp_path, test)
+    assert first == second == b'x' * 30
+    # the second read is served from disk
+    assert requests == [('a', {})]
+
+    # a new cache reads the index of the directory on first use
+    async def reopened(http, cdn):
+        return await http.get_from_cdn('a'), cdn.requests
+
+    data, requests = _run(tmp_path, reopened)
+    assert data == b'x' * 30
+    assert requests == []
+
+
+def test_cdn_cache_revalidates_stale_entries(tmp_path):
+    async def test(http, cdn):
+        cdn.assets['a'] = b'abc'
+        await http.get_from_cdn('a')
+        data = await http.get_from_cdn('a')
+        return data, cdn.requests
+
+    data, requests = _run(tmp_path, test, revalidate_after=0)
+    assert data == b'abc'
+    assert requests == [('a', {}), ('a', {'If-None-Match': '"3"'})]
+
+
+def test_cdn_cache_evicts_least_recently_used(tmp_path):
+    async def test(http, cdn):
+        for url in ('a', 'b', 'c'):
+            cdn.assets[url] = url.encode() * 40
+        await http.get_from_cdn('a')
+        await http.get_from_cdn('b')
+        # using a makes b the least recently used
+        await http.get_from_cdn('a')
+        await http.get_from_cdn('c')
+        cdn.requests.clear()
+        await http.get_from_cdn('a')
+        await http.get_from_cdn('b')
+        return http.cdn_cache, [url for url, _ in cdn.requests]
+
+    cache, fetched = _run(tmp_path, test)
+    assert fetched == ['b']
+    assert cache.size <= cache.max_size
+    names = [os.path.basename(cache._path(url)) for url in cache._entries]
+    assert sorted(os.listdir(tmp_path)) == sorted(names + [f'{name}.json' for name in names])
+
+
+def test_cdn_cache_skips_assets_larger_than_the_cache(tmp_path):
+    async def test(http, cdn):
+        cdn.assets['big'] = b'x' * 200
+        data = await http.get_from_cdn('big')
+        return data, http.cdn_cache
+
+    data, cache = _run(tmp_path, test)
+    assert len(data) == 200
+    assert cache.size == 0
+    assert os.listdir(tmp_path) == []
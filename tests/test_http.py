@@ -0,0 +1,137 @@
+import asyncio
+import types
+
+import pytest
+
+from discord.enums import InteractionResponseType, RequestPriority
+from discord.http import HTTPClient, ResponseCache, Route
+from discord.utils import MISSING
+from discord.webhook.async_ import AsyncWebhookAdapter, Webhook
+
+
+def _client(delay=0.05):
+    http = HTTPClient(loop=asyncio.get_running_loop())
+    http.sent = []
+
+    async def request(route, **kwargs):
+        http.sent.append(route.url)
+        await asyncio.sleep(delay)
+        return {'count': len(http.sent)}
+
+    http._traced_request = request
+    return http
+
+
+def test_coalesced_requests_share_one_request():
+    async def run():
+        http = _client()
+        route = Route('GET', '/users/{user_id}', user_id=1)
+        results = await asyncio.gather(*(http._coalesced_request(route) for _ in range(3)))
+        return http, results
+
+    http, results = asyncio.run(run())
+    assert len(http.sent) == 1
+    assert results == [{'count': 1}] * 3
+    # every caller gets its own copy
+    assert results[0] is not results[1]
+    assert http._inflight == {}
+
+
+def test_coalesced_followers_survive_cancelled_leader():
+    async def run():
+        http = _client()
+        route = Route('GET', '/users/{user_id}', user_id=1)
+        leader = asyncio.ensure_future(http._coalesced_request(route))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(http._coalesced_request(route)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return http, await asyncio.gather(*followers)
+
+    http, results = asyncio.run(run())
+    # one of the followers sent the request again for the others
+    assert len(http.sent) == 2
+    assert results == [{'count': 2}] * 2
+
+
+def test_coalescing_separates_credentials():
+    async def run():
+        http = _client()
+        route = Route('GET', '/webhooks/{webhook_id}', webhook_id=1)
+        await asyncio.gather(
+            http._coalesced_request(route, auth_token='a'),
+            http._coalesced_request(route, auth_token='b'),
+        )
+        return http
+
+    assert len(asyncio.run(run()).sent) == 2
+
+
+def test_response_cache_concurrent_fetches():
+    cache = ResponseCache(ttl=60, max_size=10)
+    first = cache.begin('url')
+    second = cache.begin('url')
+    cache.finish('url', first, 1)
+    assert cache.get('url') == 1
+    cache.finish('url', second, 2)
+    assert cache.get('url') == 2
+
+
+def test_response_cache_invalidated_while_fetching():
+    cache = ResponseCache(ttl=60, max_size=10)
+    token = cache.begin('url')
+    cache.invalidate('url')
+    cache.finish('url', token, 1)
+    assert cache.get('url') is MISSING
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(ttl=60, max_size=2)
+    for url in ('a', 'b', 'c'):
+        cache.finish(url, cache.begin(url), url)
+    assert cache.get('a') is MISSING
+    assert cache.get('c') == 'c'
+
+
+def _bound_webhook(http, type):
+    state = types.SimpleNamespace(http=http, allowed_mentions=None, _get_guild=lambda guild_id: None)
+    return Webhook.from_state({'id': 1, 'type': type, 'token': 'token'}, state)
+
+
+def test_interaction_requests_use_interaction_priority():
+    class _Sent(Exception):
+        pass
+
+    async def run():
+        http = HTTPClient(loop=asyncio.get_running_loop())
+        http._create_session()
+        priorities = []
+
+        async def request(route, **kwargs):
+            priorities.append((route.path, kwargs['priority']))
+            raise _Sent()
+
+        http._traced_request = request
+        followup = _bound_webhook(http, 3)
+        requests = (
+            AsyncWebhookAdapter().create_interaction_response(
+                1, 'token', session=followup.session, type=InteractionResponseType.deferred_channel_message.value
+            ),
+            followup.send('followup'),
+            followup.delete_message(2),
+            _bound_webhook(http, 1).send('incoming'),
+        )
+        try:
+            for coro in requests:
+                with pytest.raises(_Sent):
+                    await coro
+        finally:
+            await http.close()
+        return priorities
+
+    assert asyncio.run(run()) == [
+        ('/interactions/{webhook_id}/{webhook_token}/callback', RequestPriority.interaction),
+        ('/webhooks/{webhook_id}/{webhook_token}', RequestPriority.interaction),
+        ('/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}', RequestPriority.interaction),
+        ('/webhooks/{webhook_id}/{webhook_token}', RequestPriority.normal),
+    ]
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+import discord
+from discord.interaction_server import InteractionServer
+
+nacl_signing = pytest.importorskip('nacl.signing')
+
+USER = {'id': '4', 'username': 'user', 'discriminator': '0001', 'avatar': None}
+
+
+def _interaction(type=2):
+    return {
+        'id': '1',
+        'application_id': '2',
+        'type': type,
+        'token': 'token',
+        'version': 1,
+        'channel_id': '3',
+        'user': USER,
+        'data': {'id': '5', 'name': 'ping', 'type': 1},
+    }
+
+
+def _signed(key, payload, timestamp='1600000000'):
+    body = json.dumps(payload).encode()
+    signature = key.sign(timestamp.encode() + body).signature.hex()
+    return body, {'X-Signature-Ed25519': signature, 'X-Signature-Timestamp': timestamp}
+
+
+def _serve(handler, test, response_timeout=0.1):
+    key = nacl_signing.SigningKey.generate()
+
+    async def run():
+        client = discord.Client()
+        if handler is not None:
+            client.event(handler)
+        server = InteractionServer(client, key.verify_key.encode().hex(), response_timeout=response_timeout)
+        async with TestClient(TestServer(server.app)) as http:
+            return await test(http, key)
+
+    return asyncio.run(run())
+
+
+async def _post(http, body, headers):
+    response = await http.post('/interactions', data=body, headers=headers)
+    return response.status, await response.text()
+
+
+def test_rejects_bad_signatures():
+    async def test(http, key):
+        body, headers = _signed(key, {'type': 1})
+        other, _ = _signed(nacl_signing.SigningKey.generate(), {'type': 1})
+        missing = await _post(http, body, {})
+        tampered = await _post(http, body.replace(b'1', b'2'), headers)
+        foreign = await _post(http, body, {**headers, 'X-Signature-Ed25519': '00' * 64})
+        garbage = await _post(http, body, {**headers, 'X-Signature-Ed25519': 'not hex'})
+        return [status for status, _ in (missing, tampered, foreign, garbage)]
+
+    assert _serve(None, test) == [401, 401, 401, 401]
+
+
+def test_ping_is_answered_with_pong():
+    async def test(http, key):
+        return await _post(http, *_signed(key, {'type': 1}))
+
+    status, text = _serve(None, test)
+    assert status == 200
+    assert json.loads(text) == {'type': 1}
+
+
+def test_response_is_returned_in_the_reply():
+    async def on_interaction(interaction):
+        await interaction.response.send_message('pong')
+
+    async def test(http, key):
+        return await _post(http, *_signed(key, _interaction()))
+
+    status, text = _serve(on_interaction, test)
+    assert status == 200
+    payload = json.loads(text)
+    assert payload['type'] == 4
+    assert payload['data']['content'] == 'pong'
+
+
+def test_slow_handlers_are_deferred():
+    responded = []
+
+    async def on_interaction(interaction):
+        await asyncio.sleep(0.3)
+        responded.append(interaction.response.is_done())
+
+    async def test(http, key):
+        result = await _post(http, *_signed(key, _interaction()))
+        await asyncio.sleep(0.3)
+        return result
+
+    status, text = _serve(on_interaction, test)
+    assert status == 200
+    assert json.loads(text) == {'type': 5}
+    # the handler sees the deferral and continues with follow-ups
+    assert responded == [True]
@@ -0,0 +1,118 @@
+import asyncio
+import datetime
+import json
+import types
+from urllib.parse import parse_qs, urlparse
+
+from discord.http import HTTPClient
+from discord.iterators import HistoryScanIterator
+from discord.object import Object
+from discord.utils import time_snowflake
+
+START = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, body):
+        self.body = body
+        self.headers = {'content-type': 'application/json'}
+
+    async def text(self, encoding='utf-8'):
+        return self.body
+
+
+class _FakeSession:
+    def __init__(self, ids):
+        self.ids = ids
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+
+    def request(self, method, url, **kwargs):
+        return self._respond(kwargs['params'])
+
+    async def _fetch(self, params):
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            after = int(params['after'])
+            page = [i for i in self.ids if i > after][: params['limit']]
+            return json.dumps([{'id': str(i)} for i in reversed(page)])
+        finally:
+            self.active -= 1
+
+    def _respond(self, params):
+        session = self
+
+        class _Context:
+            async def __aenter__(self):
+                return _FakeResponse(await session._fetch(params))
+
+            async def __aexit__(self, *args):
+                pass
+
+        return _Context()
+
+
+def _messageable(http):
+    channel = Object(id=time_snowflake(START))
+    state = types.SimpleNamespace(http=http, create_message=lambda channel, data: int(data['id']))
+
+    async def _get_channel():
+        return channel
+
+    return types.SimpleNamespace(_state=state, _get_channel=_get_channel)
+
+
+def _ids(count):
+    return [time_snowflake(START + datetime.timedelta(minutes=i)) for i in range(1, count + 1)]
+
+
+def test_history_scan_requests_share_the_bucket():
+    ids = _ids(450)
+
+    async def run():
+        http = HTTPClient(loop=asyncio.get_running_loop())
+        session = _FakeSession(ids)
+        http._HTTPClient__session = session
+        before = Object(id=ids[-1] + 1)
+        scan = HistoryScanIterator(_messageable(http), before=before, partitions=4)
+        return session, [message async for message in scan]
+
+    session, messages = asyncio.run(run())
+    assert messages == ids
+    # the ranges are paginated separately, but their requests never overlap
+    assert session.requests > 1
+    assert session.max_active == 1
+
+
+def test_history_scan_fetches_while_the_consumer_is_busy():
+    ids = _ids(1000)
+
+    async def run():
+        pages = []
+
+        async def logs_from(channel_id, limit, after):
+            pages.append(after)
+            await asyncio.sleep(0.001)
+            page = [i for i in ids if i > after][:limit]
+            return [{'id': str(i)} for i in reversed(page)]
+
+        http = types.SimpleNamespace(logs_from=logs_from)
+        before = Object(id=ids[-1] + 1)
+        scan = HistoryScanIterator(_messageable(http), before=before, partitions=4, ordered=False)
+        first = await scan.next()
+        # the consumer is busy with the first message, the ranges keep fetching
+        fetched = len(pages)
+        await asyncio.sleep(0.01)
+        ahead = len(pages)
+        scan.close()
+        return first, fetched, ahead
+
+    first, fetched, ahead = asyncio.run(run())
+    assert first in ids
+    assert ahead > fetched
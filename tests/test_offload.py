@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from discord.ext import app_commands
+from discord.ext.offload import CommandExecutor, offload
+from discord.interactions import Interaction, InteractionResponse
+
+
+def _context(bot):
+    data = {
+        'id': '10',
+        'application_id': '2',
+        'type': 2,
+        'token': 'token',
+        'version': 1,
+        'channel_id': '3',
+        'user': {'id': '4', 'username': 'user', 'discriminator': '0001', 'avatar': None},
+        'data': {'id': '5', 'name': 'render', 'type': 1},
+    }
+    return app_commands.Context(bot, Interaction(data=data, state=bot._connection))
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    sent = []
+
+    async def create_response(self, type, data=None):
+        sent.append(data['content'])
+
+    monkeypatch.setattr(InteractionResponse, '_create_response', create_response)
+    return sent
+
+
+def _invoke(callback, *args):
+    async def run():
+        ctx = _context(app_commands.Bot())
+        await callback(*args, ctx, text='text')
+
+    asyncio.run(run())
+
+
+def test_offload_runs_in_the_executor(responses):
+    executor = CommandExecutor(1)
+
+    @offload(executor)
+    def render(ctx, text):
+        return f'{text} {threading.get_ident()}'
+
+    try:
+        _invoke(render)
+    finally:
+        executor.close()
+
+    text, thread = responses[0].split()
+    assert text == 'text'
+    assert int(thread) != threading.get_ident()
+    assert executor.metrics.completed == 1
+
+
+def test_offload_cog_methods(responses):
+    class Renderer(app_commands.Cog):
+        # attributes named like context methods don't confuse the decorator
+        send = None
+
+        @offload()
+        def render(self, ctx, text):
+            assert isinstance(self, Renderer)
+            assert isinstance(ctx, app_commands.Context)
+            return text.upper()
+
+    _invoke(Renderer.render, Renderer())
+    assert responses == ['TEXT']
+
+
+def test_offload_rejects_coroutines():
+    with pytest.raises(TypeError):
+
+        @offload()
+        async def render(ctx):
+            pass
@@ -0,0 +1,57 @@
+import asyncio
+
+import discord
+
+USER = {'id': '4', 'username': 'bot', 'discriminator': '0001', 'avatar': None, 'bot': True}
+
+
+def test_stateless_client_dispatches_raw_payloads():
+    received = []
+    message = {'id': '10', 'channel_id': '3', 'content': 'hello', 'author': USER}
+    deleted = {'id': '10', 'channel_id': '3'}
+    guild = {'id': '1', 'unavailable': True}
+
+    async def run():
+        client = discord.Client(stateless=True)
+
+        def record(name):
+            async def listener(*args):
+                received.append((name, args))
+
+            return listener
+
+        for name in (
+            'on_gateway_ready',
+            'on_ready',
+            'on_gateway_message_create',
+            'on_message',
+            'on_gateway_message_delete',
+            'on_raw_message_delete',
+            'on_gateway_guild_create',
+            'on_guild_join',
+        ):
+            setattr(client, name, record(name))
+
+        parsers = client._connection.parsers
+        parsers['READY']({'v': 9, 'user': USER, 'guilds': [guild], 'session_id': 'session'})
+        parsers['MESSAGE_CREATE'](message)
+        parsers['MESSAGE_DELETE'](deleted)
+        parsers['GUILD_CREATE'](guild)
+        await asyncio.sleep(0)
+        return client
+
+    client = asyncio.run(run())
+    names = [name for name, _ in received]
+    assert names == [
+        'on_gateway_ready',
+        'on_ready',
+        'on_gateway_message_create',
+        'on_gateway_message_delete',
+        'on_gateway_guild_create',
+    ]
+    # the payloads are passed through as they are
+    assert received[2][1][0] is message
+    assert received[3][1][0] is deleted
+    assert client.user.id == 4
+    assert client.guilds == []
+    assert len(client.cached_messages) == 0
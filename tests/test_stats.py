@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import discord
+from discord.stats import EventStats
+
+
+def test_max_block_time_of_synchronous_parsers():
+    stats = EventStats()
+    stats._record_parse('TYPING_START', lambda data: time.sleep(0.01), {}, 10, time.perf_counter())
+    event = stats.get('TYPING_START')
+    assert event.max_block_time == event.max_parse_time >= 0.01
+
+
+def test_max_block_time_is_the_longest_step():
+    async def parse():
+        time.sleep(0.01)
+        await asyncio.sleep(0.05)
+        time.sleep(0.03)
+        await asyncio.sleep(0)
+        time.sleep(0.01)
+
+    stats = EventStats()
+
+    async def run():
+        await stats._record_parse('GUILD_CREATE', lambda data: parse(), {}, 10, time.perf_counter())
+
+    asyncio.run(run())
+    event = stats.get('GUILD_CREATE')
+    assert 0.03 <= event.max_block_time < 0.045
+    # the time spent suspended is not counted
+    assert 0.05 <= event.parse_time < 0.09
+    assert event.to_dict()['max_block_time'] == event.max_block_time
+
+
+def test_incremental_guild_create_reports_its_slices():
+    members = [
+        {'user': {'id': str(i), 'username': f'user{i}', 'discriminator': '0001', 'avatar': None}, 'roles': []}
+        for i in range(1, 501)
+    ]
+    data = {'id': '1', 'name': 'guild', 'member_count': len(members), 'members': members, 'roles': [], 'channels': []}
+
+    async def run():
+        client = discord.Client(intents=discord.Intents.all(), enable_event_stats=True, guild_create_slice_size=50)
+        state = client._connection
+        await client.event_stats._record_parse('GUILD_CREATE', state.parse_guild_create, data, 10, time.perf_counter())
+        return client
+
+    client = asyncio.run(run())
+    assert len(client.get_guild(1).members) == 500
+    event = client.event_stats.get('GUILD_CREATE')
+    assert 0 < event.max_block_time < event.parse_time
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from discord.embeds import Embed
+from discord.utils import MISSING
+from discord.webhook.pool import WebhookPool
+
+
+class _FakeWebhook:
+    def __init__(self, id, sent):
+        self.id = id
+        self.sent = sent
+
+    async def send(self, content=MISSING, *, embeds=MISSING, username=MISSING, avatar_url=MISSING):
+        await asyncio.sleep(0.01)
+        self.sent.append(
+            (
+                None if content is MISSING else content,
+                0 if embeds is MISSING else len(embeds),
+                None if username is MISSING else username,
+            )
+        )
+
+
+def test_pool_merges_embeds():
+    sent = []
+
+    async def run():
+        pool = WebhookPool([_FakeWebhook(1, sent)], flush_interval=0.05)
+        for index in range(25):
+            await pool.send(embed=Embed(title=str(index)))
+        await pool.close()
+
+    asyncio.run(run())
+    assert sum(embeds for _, embeds, _ in sent) == 25
+    assert all(embeds <= 10 for _, embeds, _ in sent)
+    assert len(sent) == 3
+
+
+def test_pool_keeps_content_apart_by_default():
+    sent = []
+
+    async def run():
+        pool = WebhookPool([_FakeWebhook(1, sent)], flush_interval=0.05)
+        await pool.send('a')
+        await pool.send('b')
+        await pool.close()
+
+    asyncio.run(run())
+    assert sorted(content for content, _, _ in sent) == ['a', 'b']
+
+
+def test_pool_merges_content_when_enabled():
+    sent = []
+
+    async def run():
+        pool = WebhookPool([_FakeWebhook(1, sent)], flush_interval=0.05, merge_content=True)
+        await pool.send('a', username='x')
+        await pool.send('b', username='x')
+        await pool.send('c', username='y')
+        await pool.close()
+
+    asyncio.run(run())
+    assert sent == [('a\nb', 0, 'x'), ('c', 0, 'y')]
+
+
+def test_pool_can_be_created_outside_of_a_loop():
+    sent = []
+    pool = WebhookPool([_FakeWebhook(1, sent), _FakeWebhook(2, sent)], flush_interval=0)
+    assert pool.queued == 0
+
+    async def run():
+        await pool.send(embed=Embed(title='a'))
+        await pool.close()
+
+    asyncio.run(run())
+    assert sent == [(None, 1, None)]
+
+
+def test_pool_rejects_empty_messages():
+    pool = WebhookPool([_FakeWebhook(1, [])])
+    with pytest.raises(Exception):
+        asyncio.run(pool.send())